@@ -0,0 +1,74 @@
+"""
+Circuit memory and allocation benchmark.
+
+Builds generated circuits of 10^5 and 10^6 gates with QuantumCircuit and
+CompactCircuit and reports, per gate, the bytes still held by the circuit
+and the number of live allocations (tracemalloc), plus the bytes that
+gate.targets allocates per access (measured by keeping every result).
+
+Usage: python benchmarks/memory_benchmark.py [--qubits N] [--sizes 100000 1000000]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from quantum_simulator.quantum_abstraction.circuit_builder import QuantumCircuit
+from quantum_simulator.quantum_abstraction.compact_circuit import CompactCircuit
+
+def build(circuit_class, num_qubits: int, num_gates: int):
+    """
+    Mixes fixed gates, rotations and two-qubit gates (a third each).
+    """
+    circ = circuit_class(num_qubits)
+    for i in range(num_gates):
+        q = i % num_qubits
+        kind = i % 3
+        if kind == 0:
+            circ.h(q)
+        elif kind == 1:
+            circ.ry(q, 0.001 * i)
+        else:
+            circ.cx(q, (q + 1) % num_qubits)
+    return circ.measure_all()
+
+def measure(circuit_class, num_qubits: int, num_gates: int):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    start = time.perf_counter()
+    circ = build(circuit_class, num_qubits, num_gates)
+    elapsed = time.perf_counter() - start
+    held = tracemalloc.take_snapshot().compare_to(before, "filename")
+    size = sum(stat.size_diff for stat in held)
+    blocks = sum(stat.count_diff for stat in held)
+
+    # Keep every targets result alive so each new allocation shows up;
+    # the holding list itself costs 8 bytes per gate
+    gates = list(circ.gates)
+    before, _ = tracemalloc.get_traced_memory()
+    targets = [gate.targets for gate in gates]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del targets
+    return size / num_gates, blocks / num_gates, (after - before) / num_gates - 8, elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--qubits", type=int, default=20)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10 ** 5, 10 ** 6])
+    args = parser.parse_args()
+
+    print(f"{'circuit':>15} | {'gates':>8} | {'bytes/gate':>10} | {'allocs/gate':>11} | "
+          f"{'targets bytes/access':>20} | {'build (s)':>9}")
+    print("-" * 90)
+    for num_gates in args.sizes:
+        for circuit_class in (QuantumCircuit, CompactCircuit):
+            per_gate, allocs, targets_bytes, elapsed = measure(circuit_class, args.qubits, num_gates)
+            print(f"{circuit_class.__name__:>15} | {num_gates:>8} | {per_gate:>10.1f} | {allocs:>11.2f} | "
+                  f"{targets_bytes:>20.1f} | {elapsed:>9.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Translation throughput benchmark.
+
+Times QiskitEngine.translate() on generated circuits of 10^2 to 10^5 gates
+and reports the cost per gate, which should stay flat as circuits grow.
+
+Usage: python benchmarks/translate_benchmark.py [--repeat N]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from quantum_simulator.quantum_abstraction.circuit_builder import QuantumCircuit
+from quantum_simulator.execution.qiskit_engine import QiskitEngine
+
+def layered_circuit(num_qubits: int, num_gates: int) -> QuantumCircuit:
+    """
+    Mixes every gate kind: fixed gates, rotations and two-qubit gates.
+    """
+    circ = QuantumCircuit(num_qubits)
+    for i in range(num_gates):
+        q = i % num_qubits
+        kind = i % 6
+        if kind == 0:
+            circ.h(q)
+        elif kind == 1:
+            circ.rx(q, 0.1 * i)
+        elif kind == 2:
+            circ.cx(q, (q + 1) % num_qubits)
+        elif kind == 3:
+            circ.t(q)
+        elif kind == 4:
+            circ.rz(q, 0.01 * i)
+        else:
+            circ.swap(q, (q + 1) % num_qubits)
+    return circ.measure_all()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3, help="runs per size; the best is reported")
+    parser.add_argument("--qubits", type=int, default=16)
+    args = parser.parse_args()
+
+    print(f"{'gates':>8} | {'best (ms)':>10} | {'per gate (us)':>13}")
+    print("-" * 38)
+    for num_gates in (10 ** 2, 10 ** 3, 10 ** 4, 10 ** 5):
+        circ = layered_circuit(args.qubits, num_gates)
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            QiskitEngine.translate(circ)
+            best = min(best, time.perf_counter() - start)
+        print(f"{num_gates:>8} | {best * 1e3:>10.2f} | {best / num_gates * 1e6:>13.2f}")
+
+if __name__ == "__main__":
+    main()
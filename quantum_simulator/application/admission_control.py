@@ -0,0 +1,133 @@
+from dataclasses import dataclass
+from typing import Callable, Optional, Sequence
+from ..execution.cost_estimator import CostEstimate, CostEstimator
+from ..quantum_abstraction.circuit_analysis import CircuitProfile
+from ..infrastructure.system_resources import available_memory_bytes
+from ..infrastructure.logger import setup_logger
+
+logger = setup_logger("admission_control")
+
+def _format_bytes(num_bytes: int) -> str:
+    size = float(num_bytes)
+    for unit in ("B", "KiB", "MiB", "GiB", "TiB"):
+        if size < 1024 or unit == "TiB":
+            return f"{size:.1f} {unit}"
+        size /= 1024
+
+@dataclass(frozen=True)
+class AdmissionDecision:
+    """
+    Outcome of admission control for one run.
+
+    action is "admit" (run as requested), "downgrade" (run with the cheaper
+    method/precision given here) or "reject" (do not run; see reason).
+    """
+    action: str
+    method: str
+    precision: str
+    estimate: CostEstimate
+    reason: str = ""
+
+class AdmissionController:
+    """
+    Decides whether a run fits on this machine before it starts.
+
+    The memory budget is a fraction of the RAM available when the run is
+    submitted (or a fixed budget, if given), so limits follow the machine
+    rather than a hard-coded qubit count. A run that does not fit is
+    retried at single precision and then, if the caller allows a different
+    method, as a matrix product state; if nothing fits it is rejected.
+    """
+    ADMIT = "admit"
+    DOWNGRADE = "downgrade"
+    REJECT = "reject"
+
+    def __init__(self, memory_fraction: float = 0.5, memory_budget_bytes: Optional[int] = None,
+                 max_runtime_seconds: Optional[float] = None,
+                 memory_probe: Callable[[], Optional[int]] = available_memory_bytes):
+        if not 0 < memory_fraction <= 1:
+            raise ValueError("Memory fraction must be in (0, 1].")
+        self.memory_fraction = memory_fraction
+        self.memory_budget_bytes = memory_budget_bytes
+        self.max_runtime_seconds = max_runtime_seconds
+        self.memory_probe = memory_probe
+
+    def budget_bytes(self) -> Optional[int]:
+        """
+        Returns the memory a single run may use, or None if unknown (unlimited).
+        """
+        if self.memory_budget_bytes:
+            return self.memory_budget_bytes
+        available = self.memory_probe()
+        return None if available is None else int(available * self.memory_fraction)
+
+    def decide(self, profile: CircuitProfile, method: str, precision: str = "double", shots: int = 1024,
+               allow_method_change: bool = True,
+               precisions: Sequence[str] = ("double", "single")) -> AdmissionDecision:
+        """
+        Returns the admission decision for running the profiled circuit.
+        precisions lists what the executing backend supports.
+        """
+        budget = self.budget_bytes()
+        candidates = [(method, precision)]
+        if precision == "double" and "single" in precisions and method != "stabilizer":
+            candidates.append((method, "single"))
+        if allow_method_change and method == "statevector":
+            candidates += [("matrix_product_state", p) for p in ("double", "single") if p in precisions]
+
+        requested = None
+        for candidate_method, candidate_precision in candidates:
+            estimate = self._estimate(profile, candidate_method, candidate_precision, shots)
+            requested = requested or estimate
+            if self._fits(estimate, budget):
+                if estimate is requested:
+                    return AdmissionDecision(self.ADMIT, candidate_method, candidate_precision, estimate)
+                reason = (
+                    f"{method} ({precision}) needs {self._describe(requested)}, over the budget of "
+                    f"{self._describe_budget(budget)}; running {candidate_method} ({candidate_precision}) instead."
+                )
+                logger.warning(reason)
+                return AdmissionDecision(self.DOWNGRADE, candidate_method, candidate_precision, estimate, reason)
+
+        reason = (
+            f"Cannot simulate {profile.num_qubits} qubits: {method} ({precision}) needs "
+            f"{self._describe(requested)}, over the budget of {self._describe_budget(budget)}."
+        )
+        return AdmissionDecision(self.REJECT, method, precision, requested, reason)
+
+    def admit(self, profile: CircuitProfile, method: str, precision: str = "double", shots: int = 1024,
+              allow_method_change: bool = True,
+              precisions: Sequence[str] = ("double", "single")) -> AdmissionDecision:
+        """
+        Like decide(), but raises ValueError with the reason if the run is rejected.
+        """
+        decision = self.decide(profile, method, precision, shots, allow_method_change, precisions)
+        if decision.action == self.REJECT:
+            logger.error(decision.reason)
+            raise ValueError(decision.reason)
+        return decision
+
+    # ---------- Internals ----------
+    @staticmethod
+    def _estimate(profile: CircuitProfile, method: str, precision: str, shots: int) -> CostEstimate:
+        # Long-range gates are routed through swaps, so only a nearest-neighbour
+        # circuit's per-cut count bounds the MPS bond dimension
+        cut_gates = profile.max_cut_gates if profile.nearest_neighbour else profile.two_qubit_gates
+        return CostEstimator.estimate(
+            profile.num_qubits, profile.num_gates, method, precision, shots, entangling_cut_gates=cut_gates
+        )
+
+    def _fits(self, estimate: CostEstimate, budget: Optional[int]) -> bool:
+        if budget is not None and estimate.memory_bytes > budget:
+            return False
+        return self.max_runtime_seconds is None or estimate.runtime_seconds <= self.max_runtime_seconds
+
+    @staticmethod
+    def _describe(estimate: CostEstimate) -> str:
+        return f"~{_format_bytes(estimate.memory_bytes)} and ~{estimate.runtime_seconds:.2g} s"
+
+    def _describe_budget(self, budget: Optional[int]) -> str:
+        limits = [] if budget is None else [_format_bytes(budget)]
+        if self.max_runtime_seconds is not None:
+            limits.append(f"{self.max_runtime_seconds:g} s")
+        return " and ".join(limits)
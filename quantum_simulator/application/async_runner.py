@@ -0,0 +1,29 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from ..infrastructure.logger import setup_logger
+
+logger = setup_logger("async_runner")
+
+class BackgroundEventLoop:
+    """
+    Runs an asyncio event loop in a daemon thread.
+
+    Lets synchronous callers (e.g. the Tkinter GUI) schedule the simulation
+    coroutines and get a concurrent Future back. Cancelling that future
+    cancels the underlying task.
+    """
+    def __init__(self):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="simulation-loop", daemon=True)
+        self._thread.start()
+        logger.info("Background simulation event loop started.")
+
+    def submit(self, coroutine) -> Future:
+        """
+        Schedules a coroutine on the loop; safe to call from any thread.
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+
+    def stop(self):
+        self._loop.call_soon_threadsafe(self._loop.stop)
@@ -1,7 +1,12 @@
+import asyncio
 from ..quantum_abstraction.circuit_builder import QuantumCircuit
+from ..quantum_abstraction.circuit_view import CircuitView
 from ..application.simulation_manager import SimulationManager
+from ..application.prefix_state_cache import PrefixStateCache
+from ..application.admission_control import AdmissionController
 from ..application.validators import CircuitValidator
 from ..infrastructure.config import load_config
+from ..infrastructure.result_cache import ResultCache
 from ..infrastructure.logger import setup_logger
 
 logger = setup_logger("circuit_controller")
@@ -13,18 +18,51 @@ class CircuitController:
     """
     def __init__(self):
         self._config = load_config()
-        self._simulation_manager = SimulationManager(self._config.DEFAULT_BACKEND)
+        self._simulation_manager = SimulationManager(
+            self._config.DEFAULT_BACKEND,
+            resample_max_qubits=self._config.RESAMPLE_MAX_QUBITS,
+            execution_mode=self._config.EXECUTION_MODE,
+            workers=self._config.PROCESS_WORKERS or None,
+            timeout=self._config.SIMULATION_TIMEOUT,
+            admission=AdmissionController(
+                memory_fraction=self._config.MEMORY_FRACTION,
+                memory_budget_bytes=self._config.MEMORY_BUDGET_MB * 1024 * 1024 or None,
+                max_runtime_seconds=self._config.MAX_RUNTIME_SECONDS
+            ),
+            result_cache=self._build_result_cache(),
+            cache_unseeded=self._config.RESULT_CACHE_UNSEEDED,
+            seed=self._config.SEED,
+            optimize=self._config.OPTIMIZE_CIRCUITS,
+            precision=self._config.PRECISION,
+            max_parallel_threads=self._config.SIMULATOR_THREADS
+        )
         self.current_circuit = None
         
         # Educational Stepping State
         self.step_mode = False
         self.current_step = 0 # Points to the index of the next gate to be applied (0 = start)
+        self._prefix_states = PrefixStateCache(
+            checkpoint_interval=self._config.STEP_CHECKPOINT_INTERVAL,
+            max_bytes=self._config.STEP_CACHE_MAX_MB * 1024 * 1024,
+            precision=self._config.PRECISION
+        )
+
+    def _build_result_cache(self):
+        if self._config.RESULT_CACHE_MAX_MB <= 0:
+            return None
+        try:
+            return ResultCache(self._config.RESULT_CACHE_DIR, max_bytes=self._config.RESULT_CACHE_MAX_MB * 1024 * 1024)
+        except OSError as e:
+            logger.warning(f"Result cache disabled: {e}")
+            return None
 
     def create_circuit(self, num_qubits: int):
         """
         Initializes a new quantum circuit.
         """
-        CircuitValidator.validate_qubit_count(num_qubits, self._config.MAX_QUBITS)
+        # Size limits depend on the gates and the machine; admission control
+        # checks them when the circuit is run
+        CircuitValidator.validate_qubit_count(num_qubits)
         self.current_circuit = QuantumCircuit(num_qubits)
         logger.info(f"New circuit created with {num_qubits} qubits.")
         return self.current_circuit
@@ -74,7 +112,6 @@ class CircuitController:
         # Note: In a real teleportation, we measure Q0, Q1 then apply gates.
         # Here we just show the full coherent circuit which is equivalent via deferred measurement principle.
         self.current_circuit.cx(1, 2)
-        self.current_circuit.cz(0, 2) # Example: need CZ or H-CX-H logic for CZ
         # Since we don't have CZ, we use H-CX-H on target for Z-control
         # CZ(0, 2) = H(2) CX(0, 2) H(2)
         self.current_circuit.h(2)
@@ -95,24 +132,55 @@ class CircuitController:
         counts, qiskit_circ = self._simulation_manager.run_simulation(self.current_circuit, shots)
         return counts, qiskit_circ
 
-    def get_circuit_statevector(self):
+    async def run_simulation_async(self, shots: int = None, progress=None):
         """
-        Returns the statevector for the current circuit.
+        Coroutine version of run_simulation(). A newer request supersedes
+        (cancels) an older one that is still running.
         """
+        if not self.current_circuit:
+            raise ValueError("No circuit defined. Create a circuit first.")
+        
+        shots = shots or self._config.DEFAULT_SHOTS
+        return await self._simulation_manager.run_simulation_async(
+            self.current_circuit, shots, progress=progress, supersede="simulation"
+        )
+
+    def _validate_statevector_request(self):
         if not self.current_circuit:
             raise ValueError("No circuit defined.")
-        if len(self.current_circuit.qubits) > 10:
-             # Safety check: Statevector grows exponentially 2^N.
-             # 10 qubits = 1024 complex numbers (manageable).
-             # 20 qubits = 1M complex numbers (slow for GUI).
-             raise ValueError("Statevector visualization disabled for > 10 qubits for performance.")
-             
-             raise ValueError("Statevector visualization disabled for > 10 qubits for performance.")
+        # Statevector grows exponentially (2^N amplitudes): admission control
+        # rejects it when it would not fit in this machine's memory budget.
+        self._simulation_manager.plan_run(self.current_circuit, statevector=True)
+
+    def get_circuit_statevector(self):
+        """
+        Returns the statevector for the current circuit.
+        """
+        self._validate_statevector_request()
              
-        # Support Stepping:
+        # Support Stepping: prefix states are cached, so each step applies
+        # at most a few gates instead of re-simulating the whole prefix.
+        if self.step_mode:
+            if self.current_circuit.parameters:
+                raise ValueError("Bind circuit parameters before stepping through it.")
+            return self._prefix_states.get_state(self.current_circuit, self.current_step)
+
         target_circuit = self.get_active_circuit()
         return self._simulation_manager.get_statevector(target_circuit)
 
+    async def get_circuit_statevector_async(self, progress=None):
+        """
+        Coroutine version of get_circuit_statevector(). Rapid requests (e.g.
+        debugger clicks) supersede each other instead of piling up.
+        """
+        self._validate_statevector_request()
+        if self.step_mode:
+            # Prefix states are cached; at most a short replay runs in a thread
+            return await asyncio.get_running_loop().run_in_executor(None, self.get_circuit_statevector)
+        return await self._simulation_manager.get_statevector_async(
+            self.get_active_circuit(), progress=progress, supersede="statevector"
+        )
+
     def get_classical_comparison(self, bit_index: int, value: int):
         """
         Returns a classical bit simulation result for comparison.
@@ -144,26 +212,13 @@ class CircuitController:
     def get_active_circuit(self):
         """
         Returns the circuit to be visualized/simulated.
-        If step_mode is True, returns partial circuit up to current_step.
+        If step_mode is True, returns a read-only view of the circuit up to current_step.
         """
         if not self.current_circuit: return None
         
         if not self.step_mode:
             return self.current_circuit
             
-        # Create a partial copy
-        # We need a new instance so we don't mutate the original when passing to backend
-        # Assuming shallow copy is enough since we just want a subset of gates list
-        import copy
-        partial = copy.copy(self.current_circuit)
-        # Deep copy the list structure typically, but QuantumCircuit init makes new lists
-        # Let's just make a new one to be safe and clean
-        partial = QuantumCircuit(len(self.current_circuit.qubits))
-        partial.gates = self.current_circuit.gates[:self.current_step]
-        partial.measurements = self.current_circuit.measurements # Keep measurements? Maybe not for partial?
-        # Usually partial steps show coherent state, so measurements might interfere if they are in the middle?
-        # For now, let's keep them if they are in the range? 
-        # Our logical circuit keeps measurements separate. Let's ignore them for step-viz usually.
-        partial.measurements = [] 
-        
-        return partial
+        # Zero-copy view of the first current_step gates. Partial steps show
+        # the coherent state, so measurements are left out.
+        return CircuitView(self.current_circuit, 0, self.current_step)
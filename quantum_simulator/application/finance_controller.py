@@ -1,3 +1,4 @@
+from typing import Dict, List
 from ..infrastructure.data_provider import StockDataProvider, StockData
 from ..quantum_abstraction.circuit_builder import QuantumCircuit
 from ..infrastructure.logger import setup_logger
@@ -97,6 +98,45 @@ class FinanceController:
         logger.info(f"Added {n_qubits - 1} correlation gates")
         return circuit
     
+    def create_parameterized_encoding(self, n_qubits: int, correlated: bool = False) -> QuantumCircuit:
+        """
+        Create an angle-encoding template with one named RY parameter per qubit.
+        The template is translated once and reused for every price window
+        via SimulationManager.run_parameter_sweep().
+        
+        Args:
+            n_qubits: Number of price points (qubits) per window
+            correlated: Add CNOT correlations between consecutive qubits
+            
+        Returns:
+            Parameterized QuantumCircuit (parameters theta_0 ... theta_{n-1})
+        """
+        circuit = QuantumCircuit(n_qubits)
+        for i in range(n_qubits):
+            circuit.ry(i, f"theta_{i}")
+        if correlated:
+            for i in range(n_qubits - 1):
+                circuit.cx(i, i + 1)
+        return circuit
+    
+    @staticmethod
+    def encoding_bindings(windows: List[StockData]) -> Dict[str, List[float]]:
+        """
+        Build parameter bindings for create_parameterized_encoding().
+        Each window contributes one value per parameter.
+        
+        Args:
+            windows: StockData windows of equal length
+            
+        Returns:
+            Mapping of parameter name to the angles of every window
+        """
+        angle_sets = [window.normalize_to_angles() for window in windows]
+        if len({len(angles) for angles in angle_sets}) > 1:
+            raise ValueError("All stock windows must have the same number of days.")
+        n_qubits = len(angle_sets[0]) if angle_sets else 0
+        return {f"theta_{i}": [angles[i] for angles in angle_sets] for i in range(n_qubits)}
+    
     def get_available_stocks(self):
         """Returns list of available stock symbols."""
         return self.data_provider.get_available_stocks()
@@ -0,0 +1,230 @@
+import threading
+import time
+from typing import Dict, List, Optional
+from ..execution.hardware_backend import HardwareBackend
+from ..infrastructure.job_store import JobStore, TERMINAL_STATES
+from ..infrastructure.logger import setup_logger
+
+logger = setup_logger("hardware_job_manager")
+
+class HardwareJobHandle:
+    """
+    Returned by HardwareJobManager.submit() as soon as the job is queued.
+    """
+    def __init__(self, manager: "HardwareJobManager", job_id: str):
+        self._manager = manager
+        self.job_id = job_id
+
+    def status(self) -> str:
+        return self._manager.status(self.job_id)
+
+    def done(self) -> bool:
+        return self.status() in TERMINAL_STATES
+
+    def result(self, timeout: Optional[float] = None) -> List[Dict[str, int]]:
+        return self._manager.fetch(self.job_id, timeout=timeout)
+
+    def __repr__(self):
+        return f"HardwareJobHandle({self.job_id})"
+
+class HardwareJobManager:
+    """
+    Submit/poll/fetch front end for hardware jobs.
+
+    submit() returns a handle immediately. A background thread polls every
+    unfinished job, backing off from poll_interval to max_poll_interval
+    while it waits in the queue, and writes status changes and finished
+    counts to the JobStore. On construction, jobs the store still lists as
+    unfinished (e.g. from a previous process) are looked up by ID and
+    tracked again, never resubmitted; a lookup that fails (e.g. the service
+    is unreachable) is retried by the poller and leaves the job pending.
+    """
+    def __init__(self, backend: HardwareBackend, store: JobStore, poll_interval: float = 1.0,
+                 max_poll_interval: float = 30.0, backoff: float = 2.0):
+        self.backend = backend
+        self.store = store
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.backoff = backoff
+        self._jobs: Dict[str, object] = {}
+        self._next_poll: Dict[str, float] = {}
+        self._intervals: Dict[str, float] = {}
+        self._finished: Dict[str, threading.Event] = {}
+        self._wakeup = threading.Condition()
+        self._stopped = False
+        self._poller: Optional[threading.Thread] = None
+        self.resume()
+
+    # ---------- Public API ----------
+    def submit(self, qiskit_circs: List, shots: int = 1024) -> HardwareJobHandle:
+        """
+        Submits the circuits as one job and returns without waiting for it.
+        """
+        job = self.backend.submit(qiskit_circs, shots=shots)
+        if job is None:
+            raise RuntimeError("No backend available for hardware execution.")
+        job_id = job.job_id()
+        self.store.add(job_id, backend=getattr(self.backend.backend, "name", None),
+                       shots=shots, num_circuits=len(qiskit_circs))
+        self._track(job_id, job)
+        return HardwareJobHandle(self, job_id)
+
+    def resume(self) -> List[HardwareJobHandle]:
+        """
+        Starts tracking every unfinished job recorded in the store.
+        """
+        handles = []
+        for record in self.store.pending():
+            job_id = record["job_id"]
+            try:
+                job = self.backend.retrieve(job_id)
+            except Exception as e:
+                # Possibly transient: keep the job pending and retry when polling
+                logger.warning(f"Could not retrieve job {job_id} yet: {e}")
+                job = None
+            logger.info(f"Resuming tracking of hardware job {job_id}.")
+            self._track(job_id, job)
+            handles.append(HardwareJobHandle(self, job_id))
+        return handles
+
+    def handle(self, job_id: str) -> HardwareJobHandle:
+        if self.store.get(job_id) is None:
+            raise KeyError(f"Unknown job: {job_id}")
+        return HardwareJobHandle(self, job_id)
+
+    def status(self, job_id: str) -> str:
+        """
+        Returns the last known status of a job (as recorded by the poller).
+        """
+        record = self.store.get(job_id)
+        if record is None:
+            raise KeyError(f"Unknown job: {job_id}")
+        return record["status"]
+
+    def poll(self, job_id: str) -> str:
+        """
+        Queries the service for the job's status now, recording the result
+        if it has finished.
+        """
+        record = self.store.get(job_id)
+        if record is None:
+            raise KeyError(f"Unknown job: {job_id}")
+        if record["status"] in TERMINAL_STATES:
+            return record["status"]
+
+        job = self._jobs.get(job_id)
+        if job is None:
+            job = self.backend.retrieve(job_id)
+            with self._wakeup:
+                if job_id in self._jobs:
+                    self._jobs[job_id] = job
+        status = self._status_name(job.status())
+        if status == "DONE":
+            self.store.update(job_id, status=status, result=self.backend.job_counts(job))
+        elif status == "ERROR":
+            message = job.error_message() if hasattr(job, "error_message") else "Job failed."
+            self.store.update(job_id, status=status, error=message)
+        elif status != record["status"]:
+            self.store.update(job_id, status=status)
+
+        if status in TERMINAL_STATES:
+            logger.info(f"Hardware job {job_id} finished with status {status}.")
+            self._untrack(job_id)
+        return status
+
+    def fetch(self, job_id: str, timeout: Optional[float] = None) -> List[Dict[str, int]]:
+        """
+        Returns the counts of each circuit of a finished job, waiting for the
+        poller up to timeout seconds (None waits indefinitely).
+        """
+        record = self.store.get(job_id)
+        if record is None:
+            raise KeyError(f"Unknown job: {job_id}")
+        if record["status"] not in TERMINAL_STATES:
+            finished = self._finished.get(job_id)
+            if finished is not None and self._polling():
+                if not finished.wait(timeout):
+                    raise TimeoutError(f"Hardware job {job_id} did not finish within {timeout} seconds.")
+                record = self.store.get(job_id)
+        if record["status"] not in TERMINAL_STATES:
+            # Not tracked by a running poller (e.g. after stop()): ask the service once
+            status = self.poll(job_id)
+            if status not in TERMINAL_STATES:
+                raise RuntimeError(f"Hardware job {job_id} is still {status} and is not being polled.")
+            record = self.store.get(job_id)
+        if record["status"] != "DONE":
+            raise RuntimeError(f"Hardware job {job_id} ended with status {record['status']}: {record['error']}")
+        return record["result"]
+
+    def stop(self):
+        """
+        Stops the background poller; unfinished jobs stay in the store (see
+        resume()). Callers blocked in fetch() fall back to polling once.
+        """
+        with self._wakeup:
+            self._stopped = True
+            self._jobs.clear()
+            self._next_poll.clear()
+            self._intervals.clear()
+            waiting, self._finished = list(self._finished.values()), {}
+            self._wakeup.notify_all()
+        for finished in waiting:
+            finished.set()
+        if self._poller is not None:
+            self._poller.join()
+
+    # ---------- Internals ----------
+    def _track(self, job_id: str, job):
+        with self._wakeup:
+            self._jobs[job_id] = job
+            self._intervals[job_id] = self.poll_interval
+            self._next_poll[job_id] = time.monotonic() + self.poll_interval
+            self._finished.setdefault(job_id, threading.Event())
+            if self._poller is None or not self._poller.is_alive():
+                self._stopped = False
+                self._poller = threading.Thread(target=self._poll_loop, name="hardware-job-poller", daemon=True)
+                self._poller.start()
+            self._wakeup.notify_all()
+
+    def _polling(self) -> bool:
+        with self._wakeup:
+            return not self._stopped and self._poller is not None and self._poller.is_alive()
+
+    def _untrack(self, job_id: str):
+        with self._wakeup:
+            self._jobs.pop(job_id, None)
+            self._next_poll.pop(job_id, None)
+            self._intervals.pop(job_id, None)
+            finished = self._finished.get(job_id)
+        if finished is not None:
+            finished.set()
+
+    def _poll_loop(self):
+        while True:
+            with self._wakeup:
+                if self._stopped:
+                    return
+                now = time.monotonic()
+                due = [job_id for job_id, at in self._next_poll.items() if at <= now]
+                if not due:
+                    wait = min(self._next_poll.values()) - now if self._next_poll else None
+                    self._wakeup.wait(wait)
+                    continue
+
+            for job_id in due:
+                try:
+                    status = self.poll(job_id)
+                except Exception as e:
+                    logger.warning(f"Polling hardware job {job_id} failed: {e}")
+                    status = None
+                if status not in TERMINAL_STATES:
+                    with self._wakeup:
+                        if job_id in self._intervals:
+                            interval = min(self._intervals[job_id] * self.backoff, self.max_poll_interval)
+                            self._intervals[job_id] = interval
+                            self._next_poll[job_id] = time.monotonic() + interval
+
+    @staticmethod
+    def _status_name(status) -> str:
+        # Older runtime versions return a JobStatus enum instead of a string
+        return getattr(status, "name", str(status)).upper()
@@ -0,0 +1,137 @@
+import threading
+from collections import OrderedDict
+from typing import Dict
+import numpy as np
+from ..execution.numpy_engine import COMPLEX_DTYPES, NumpyStatevectorBackend
+from ..quantum_abstraction.circuit_builder import QuantumCircuit
+from ..infrastructure.logger import setup_logger
+
+logger = setup_logger("prefix_state_cache")
+
+class PrefixStateCache:
+    """
+    Caches the statevector after each prefix of a circuit for the step debugger.
+
+    The state at step k is the state after applying gates[:k]. States at every
+    checkpoint_interval-th step are checkpoints; other visited steps are kept in
+    an LRU. When the memory budget is exceeded, LRU entries are evicted before
+    checkpoints. A missing step is rebuilt from the nearest cached step below it,
+    so stepping forward applies a single gate and stepping backward is a lookup
+    or a replay of at most checkpoint_interval gates.
+    precision="single" stores complex64 states, doubling what fits the budget.
+
+    Each state is stored with the prefix fingerprint of the circuit at its
+    step and is only reused while the circuit still has that prefix, so
+    editing the tail of a circuit (or passing an equal copy) keeps the
+    states of the unchanged prefix.
+    """
+    def __init__(self, checkpoint_interval: int = 16, max_bytes: int = 64 * 1024 * 1024,
+                 precision: str = "double"):
+        if checkpoint_interval <= 0:
+            raise ValueError("Checkpoint interval must be positive.")
+        self.checkpoint_interval = checkpoint_interval
+        self.dtype = COMPLEX_DTYPES[precision]
+        self.max_bytes = max_bytes
+        self._circuit = None
+        self._fingerprints: Dict[int, str] = {}
+        self._checkpoints: Dict[int, np.ndarray] = {}
+        self._recent: "OrderedDict[int, np.ndarray]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self.gates_applied = 0
+
+    def reset(self, circuit: QuantumCircuit = None):
+        """
+        Drops every cached state (e.g. when the circuit is replaced).
+        """
+        with self._lock:
+            self._circuit = circuit
+            self._fingerprints.clear()
+            self._checkpoints.clear()
+            self._recent.clear()
+            self._bytes = 0
+
+    def get_state(self, circuit: QuantumCircuit, step: int) -> np.ndarray:
+        """
+        Returns the flat statevector after the first `step` gates of the circuit.
+        The returned array is shared with the cache and is read-only.
+        """
+        with self._lock:
+            self._circuit = circuit
+            self._drop_stale(circuit)
+            step = max(0, min(step, len(circuit.gates)))
+
+            cached = self._lookup(step)
+            if cached is not None:
+                return cached.reshape(-1)
+
+            base_step, state = self._nearest_below(step)
+            for index in range(base_step, step):
+                NumpyStatevectorBackend.apply_gate(state, circuit.gates[index])
+                self.gates_applied += 1
+                reached = index + 1
+                if reached % self.checkpoint_interval == 0 and reached != step and reached not in self._checkpoints:
+                    self._store(reached, state.copy(), circuit.prefix_fingerprint(reached))
+
+            self._store(step, state, circuit.prefix_fingerprint(step))
+            return state.reshape(-1)
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._checkpoints) + len(self._recent)
+
+    # ---------- Internals ----------
+    def _lookup(self, step: int):
+        if step in self._checkpoints:
+            return self._checkpoints[step]
+        if step in self._recent:
+            self._recent.move_to_end(step)
+            return self._recent[step]
+        return None
+
+    def _nearest_below(self, step: int):
+        """
+        Returns a writable copy of the closest cached state at or before step.
+        """
+        candidates = [s for s in self._checkpoints if s <= step] + [s for s in self._recent if s <= step]
+        if not candidates:
+            return 0, NumpyStatevectorBackend.initial_state(len(self._circuit.qubits), self.dtype)
+        base_step = max(candidates)
+        return base_step, self._lookup(base_step).copy()
+
+    def _drop_stale(self, circuit: QuantumCircuit):
+        """
+        Drops states whose prefix is no longer the circuit's prefix.
+        """
+        for step, fingerprint in list(self._fingerprints.items()):
+            if step > len(circuit.gates) or circuit.prefix_fingerprint(step) != fingerprint:
+                self._discard(step)
+
+    def _discard(self, step: int):
+        state = self._checkpoints.pop(step, None)
+        if state is None:
+            state = self._recent.pop(step)
+        del self._fingerprints[step]
+        self._bytes -= state.nbytes
+
+    def _store(self, step: int, state: np.ndarray, fingerprint: str):
+        state.flags.writeable = False
+        self._fingerprints[step] = fingerprint
+        if step % self.checkpoint_interval == 0:
+            self._checkpoints[step] = state
+        else:
+            self._recent[step] = state
+        self._bytes += state.nbytes
+        self._evict()
+
+    def _evict(self):
+        while self._bytes > self.max_bytes and len(self) > 1:
+            if self._recent:
+                self._discard(next(iter(self._recent)))
+            else:
+                # Only checkpoints left: drop the furthest one from the start
+                self._discard(max(self._checkpoints))
+            logger.debug("Evicted a cached prefix state to stay within the memory budget.")
@@ -0,0 +1,146 @@
+import multiprocessing
+import os
+import signal
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Set
+import numpy as np
+from ..quantum_abstraction.circuit_builder import QuantumCircuit as LogicalCircuit
+from ..infrastructure.logger import setup_logger
+
+logger = setup_logger("process_executor")
+
+# Per-worker SimulationManager, created once by the pool initializer
+_worker_manager = None
+
+def _init_worker(backend_type: str, backend_options: Dict, pid_queue):
+    """
+    Pool initializer: reports the worker's PID to the parent (so a stuck
+    worker can be terminated) and builds a warm in-process simulation stack.
+    """
+    global _worker_manager
+    pid_queue.put(os.getpid())
+    from .simulation_manager import SimulationManager
+    _worker_manager = SimulationManager(backend_type, **backend_options)
+
+def _worker_counts(logical_circuit: LogicalCircuit, shots: int, seed: Optional[int]) -> Dict[str, int]:
+    counts, _ = _worker_manager.run_simulation(logical_circuit, shots, seed=seed)
+    return dict(counts)
+
+def _worker_batch_counts(logical_circuit: LogicalCircuit, shots: int, seed: Optional[int]) -> Dict[str, int]:
+    # A batch of one is sampled by the backend with exactly this seed
+    return dict(_worker_manager.run_batch([logical_circuit], shots, seed=seed)[0])
+
+def _worker_statevector(logical_circuit: LogicalCircuit) -> np.ndarray:
+    return np.asarray(_worker_manager.get_statevector(logical_circuit))
+
+class ProcessPoolRunner:
+    """
+    Executes simulations in a pool of worker processes.
+
+    Only logical circuits and plain results (counts dictionaries, NumPy
+    statevectors) cross the process boundary; translation, transpilation and
+    execution happen in the workers, each of which keeps a warm backend.
+    A crashed worker or a timed-out task tears the pool down and the next
+    submission starts a fresh one.
+    """
+    def __init__(self, backend_type: str = "aer_simulator", workers: Optional[int] = None,
+                 timeout: Optional[float] = None, **backend_options):
+        self.backend_type = backend_type
+        self.workers = workers or multiprocessing.cpu_count()
+        self.timeout = timeout
+        self.backend_options = backend_options
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pid_queue = None
+        self._lock = threading.Lock()
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # spawn: safe to use from a multi-threaded parent such as the GUI
+                context = multiprocessing.get_context("spawn")
+                self._pid_queue = context.SimpleQueue()
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=context,
+                    initializer=_init_worker,
+                    initargs=(self.backend_type, self.backend_options, self._pid_queue),
+                )
+                logger.info(f"Started simulation process pool with {self.workers} workers.")
+            return self._executor
+
+    def submit(self, fn, *args) -> Future:
+        """
+        Submits any picklable callable to the pool.
+        """
+        try:
+            return self._pool().submit(fn, *args)
+        except BrokenProcessPool:
+            self._discard_pool(terminate=False)
+            return self._pool().submit(fn, *args)
+
+    def result(self, future: Future, timeout: Optional[float] = None):
+        """
+        Waits for a submitted task, converting pool failures into clear errors.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        try:
+            return future.result(timeout=timeout)
+        except BrokenProcessPool as e:
+            logger.error("A simulation worker process crashed; discarding the pool.")
+            self._discard_pool(terminate=False)
+            raise RuntimeError("A simulation worker process crashed; the pool has been restarted.") from e
+        except FutureTimeoutError as e:
+            # A stuck worker cannot be interrupted, so the whole pool is replaced
+            logger.error(f"Simulation timed out after {timeout} seconds; discarding the pool.")
+            self._discard_pool(terminate=True)
+            raise TimeoutError(f"Simulation did not finish within {timeout} seconds.") from e
+
+    def run_counts(self, logical_circuit: LogicalCircuit, shots: int = 1024,
+                   seed: Optional[int] = None) -> Dict[str, int]:
+        return self.result(self.submit(_worker_counts, logical_circuit, shots, seed))
+
+    def run_statevector(self, logical_circuit: LogicalCircuit) -> np.ndarray:
+        return self.result(self.submit(_worker_statevector, logical_circuit))
+
+    def map_counts(self, logical_circuits: List[LogicalCircuit], shots: int = 1024,
+                   seeds: Optional[List[Optional[int]]] = None) -> List[Dict[str, int]]:
+        """
+        Runs independent circuits concurrently; returns counts in input order.
+        seeds[i] seeds circuit i, so results do not depend on which worker
+        picks up which circuit. Like the members of SimulationManager.run_batch,
+        every circuit is sampled by the backend rather than resampled.
+        """
+        seeds = seeds or [None] * len(logical_circuits)
+        futures = [self.submit(_worker_batch_counts, circuit, shots, seed)
+                   for circuit, seed in zip(logical_circuits, seeds)]
+        return [self.result(future) for future in futures]
+
+    def shutdown(self):
+        self._discard_pool(terminate=False)
+
+    def _discard_pool(self, terminate: bool):
+        with self._lock:
+            executor, self._executor = self._executor, None
+            pid_queue, self._pid_queue = self._pid_queue, None
+        if executor is None:
+            return
+        if terminate:
+            for pid in self._drain_pids(pid_queue):
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                except OSError:
+                    # Already exited
+                    pass
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _drain_pids(pid_queue) -> Set[int]:
+        """
+        Returns the PIDs reported so far by the workers of a pool.
+        """
+        pids = set()
+        while not pid_queue.empty():
+            pids.add(pid_queue.get())
+        return pids
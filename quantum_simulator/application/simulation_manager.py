@@ -1,39 +1,581 @@
-from ..execution.qiskit_engine import QiskitEngine
-from ..execution.simulator_backend import SimulatorBackend
+import asyncio
+import contextlib
+import functools
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from ..execution.numpy_engine import NumpyStatevectorBackend
+from ..execution.sampling import measurement_distribution, sample_counts
+from ..execution.cost_estimator import CostEstimator
+from ..execution.seeding import SeedPolicy, derive_seeds
 from ..quantum_abstraction.circuit_builder import QuantumCircuit as LogicalCircuit
+from ..quantum_abstraction.circuit_analysis import CircuitAnalyzer
+from ..quantum_abstraction.optimizer import CircuitOptimizer, OptimizationReport
+from .admission_control import AdmissionController
+from ..infrastructure.result_cache import ResultCache
 from ..infrastructure.logger import setup_logger
 
 logger = setup_logger("simulation_manager")
 
+# Backend options that do not change the outcome distribution of an ideal
+# simulation; any other option (noise, custom basis gates, ...) disables
+# resampling from the statevector
+_IDEAL_OPTIONS = frozenset({
+    "precision", "method", "device", "max_parallel_threads", "max_parallel_experiments",
+    "max_parallel_shots", "max_memory_mb", "fusion_enable", "fusion_threshold",
+    "statevector_parallel_threshold", "seed_simulator",
+})
+
 class SimulationManager:
     """
     Orchestrates the entire simulation process.
     Logical Circuit -> Qiskit Translation -> Execution -> Results.
+
+    With backend_type="numpy_statevector" the native NumPy engine executes
+    the logical circuit directly; qiskit is then never imported.
+
+    Circuits of up to resample_max_qubits qubits are simulated once to get
+    their measurement distribution, which is cached; every run (any number
+    of shots) is then a single vectorized multinomial draw from it. The
+    cache holds at most distribution_cache_size circuits and
+    distribution_cache_bytes bytes of distributions. Noisy backends are
+    never resampled, since the distribution comes from an ideal statevector.
+
+    execution_mode="process" (opt-in) ships logical circuits to a pool of
+    worker processes instead of simulating in the calling thread; results
+    then carry no Qiskit circuit.
+
+    Each Aer run picks its simulation method from a structural analysis of
+    the circuit: Clifford circuits use the stabilizer method, low-entanglement
+    nearest-neighbour circuits the matrix product state method, and anything
+    else the statevector method. method_qubit_limits maps a method name to
+    the largest circuit it accepts. An optional AdmissionController checks
+    each run's predicted memory and runtime against this machine and may
+    downgrade it to single precision or MPS, or reject it.
+
+    An optional ResultCache serves repeated runs from disk: statevectors and
+    seeded counts, keyed by the circuit and every setting that affects the
+    result. Unseeded runs are meant to be random, so their counts are only
+    cached with cache_unseeded=True; a repeated unseeded run then returns
+    the first run's sample instead of a fresh one. Without a seed (the
+    default seed policy), counts therefore hit the cache only when opted in.
+
+    seed sets the seed policy: runs without an explicit seed then draw
+    reproducible seeds from it (see SeedPolicy), keyed by the circuit and
+    shot count so a new session's runs hit the result cache; it also seeds
+    the transpiler. Batches derive one seed per circuit at submission.
+
+    optimize=True runs CircuitOptimizer on each circuit before it is
+    executed; the report of the last optimization is kept in
+    last_optimization.
     """
-    def __init__(self, backend_type: str = "aer_simulator"):
-        self.simulator = SimulatorBackend(backend_type)
-        logger.info(f"Simulation Manager initialized with backend: {backend_type}")
+    def __init__(self, backend_type: str = "aer_simulator", resample_max_qubits: int = 20,
+                 distribution_cache_size: int = 32, distribution_cache_bytes: int = 64 * 1024 * 1024,
+                 execution_mode: str = "local",
+                 workers: Optional[int] = None, timeout: Optional[float] = None,
+                 method_qubit_limits: Optional[Dict[str, int]] = None,
+                 admission: Optional[AdmissionController] = None,
+                 result_cache: Optional[ResultCache] = None, seed: Optional[int] = None,
+                 optimize: bool = False, cache_unseeded: bool = False, **backend_options):
+        if execution_mode not in ("local", "process"):
+            raise ValueError(f"Unknown execution mode: {execution_mode}")
+        self.method_qubit_limits = dict(method_qubit_limits or {})
+        self.admission = admission
+        self.result_cache = result_cache
+        self.cache_unseeded = cache_unseeded
+        self.seed_policy = SeedPolicy(seed)
+        self.optimize = optimize
+        self.last_optimization: Optional[OptimizationReport] = None
+        self.backend_type = backend_type
+        noise_model = backend_options.get("noise_model")
+        self._noise_settings = None if noise_model is None else noise_model.to_dict()
+        self._ideal = self._noise_settings is None and not set(backend_options) - _IDEAL_OPTIONS
+        self.precision = backend_options.get("precision") or "double"
+        self.resample_max_qubits = resample_max_qubits
+        self.distribution_cache_size = distribution_cache_size
+        self.distribution_cache_bytes = distribution_cache_bytes
+        self._distributions: "OrderedDict[str, Tuple]" = OrderedDict()
+        self._distribution_bytes = 0
+        self._translations: "OrderedDict[str, object]" = OrderedDict()
+        self._distribution_lock = threading.Lock()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._inflight_lock = threading.Lock()
+        self.native = backend_type == NumpyStatevectorBackend.name
+        if self.native:
+            self.simulator = NumpyStatevectorBackend(precision=self.precision)
+        else:
+            # Imported lazily so the native engine works without qiskit
+            from ..execution.simulator_backend import SimulatorBackend
+            self.simulator = SimulatorBackend(backend_type, seed_transpiler=seed, **backend_options)
+
+        self.process_pool = None
+        if execution_mode == "process":
+            from .process_executor import ProcessPoolRunner
+            self.process_pool = ProcessPoolRunner(
+                backend_type, workers=workers, timeout=timeout,
+                resample_max_qubits=resample_max_qubits,
+                method_qubit_limits=self.method_qubit_limits, admission=admission, seed=seed,
+                optimize=optimize, **backend_options
+            )
+        logger.info(f"Simulation Manager initialized with backend: {backend_type} ({execution_mode} execution)")
+
+    def _prepare(self, logical_circuit: LogicalCircuit):
+        """
+        Converts a logical circuit into what the active backend executes:
+        the circuit itself for the native engine, a Qiskit circuit otherwise.
+        With optimize, the circuit is optimized first.
+        Translations are cached by circuit fingerprint and shared, so callers
+        must not mutate the returned circuit.
+        """
+        if self.native and not self.optimize:
+            return logical_circuit
+        key = self._circuit_key(logical_circuit)
+        with self._distribution_lock:
+            if key in self._translations:
+                self._translations.move_to_end(key)
+                return self._translations[key]
+        executable = logical_circuit
+        if self.optimize:
+            executable, self.last_optimization = CircuitOptimizer.optimize(logical_circuit)
+            logger.info(f"Optimized circuit: {self.last_optimization}")
+        if not self.native:
+            from ..execution.qiskit_engine import QiskitEngine
+            executable = QiskitEngine.translate(executable)
+        with self._distribution_lock:
+            self._translations[key] = executable
+            while len(self._translations) > self.distribution_cache_size:
+                self._translations.popitem(last=False)
+        return executable
 
-    def run_simulation(self, logical_circuit: LogicalCircuit, shots: int = 1024):
+    def select_method(self, logical_circuit: LogicalCircuit) -> Optional[str]:
+        """
+        Returns the Aer simulation method for the circuit (None for the native
+        engine, which only simulates statevectors).
+        Raises ValueError if the circuit exceeds the chosen method's qubit limit.
+        """
+        if self.native:
+            self._check_statevector_limit(logical_circuit)
+            return None
+        return self._method_for(CircuitAnalyzer.analyze(logical_circuit))
+
+    def plan_run(self, logical_circuit: LogicalCircuit, shots: int = 1024,
+                 statevector: bool = False) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Decides how a run executes: returns (method, precision), where method
+        is the Aer simulation method (None for the native engine) and
+        precision overrides the backend's precision (None keeps it).
+        statevector=True plans a full statevector computation instead of a
+        sampling run. Raises ValueError if a method limit is exceeded or the
+        admission controller rejects the run.
+        """
+        profile = CircuitAnalyzer.analyze(logical_circuit)
+        if statevector or self.native:
+            self._check_statevector_limit(logical_circuit)
+            method = "statevector"
+        else:
+            method = self._method_for(profile)
+        precision = self.precision
+
+        if self.admission is not None:
+            decision = self.admission.admit(
+                profile, method, precision, shots,
+                allow_method_change=not (statevector or self.native),
+            )
+            method, precision = decision.method, decision.precision
+
+        return (None if self.native else method), (None if precision == self.precision else precision)
+
+    def _method_for(self, profile) -> str:
+        from ..execution.method_selector import select_method
+        method = select_method(profile, self.method_qubit_limits)
+        logger.info(f"Selected the {method} method for a {profile.category} circuit of {profile.num_qubits} qubits.")
+        return method
+
+    def run_simulation(self, logical_circuit: LogicalCircuit, shots: int = 1024, seed: Optional[int] = None):
         """
         Coordinates the translation and local execution.
+        A seed makes the sampled counts reproducible; without one the seed
+        policy decides.
         """
         logger.info(f"Starting simulation with {shots} shots...")
-        
-        # 1. Translate Logical to Qiskit
-        qiskit_circ = QiskitEngine.translate(logical_circuit)
-        
-        # 2. Run simulation
-        counts = self.simulator.run(qiskit_circ, shots=shots)
-        
+        result = self._drive(self._counts_stages(logical_circuit, shots, seed))
         logger.info("Simulation completed successfully.")
-        return counts, qiskit_circ
+        return result
+
+    def run_batch(self, logical_circuits: List[LogicalCircuit], shots: int = 1024,
+                  seed: Optional[int] = None) -> List[Dict[str, int]]:
+        """
+        Runs many logical circuits as one multi-experiment job.
+        Returns the counts of each circuit, in the same order as the input.
+
+        Circuit i is sampled with the i-th seed of derive_seeds(seed), i.e.
+        Aer's own per-experiment seed, fixed at submission. Batch members are
+        always sampled by the backend, never resampled from a cached
+        distribution, so their counts equal run_simulation(circuit i, seed=that
+        seed) on a manager with resampling disabled (resample_max_qubits=0),
+        in every execution mode. Circuits that share one simulation method and
+        precision run as a single Aer job; mixed batches run circuit by circuit.
+        """
+        logger.info(f"Starting batch simulation of {len(logical_circuits)} circuits with {shots} shots...")
+
+        for circuit in logical_circuits:
+            self._ensure_bound(circuit)
+        plans = [self.plan_run(circuit, shots) for circuit in logical_circuits]
+        seed = self.seed_policy.resolve(seed, "batch", shots, *map(self._circuit_key, logical_circuits))
+        if self.process_pool:
+            counts = self.process_pool.map_counts(logical_circuits, shots=shots,
+                                                  seeds=derive_seeds(seed, len(logical_circuits)))
+            logger.info("Batch simulation completed successfully.")
+            return counts
+
+        if self.native:
+            counts = self.simulator.run_batch(logical_circuits, shots=shots, seed=seed)
+        elif len(set(plans)) == 1:
+            method, precision = plans[0]
+            executables = [self._prepare(circuit) for circuit in logical_circuits]
+            counts = self.simulator.run_batch(executables, shots=shots, seed=seed,
+                                              method=None if method == "statevector" else method,
+                                              precision=precision)
+        else:
+            # One job shares one configuration, so mixed batches run per circuit
+            counts = [
+                self._simulate_counts(circuit, shots, circuit_seed, *plan, resample=False)[0]
+                for circuit, circuit_seed, plan in zip(logical_circuits, derive_seeds(seed, len(plans)), plans)
+            ]
+
+        logger.info("Batch simulation completed successfully.")
+        return counts
+
+    def run_parameter_sweep(self, logical_circuit: LogicalCircuit, bindings: Dict[str, Sequence[float]],
+                            shots: int = 1024, seed: Optional[int] = None) -> List[Dict[str, int]]:
+        """
+        Runs a parameterized circuit once per set of bound values.
+
+        bindings maps each parameter name to an array of values; all arrays
+        must have the same length. The circuit is translated and transpiled
+        once and every value set is executed in a single job.
+        Returns the counts for each value set, in order.
+        """
+        names = {param.name for param in logical_circuit.parameters}
+        missing = names - set(bindings)
+        if missing:
+            raise ValueError(f"No values bound for parameters: {sorted(missing)}")
+        lengths = {len(bindings[name]) for name in names}
+        if len(lengths) > 1:
+            raise ValueError("All parameter value arrays must have the same length.")
+
+        logger.info(f"Starting parameter sweep over {lengths.pop() if lengths else 1} value sets with {shots} shots...")
+        executable = self._prepare(logical_circuit)
+        seed = self.seed_policy.resolve(seed, "sweep", shots, self._circuit_key(logical_circuit))
+        counts = self.simulator.run_parameterized(executable, bindings, shots=shots, seed=seed)
+
+        logger.info("Parameter sweep completed successfully.")
+        return counts
 
     def get_statevector(self, logical_circuit: LogicalCircuit):
         """
-        Returns the statevector of the circuit (pre-measurement).
+        Returns the statevector of the circuit (pre-measurement) as a NumPy
+        array, whichever backend or cache produced it.
         """
         logger.info("Computing statevector...")
-        qiskit_circ = QiskitEngine.translate(logical_circuit)
-        statevector = self.simulator.run_statevector(qiskit_circ)
+        return self._drive(self._statevector_stages(logical_circuit))
+
+    # ===============================
+    # Asynchronous API
+    # ===============================
+    async def run_simulation_async(self, logical_circuit: LogicalCircuit, shots: int = 1024,
+                                   seed: Optional[int] = None, progress: Optional[Callable[[str], None]] = None,
+                                   supersede: Optional[str] = None):
+        """
+        Coroutine version of run_simulation().
+
+        Blocking stages run in the default thread pool. progress(stage) is
+        called before each stage: "translate", "transpile", "execute" and
+        "postprocess". Cancelling the task abandons the run at the next stage
+        boundary. With supersede=<key>, starting a new request with the same
+        key cancels the previous one that is still in flight.
+        """
+        with self._superseding(supersede):
+            result = await self._drive_async(self._counts_stages(logical_circuit, shots, seed), progress)
+            logger.info("Asynchronous simulation completed successfully.")
+            return result
+
+    async def get_statevector_async(self, logical_circuit: LogicalCircuit,
+                                    progress: Optional[Callable[[str], None]] = None,
+                                    supersede: Optional[str] = None):
+        """
+        Coroutine version of get_statevector(), with the same progress and
+        cancellation semantics as run_simulation_async().
+        """
+        with self._superseding(supersede):
+            return await self._drive_async(self._statevector_stages(logical_circuit), progress)
+
+    # ===============================
+    # Pipeline stages
+    # ===============================
+    # The sync and async APIs share one pipeline per result kind. A pipeline
+    # is a generator that yields (stage, fn, args) for each blocking step and
+    # is sent fn(*args) back; it returns the final result. stage is the
+    # progress label reported before the step (None for unreported steps)
+    # and fn may be None for a step that only reports progress.
+
+    def _counts_stages(self, logical_circuit: LogicalCircuit, shots: int, seed: Optional[int]):
+        self._ensure_bound(logical_circuit)
+        seed = self.seed_policy.resolve(seed, self._circuit_key(logical_circuit), shots)
+        method, precision = self.plan_run(logical_circuit, shots)
+        cache_key = self._counts_key(logical_circuit, shots, seed, method, precision)
+        cached = yield None, self._cached, (cache_key,)
+        if cached is not None:
+            logger.info("Simulation result served from the result cache.")
+            if self.native or self.process_pool:
+                executable = None
+            else:
+                executable = yield None, self._prepare, (logical_circuit,)
+            yield "postprocess", None, ()
+            return cached, executable
+
+        if self.process_pool:
+            counts = yield "execute", self.process_pool.run_counts, (logical_circuit, shots, seed)
+            yield "postprocess", None, ()
+            self._remember(cache_key, counts)
+            return counts, None
+
+        counts, executable = yield from self._simulation_stages(logical_circuit, shots, seed, method, precision)
+        self._remember(cache_key, counts)
+        # The Qiskit circuit is only available when Qiskit executed the run
+        return counts, (None if self.native else executable)
+
+    def _simulation_stages(self, logical_circuit: LogicalCircuit, shots: int, seed: Optional[int],
+                           method: Optional[str], precision: Optional[str], resample: bool = True):
+        """
+        Runs one planned circuit in this process; returns (counts, executable).
+        resample=False always samples with the backend.
+        """
+        resample = resample and self._can_resample(logical_circuit, method, precision)
+        executable = yield "translate", self._prepare, (logical_circuit,)
+        # A cached distribution needs no transpiled circuit
+        if resample:
+            transpile = not self._has_distribution(logical_circuit)
+        else:
+            transpile = method == "statevector"
+        if transpile and not self.native:
+            yield "transpile", self.simulator.transpile, (executable, resample)
+
+        if resample:
+            # Measurements are always terminal in the logical model, so shots can be
+            # drawn from the cached outcome distribution instead of re-simulating.
+            distribution, _ = yield "execute", self._distribution, (logical_circuit, executable)
+            counts = yield "postprocess", sample_counts, (
+                distribution, len(logical_circuit.measurements), shots, seed)
+        else:
+            counts = yield "execute", self._run, (executable, shots, seed, method, precision)
+            yield "postprocess", None, ()
+        return counts, executable
+
+    def _statevector_stages(self, logical_circuit: LogicalCircuit):
+        self._ensure_bound(logical_circuit)
+        _, precision = self.plan_run(logical_circuit, statevector=True)
+        cache_key = self._result_key(logical_circuit, "statevector", precision=precision or self.precision)
+        cached = yield None, self._cached, (cache_key,)
+        if cached is not None:
+            yield "postprocess", None, ()
+            return cached
+
+        if self.process_pool:
+            statevector = yield "execute", self.process_pool.run_statevector, (logical_circuit,)
+        else:
+            executable = yield "translate", self._prepare, (logical_circuit,)
+            if not self.native:
+                yield "transpile", self.simulator.transpile, (executable, True)
+            statevector = yield "execute", self._statevector, (executable, precision)
+        yield "postprocess", None, ()
+        self._remember(cache_key, statevector)
         return statevector
+
+    @staticmethod
+    def _drive(stages):
+        """
+        Runs a pipeline in the calling thread.
+        """
+        try:
+            _, fn, args = next(stages)
+            while True:
+                _, fn, args = stages.send(None if fn is None else fn(*args))
+        except StopIteration as done:
+            return done.value
+
+    @classmethod
+    async def _drive_async(cls, stages, progress: Optional[Callable[[str], None]] = None):
+        """
+        Runs a pipeline with its blocking steps in the default thread pool,
+        reporting each stage to progress; cancellation takes effect at the
+        next step.
+        """
+        try:
+            stage, fn, args = next(stages)
+            while True:
+                if stage is not None and progress is not None:
+                    progress(stage)
+                result = None if fn is None else await cls._in_thread(fn, *args)
+                stage, fn, args = stages.send(result)
+        except StopIteration as done:
+            return done.value
+
+    @staticmethod
+    async def _in_thread(fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(None, functools.partial(fn, *args))
+
+    @contextlib.contextmanager
+    def _superseding(self, key: Optional[str]):
+        """
+        Registers the current task under key, cancelling the task it replaces.
+        """
+        if key is None:
+            yield
+            return
+        task = asyncio.current_task()
+        with self._inflight_lock:
+            previous = self._inflight.get(key)
+            self._inflight[key] = task
+        if previous is not None and previous is not task and not previous.done():
+            logger.info(f"Cancelling superseded '{key}' request.")
+            previous.cancel()
+        try:
+            yield
+        finally:
+            with self._inflight_lock:
+                if self._inflight.get(key) is task:
+                    del self._inflight[key]
+
+    def shutdown(self):
+        """
+        Stops the worker processes of the process execution mode, if any.
+        """
+        if self.process_pool:
+            self.process_pool.shutdown()
+
+    def distribution_cache_info(self) -> Dict[str, int]:
+        """
+        Returns the occupancy of the measurement-distribution cache.
+        """
+        with self._distribution_lock:
+            return {"size": len(self._distributions), "maxsize": self.distribution_cache_size,
+                    "nbytes": self._distribution_bytes, "max_bytes": self.distribution_cache_bytes}
+
+    def result_cache_stats(self) -> Optional[Dict[str, float]]:
+        """
+        Returns the result cache's hit rate and bytes saved (None if disabled).
+        """
+        return None if self.result_cache is None else self.result_cache.stats()
+
+    def _result_key(self, logical_circuit: LogicalCircuit, kind: str, **settings) -> Optional[str]:
+        if self.result_cache is None:
+            return None
+        if self.optimize:
+            # Fused gates can shift amplitudes in the last bits
+            settings["optimized"] = True
+        return ResultCache.key(
+            self._circuit_key(logical_circuit), kind=kind, backend=self.backend_type,
+            noise=self._noise_settings, **settings
+        )
+
+    def _counts_key(self, logical_circuit: LogicalCircuit, shots: int, seed: Optional[int],
+                    method: Optional[str], precision: Optional[str]) -> Optional[str]:
+        # Only seeded runs are reproducible; unseeded ones are cached on opt-in
+        if seed is None and not self.cache_unseeded:
+            return None
+        return self._result_key(logical_circuit, "counts", shots=shots, seed=seed, method=method,
+                                precision=precision or self.precision)
+
+    def _cached(self, cache_key: Optional[str]):
+        return None if cache_key is None else self.result_cache.get(cache_key)
+
+    def _remember(self, cache_key: Optional[str], value):
+        if cache_key is not None:
+            self.result_cache.put(cache_key, value)
+
+    def _simulate_counts(self, logical_circuit: LogicalCircuit, shots: int, seed: Optional[int],
+                         method: Optional[str], precision: Optional[str], resample: bool = True):
+        """
+        Runs one planned circuit in this process; returns (counts, executable).
+        """
+        return self._drive(self._simulation_stages(logical_circuit, shots, seed, method, precision, resample))
+
+    def _run(self, executable, shots: int, seed: Optional[int], method: Optional[str],
+             precision: Optional[str] = None) -> Dict[str, int]:
+        if method == "statevector":
+            # The default backend already simulates these circuits as statevectors
+            method = None
+        overrides = {k: v for k, v in (("method", method), ("precision", precision)) if v is not None}
+        return self.simulator.run(executable, shots=shots, seed=seed, **overrides)
+
+    def _statevector(self, executable, precision: Optional[str] = None):
+        if precision is None:
+            return self.simulator.run_statevector(executable)
+        return self.simulator.run_statevector(executable, precision=precision)
+
+    def _check_statevector_limit(self, logical_circuit: LogicalCircuit):
+        limit = self.method_qubit_limits.get("statevector")
+        if limit is not None and len(logical_circuit.qubits) > limit:
+            raise ValueError(
+                f"Statevector of {len(logical_circuit.qubits)} qubits exceeds the limit of {limit} qubits."
+            )
+
+    def _can_resample(self, logical_circuit: LogicalCircuit, method: Optional[str] = None,
+                      precision: Optional[str] = None) -> bool:
+        num_qubits = len(logical_circuit.qubits)
+        if not logical_circuit.measurements or num_qubits > self.resample_max_qubits or precision is not None:
+            return False
+        if not self._ideal:
+            return False
+        if method in (None, "statevector") or self.admission is None:
+            return True
+        # The distribution comes from a full statevector, which must fit the budget too
+        budget = self.admission.budget_bytes()
+        estimate = CostEstimator.estimate(num_qubits, len(logical_circuit.gates), "statevector", self.precision)
+        return budget is None or estimate.memory_bytes <= budget
+
+    def _has_distribution(self, logical_circuit: LogicalCircuit) -> bool:
+        with self._distribution_lock:
+            return self._circuit_key(logical_circuit) in self._distributions
+
+    def _distribution(self, logical_circuit: LogicalCircuit, executable=None):
+        """
+        Returns (outcome distribution, executable circuit), computing the
+        statevector only the first time a circuit structure is seen.
+        """
+        key = self._circuit_key(logical_circuit)
+        with self._distribution_lock:
+            if key in self._distributions:
+                self._distributions.move_to_end(key)
+                return self._distributions[key]
+
+        logger.info("Computing measurement distribution...")
+        if executable is None:
+            executable = self._prepare(logical_circuit)
+        statevector = self.simulator.run_statevector(executable)
+        entry = (measurement_distribution(statevector, logical_circuit.measurements), executable)
+
+        with self._distribution_lock:
+            if key not in self._distributions:
+                self._distributions[key] = entry
+                self._distribution_bytes += entry[0].nbytes
+            # Keep the newest entry even if it alone exceeds the byte budget
+            while len(self._distributions) > 1 and (
+                    len(self._distributions) > self.distribution_cache_size
+                    or self._distribution_bytes > self.distribution_cache_bytes):
+                _, (evicted, _) = self._distributions.popitem(last=False)
+                self._distribution_bytes -= evicted.nbytes
+        return entry
+
+    @staticmethod
+    def _circuit_key(logical_circuit: LogicalCircuit) -> str:
+        # Maintained incrementally by the circuit: O(1) for already-hashed gates
+        return logical_circuit.fingerprint()
+
+    @staticmethod
+    def _ensure_bound(logical_circuit: LogicalCircuit):
+        unbound = logical_circuit.parameters
+        if unbound:
+            names = [param.name for param in unbound]
+            raise ValueError(f"Circuit has unbound parameters {names}. Use run_parameter_sweep() or bind_parameters().")
@@ -1,3 +1,4 @@
+from typing import Optional
 from ..infrastructure.logger import infra_logger
 
 class CircuitValidator:
@@ -5,10 +6,10 @@ class CircuitValidator:
     Validates circuit parameters and operations.
     """
     @staticmethod
-    def validate_qubit_count(count: int, max_qubits: int):
+    def validate_qubit_count(count: int, max_qubits: Optional[int] = None):
         if count <= 0:
             raise ValueError("Qubit count must be positive.")
-        if count > max_qubits:
+        if max_qubits is not None and count > max_qubits:
             raise ValueError(f"Qubit count exceeds hardware limit of {max_qubits}.")
 
     @staticmethod
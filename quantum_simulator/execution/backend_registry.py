@@ -0,0 +1,73 @@
+import json
+import threading
+from typing import Dict, Tuple
+from qiskit_aer import Aer
+from ..infrastructure.logger import infra_logger
+
+class BackendRegistry:
+    """
+    Process-wide registry of configured Aer backends.
+
+    Each (backend name, options) pair is constructed and configured exactly
+    once; later requests receive the same shared instance. Options are fixed
+    at construction time, so callers must never call set_options() on a
+    shared backend (pass per-run options to backend.run() instead).
+    Safe to use from multiple threads.
+    """
+    def __init__(self):
+        self._backends: Dict[Tuple, object] = {}
+        self._lock = threading.Lock()
+
+    def get(self, backend_name: str = "aer_simulator", **options):
+        """
+        Returns the shared backend instance for the given name and options.
+        Options set to None are ignored so they fall back to Aer defaults.
+        """
+        options = {k: v for k, v in options.items() if v is not None}
+        key = (backend_name, tuple(sorted((name, _option_key(value)) for name, value in options.items())))
+
+        with self._lock:
+            backend = self._backends.get(key)
+            if backend is None:
+                backend = Aer.get_backend(backend_name)
+                if options:
+                    backend.set_options(**options)
+                self._backends[key] = backend
+                infra_logger.info(f"Created backend {backend_name} with options {options or 'default'}")
+            return backend
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._backends)
+
+    def clear(self):
+        """
+        Forgets all shared instances (mainly useful for tests).
+        """
+        with self._lock:
+            self._backends.clear()
+
+def _option_key(value):
+    """
+    Hashable, canonical form of an option value. Unhashable values (noise
+    models, coupling maps as lists, basis gate lists, ...) are compared by
+    content through their JSON form (to_dict() where available).
+    """
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        pass
+    if hasattr(value, "to_dict"):
+        value = value.to_dict()
+    return json.dumps(value, sort_keys=True, default=_json_default)
+
+def _json_default(value):
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    if isinstance(value, complex):
+        return [value.real, value.imag]
+    return repr(value)
+
+# Global registry shared by every SimulatorBackend in the process
+backend_registry = BackendRegistry()
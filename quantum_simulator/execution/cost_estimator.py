@@ -0,0 +1,58 @@
+from dataclasses import dataclass
+
+# Bytes per complex amplitude at each simulation precision
+BYTES_PER_AMPLITUDE = {"double": 16, "single": 8}
+
+@dataclass(frozen=True)
+class CostEstimate:
+    """
+    Predicted peak memory and approximate runtime of one simulation run.
+    """
+    method: str
+    precision: str
+    memory_bytes: int
+    runtime_seconds: float
+
+class CostEstimator:
+    """
+    Predicts the cost of a run from its size, simulation method, precision
+    and shot count, without simulating anything.
+
+    The throughput constants are rough single-core figures: the estimates
+    are meant to separate "instant" from "minutes" and "fits" from "swaps",
+    not to be precise.
+    """
+    # Amplitude (or tensor element) updates per second
+    UPDATES_PER_SECOND = 2e8
+    # The simulator's state plus the copy handed back to Python
+    STATEVECTOR_COPIES = 2
+
+    @staticmethod
+    def estimate(num_qubits: int, num_gates: int, method: str = "statevector", precision: str = "double",
+                 shots: int = 1024, entangling_cut_gates: int = 0) -> CostEstimate:
+        """
+        Estimates a run. entangling_cut_gates bounds the number of two-qubit
+        gates crossing any cut of the qubit line; it sets the MPS bond
+        dimension (2^entangling_cut_gates, capped at 2^(num_qubits/2)).
+        """
+        if precision not in BYTES_PER_AMPLITUDE:
+            raise ValueError(f"Unknown precision: {precision}")
+        amplitude_bytes = BYTES_PER_AMPLITUDE[precision]
+        rate = CostEstimator.UPDATES_PER_SECOND
+
+        if method == "stabilizer":
+            # 2n x 2n bit tableau; each measured shot walks the tableau
+            memory = (2 * num_qubits) * (2 * num_qubits + 1) // 8
+            runtime = (num_gates * num_qubits + shots * num_qubits ** 2) / rate
+        elif method == "matrix_product_state":
+            bond = 2 ** min(entangling_cut_gates, num_qubits // 2)
+            memory = num_qubits * 2 * bond ** 2 * amplitude_bytes
+            runtime = (num_gates * bond ** 3 + shots * num_qubits * bond ** 2) / rate
+        elif method == "statevector":
+            amplitudes = 2 ** num_qubits
+            memory = CostEstimator.STATEVECTOR_COPIES * amplitudes * amplitude_bytes
+            runtime = (max(num_gates, 1) * amplitudes + shots * num_qubits) / rate
+        else:
+            raise ValueError(f"Unknown simulation method: {method}")
+
+        return CostEstimate(method=method, precision=precision, memory_bytes=int(memory), runtime_seconds=runtime)
@@ -1,28 +1,183 @@
+import threading
+from typing import Callable, Dict, List, Optional, Union
 from qiskit_ibm_runtime import QiskitRuntimeService, Sampler, Session
-from .logger import infra_logger
+from .transpile_cache import TranspileCache
+from ..infrastructure.logger import infra_logger
+
+# Session states in which no further jobs are accepted
+_INACTIVE_SESSION_STATES = ("Closed", "In progress, not accepting new jobs")
+
+def pub_counts(pub_result) -> Dict[str, int]:
+    """
+    Converts one sampler PUB result into Qiskit-style counts, merging all
+    classical registers (same format as SimulatorBackend.run()).
+    """
+    return dict(pub_result.join_data().get_counts())
+
+class RuntimeSessionManager:
+    """
+    Keeps one runtime session (and its sampler) open across calls.
+
+    Opening a session and waiting for it to be scheduled is paid once;
+    subsequent jobs go straight into the open session. A session that has
+    been closed or has stopped accepting jobs (e.g. its max_time expired)
+    is replaced transparently on the next request. Thread-safe.
+    """
+    def __init__(self, backend, max_time: Optional[Union[int, str]] = None,
+                 session_factory: Optional[Callable] = None, sampler_factory: Optional[Callable] = None):
+        self.backend = backend
+        self.max_time = max_time
+        self._session_factory = session_factory or (lambda b: Session(backend=b, max_time=max_time))
+        self._sampler_factory = sampler_factory or (lambda session: Sampler(mode=session))
+        self._session = None
+        self._sampler = None
+        self._lock = threading.Lock()
+        self.sessions_opened = 0
+
+    def sampler(self):
+        """
+        Returns the sampler bound to the open session, opening one if needed.
+        """
+        with self._lock:
+            if self._session is None or not self._is_active(self._session):
+                self._open()
+            return self._sampler
+
+    def reset(self):
+        """
+        Forgets the current session so the next request opens a fresh one.
+        """
+        with self._lock:
+            self._close()
+
+    def expired(self) -> bool:
+        """
+        True only if the open session reports that it no longer accepts jobs
+        (an unreachable session is not assumed to have expired).
+        """
+        with self._lock:
+            if self._session is None:
+                return False
+            try:
+                return self._session.status() in _INACTIVE_SESSION_STATES
+            except Exception:
+                return False
+
+    def close(self):
+        self.reset()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ---------- Internals ----------
+    def _open(self):
+        self._close()
+        self._session = self._session_factory(self.backend)
+        self._sampler = self._sampler_factory(self._session)
+        self.sessions_opened += 1
+        infra_logger.info(f"Opened runtime session on {getattr(self.backend, 'name', self.backend)}.")
+
+    def _close(self):
+        session, self._session, self._sampler = self._session, None, None
+        if session is not None:
+            try:
+                session.close()
+            except Exception as e:
+                infra_logger.warning(f"Failed to close runtime session cleanly: {e}")
+
+    @staticmethod
+    def _is_active(session) -> bool:
+        try:
+            return session.status() not in _INACTIVE_SESSION_STATES
+        except Exception:
+            return False
 
 class HardwareBackend:
     """
     Handles execution on real IBM Quantum hardware or IBM cloud simulators.
-    Requires a valid IBM API token.
+    Requires a valid IBM API token (or an already connected service).
+
+    Jobs run inside a long-lived session managed by RuntimeSessionManager,
+    and a list of circuits is submitted as a single multi-PUB sampler job.
+    service, session_factory and sampler_factory can be injected, e.g. to
+    exercise the backend offline against a stub service.
     """
-    def __init__(self, token: str, backend_name: str = "ibm_brisbane"):
+    def __init__(self, token: Optional[str] = None, backend_name: str = "ibm_brisbane", service=None,
+                 session_factory: Optional[Callable] = None, sampler_factory: Optional[Callable] = None,
+                 max_session_time: Optional[Union[int, str]] = None,
+                 transpile_cache: Optional[TranspileCache] = None):
+        self.sessions = None
+        self.transpile_cache = transpile_cache or TranspileCache()
         try:
-            self.service = QiskitRuntimeService(channel="ibm_quantum", token=token)
+            self.service = service or QiskitRuntimeService(channel="ibm_quantum", token=token)
             self.backend = self.service.backend(backend_name)
         except Exception as e:
             infra_logger.error(f"Failed to connect to IBM Quantum: {e}")
             self.backend = None
+            return
+        self.sessions = RuntimeSessionManager(
+            self.backend, max_time=max_session_time,
+            session_factory=session_factory, sampler_factory=sampler_factory
+        )
+
+    def run(self, qiskit_circ, shots: int = 1024) -> Optional[Dict[str, int]]:
+        """
+        Submits a job to IBM Quantum and returns its counts.
+        """
+        results = self.run_batch([qiskit_circ], shots=shots)
+        return None if results is None else results[0]
 
-    def run(self, qiskit_circ, shots: int = 1024):
+    def run_batch(self, qiskit_circs: List, shots: int = 1024) -> Optional[List[Dict[str, int]]]:
         """
-        Submits a job to IBM Quantum.
+        Submits many circuits as one multi-PUB sampler job in the shared
+        session. Returns the counts of each circuit, in input order.
+        """
+        job = self.submit(qiskit_circs, shots=shots)
+        if job is None:
+            return None
+        return self.job_counts(job)
+
+    def submit(self, qiskit_circs: List, shots: int = 1024):
+        """
+        Transpiles the circuits for the device and submits them without
+        waiting. Returns the runtime job, or None if no backend is available.
         """
         if not self.backend:
             infra_logger.error("No backend available for hardware execution.")
             return None
-        
-        with Session(service=self.service, backend=self.backend) as session:
-            sampler = Sampler(session=session)
-            job = sampler.run(qiskit_circ, shots=shots)
-            return job.result()
+        isa_circuits = self.transpile_cache.transpile_many(list(qiskit_circs), self.backend)
+        try:
+            job = self.sessions.sampler().run(isa_circuits, shots=shots)
+        except Exception as e:
+            # Only a session that expired server-side is known to have rejected
+            # the job; any other failure may have queued it, so never resubmit
+            if not self.sessions.expired():
+                raise
+            infra_logger.warning(f"Session expired during submission ({e}); retrying in a fresh one.")
+            self.sessions.reset()
+            job = self.sessions.sampler().run(isa_circuits, shots=shots)
+        infra_logger.info(f"Submitted hardware job {job.job_id()} with {len(isa_circuits)} circuits.")
+        return job
+
+    def retrieve(self, job_id: str):
+        """
+        Looks up a previously submitted job by ID (e.g. after a restart).
+        """
+        return self.service.job(job_id)
+
+    @staticmethod
+    def job_counts(job) -> List[Dict[str, int]]:
+        """
+        Waits for a job and returns the counts of each of its circuits.
+        """
+        return [pub_counts(pub_result) for pub_result in job.result()]
+
+    def close(self):
+        """
+        Closes the shared session.
+        """
+        if self.sessions:
+            self.sessions.close()
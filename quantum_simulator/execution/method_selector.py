@@ -0,0 +1,28 @@
+from typing import Dict
+from ..quantum_abstraction.circuit_analysis import CircuitAnalyzer, CircuitProfile
+
+# Aer simulation method for each circuit category
+METHOD_BY_CATEGORY = {
+    CircuitAnalyzer.CLIFFORD: "stabilizer",
+    CircuitAnalyzer.LOW_ENTANGLEMENT: "matrix_product_state",
+    CircuitAnalyzer.GENERAL: "statevector",
+}
+
+# Methods that execute our logical gate set natively. Transpiling against
+# their very wide targets (thousands of qubits) would cost seconds, so
+# circuits are submitted to them untranspiled.
+NATIVE_GATE_SET_METHODS = ("stabilizer", "matrix_product_state")
+
+def select_method(profile: CircuitProfile, qubit_limits: Dict[str, int]) -> str:
+    """
+    Picks the Aer method for a circuit profile and enforces that method's
+    qubit limit (methods missing from qubit_limits are unbounded).
+    """
+    method = METHOD_BY_CATEGORY[profile.category]
+    limit = qubit_limits.get(method)
+    if limit is not None and profile.num_qubits > limit:
+        raise ValueError(
+            f"{profile.category} circuit with {profile.num_qubits} qubits exceeds "
+            f"the {method} limit of {limit} qubits."
+        )
+    return method
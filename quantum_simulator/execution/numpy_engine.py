@@ -0,0 +1,146 @@
+import numpy as np
+from typing import Dict, List, Optional, Sequence
+from .sampling import measurement_distribution, sample_counts
+from .seeding import derive_seeds
+from ..quantum_abstraction.circuit_builder import QuantumCircuit as LogicalCircuit
+from ..quantum_abstraction.gates import Gate, CNOTGate, SwapGate
+
+# State dtype for each simulation precision
+COMPLEX_DTYPES = {"double": np.complex128, "single": np.complex64}
+
+def _index(ndim: int, fixed: Dict[int, int]) -> tuple:
+    """
+    Builds an index selecting the given bit on each fixed axis.
+    Length-1 slices keep every axis, so the result is always a writable view
+    (plain integers would yield a copied scalar for single-qubit states).
+    """
+    return tuple(slice(fixed[axis], fixed[axis] + 1) if axis in fixed else slice(None) for axis in range(ndim))
+
+class NumpyStatevectorBackend:
+    """
+    Native statevector simulator written in pure NumPy.
+
+    Consumes logical circuits directly (no Qiskit translation or transpile),
+    which makes it much cheaper than Aer for small educational circuits and
+    lets a process simulate without importing qiskit at all.
+
+    The state is stored as a rank-N tensor of shape (2,)*N. Qubit q lives on
+    axis N-1-q, so flattening the tensor gives Qiskit's little-endian order.
+    Gates are applied in place on views of that tensor, in the dtype of the
+    state: precision="single" keeps it complex64, halving memory traffic.
+    """
+    name = "numpy_statevector"
+
+    def __init__(self, precision: str = "double"):
+        if precision not in COMPLEX_DTYPES:
+            raise ValueError(f"Unknown precision: {precision}")
+        self.precision = precision
+
+    # ---------- Gate application ----------
+    @staticmethod
+    def initial_state(num_qubits: int, dtype=np.complex128) -> np.ndarray:
+        """
+        Returns |0...0⟩ as a rank-N tensor.
+        """
+        state = np.zeros((2,) * num_qubits, dtype=dtype)
+        state[(0,) * num_qubits] = 1
+        return state
+
+    @staticmethod
+    def apply_gate(state: np.ndarray, gate: Gate):
+        """
+        Applies a logical gate to the state tensor in place.
+        """
+        n = state.ndim
+        if isinstance(gate, CNOTGate):
+            control, target = n - 1 - gate.control.index, n - 1 - gate.target.index
+            NumpyStatevectorBackend._swap(state, _index(n, {control: 1, target: 0}), _index(n, {control: 1, target: 1}))
+        elif isinstance(gate, SwapGate):
+            a, b = n - 1 - gate.q1.index, n - 1 - gate.q2.index
+            NumpyStatevectorBackend._swap(state, _index(n, {a: 0, b: 1}), _index(n, {a: 1, b: 0}))
+        elif gate.matrix is None:
+            raise ValueError(f"{type(gate).__name__} has no matrix, so the native engine cannot apply it.")
+        else:
+            NumpyStatevectorBackend._apply_single(state, gate.matrix, n - 1 - gate.targets[0].index)
+
+    @staticmethod
+    def _swap(state: np.ndarray, idx_a: tuple, idx_b: tuple):
+        tmp = state[idx_a].copy()
+        state[idx_a] = state[idx_b]
+        state[idx_b] = tmp
+
+    @staticmethod
+    def _apply_single(state: np.ndarray, matrix: np.ndarray, axis: int):
+        zero = state[_index(state.ndim, {axis: 0})]
+        one = state[_index(state.ndim, {axis: 1})]
+        # Matching dtypes avoid upcasting a single-precision state
+        (m00, m01), (m10, m11) = matrix.astype(state.dtype, copy=False)
+
+        if m01 == 0 and m10 == 0:
+            # Diagonal gates (Z, S, T, RZ): pure phase multiplication
+            if m00 != 1:
+                zero *= m00
+            if m11 != 1:
+                one *= m11
+        elif m00 == 0 and m11 == 0:
+            # Anti-diagonal gates (X, Y): swap with phases
+            tmp = zero.copy()
+            np.multiply(one, m01, out=zero)
+            np.multiply(tmp, m10, out=one)
+        else:
+            tmp = zero.copy()
+            zero *= m00
+            zero += m01 * one
+            one *= m11
+            one += m10 * tmp
+
+    # ---------- Backend interface ----------
+    def statevector(self, logical_circuit: LogicalCircuit, precision: Optional[str] = None) -> np.ndarray:
+        """
+        Returns the flat (little-endian) statevector of the circuit's gates,
+        at the backend's precision unless overridden.
+        """
+        state = self.initial_state(len(logical_circuit.qubits), COMPLEX_DTYPES[precision or self.precision])
+        for gate in logical_circuit.gates:
+            self.apply_gate(state, gate)
+        return state.reshape(-1)
+
+    def run(self, logical_circuit: LogicalCircuit, shots: int = 1024, seed: Optional[int] = None,
+            precision: Optional[str] = None) -> Dict[str, int]:
+        """
+        Simulates the circuit and samples measurement counts from the final state.
+        """
+        if not logical_circuit.measurements:
+            raise ValueError("Circuit has no measurements; nothing to count.")
+        statevector = self.statevector(logical_circuit, precision)
+        distribution = measurement_distribution(statevector, logical_circuit.measurements)
+        return sample_counts(distribution, len(logical_circuit.measurements), shots, seed)
+
+    def run_batch(self, logical_circuits: List[LogicalCircuit], shots: int = 1024,
+                  seed: Optional[int] = None) -> List[Dict[str, int]]:
+        """
+        Runs each circuit in turn (circuit i sampled with the i-th seed
+        derived from seed); returns counts in input order.
+        """
+        seeds = derive_seeds(seed, len(logical_circuits))
+        return [self.run(circuit, shots=shots, seed=s) for circuit, s in zip(logical_circuits, seeds)]
+
+    def run_parameterized(self, logical_circuit: LogicalCircuit, parameter_binds: Dict[str, Sequence[float]],
+                          shots: int = 1024, seed: Optional[int] = None) -> List[Dict[str, int]]:
+        """
+        Runs the circuit once per set of bound parameter values.
+        """
+        names = [param.name for param in logical_circuit.parameters]
+        num_experiments = len(parameter_binds[names[0]]) if names else 1
+        seeds = derive_seeds(seed, num_experiments)
+        return [
+            self.run(logical_circuit.bind_parameters({name: parameter_binds[name][i] for name in names}),
+                     shots=shots, seed=seeds[i])
+            for i in range(num_experiments)
+        ]
+
+    def run_statevector(self, logical_circuit: LogicalCircuit, precision: Optional[str] = None) -> np.ndarray:
+        """
+        Returns the pre-measurement statevector (measurements are ignored).
+        """
+        return self.statevector(logical_circuit, precision)
@@ -1,9 +1,19 @@
+from typing import Callable, Dict
+import numpy as np
 from qiskit import QuantumCircuit as QiskitCircuit
+from qiskit.circuit import CircuitInstruction, Measure, Parameter as QiskitParameter
+from qiskit.circuit.library import (
+    HGate, XGate, YGate, ZGate, TGate as QiskitTGate, SGate, CXGate, SwapGate as QiskitSwapGate,
+    RXGate as QiskitRXGate, RYGate as QiskitRYGate, RZGate as QiskitRZGate,
+    UnitaryGate as QiskitUnitaryGate
+)
 from .simulator_backend import SimulatorBackend
 from ..quantum_abstraction.circuit_builder import QuantumCircuit as LogicalCircuit
+from ..quantum_abstraction.compact_circuit import CompactCircuit, GATE_CLASSES
+from ..quantum_abstraction.parameter import Parameter
 from ..quantum_abstraction.gates import (
     HadamardGate, PauliXGate, PauliYGate, PauliZGate, CNOTGate,
-    TGate, PhaseGate, RXGate, RYGate, RZGate, SwapGate
+    TGate, PhaseGate, RotationGate, RXGate, RYGate, RZGate, SwapGate, UnitaryGate
 )
 
 class QiskitEngine:
@@ -19,82 +29,147 @@ class QiskitEngine:
         pass
 
     @staticmethod
-    def translate_to_qiskit(logical_circuit: LogicalCircuit) -> QiskitCircuit:
+    def _angle(theta, symbols: dict):
         """
-        Translates a logical circuit to a Qiskit circuit without measurement validation.
-        Pure translation for visualization purposes.
+        Maps a logical angle to a Qiskit angle.
+        Named parameters become Qiskit Parameters, one per name and circuit.
         """
-        # Create circuit with just qubits initially
-        num_qubits = len(logical_circuit.qubits)
-        # Only add classical bits if there are measurements
-        num_clbits = len(logical_circuit.measurements) if logical_circuit.measurements else 0
-        
-        qiskit_circ = QiskitCircuit(num_qubits, num_clbits)
-        
-        for gate in logical_circuit.gates:
-            if isinstance(gate, HadamardGate):
-                qiskit_circ.h(gate.targets[0].index)
-            elif isinstance(gate, PauliXGate):
-                qiskit_circ.x(gate.targets[0].index)
-            elif isinstance(gate, PauliYGate):
-                qiskit_circ.y(gate.targets[0].index)
-            elif isinstance(gate, PauliZGate):
-                qiskit_circ.z(gate.targets[0].index)
-            elif isinstance(gate, TGate):
-                qiskit_circ.t(gate.targets[0].index)
-            elif isinstance(gate, PhaseGate):
-                qiskit_circ.s(gate.targets[0].index)
-            elif isinstance(gate, RXGate):
-                qiskit_circ.rx(gate.theta, gate.targets[0].index)
-            elif isinstance(gate, RYGate):
-                qiskit_circ.ry(gate.theta, gate.targets[0].index)
-            elif isinstance(gate, RZGate):
-                qiskit_circ.rz(gate.theta, gate.targets[0].index)
-            elif isinstance(gate, CNOTGate):
-                qiskit_circ.cx(gate.control.index, gate.target.index)
-            elif isinstance(gate, SwapGate):
-                qiskit_circ.swap(gate.q1.index, gate.q2.index)
-        
-        # Add measurements if they exist
-        if num_clbits > 0:
-            for i, qubit_index in enumerate(logical_circuit.measurements):
-                qiskit_circ.measure(qubit_index, i)
-            
-        return qiskit_circ
+        if isinstance(theta, Parameter):
+            if theta.name not in symbols:
+                symbols[theta.name] = QiskitParameter(theta.name)
+            return symbols[theta.name]
+        return theta
+
+    @staticmethod
+    def register(gate_class: type, builder: Callable):
+        """
+        Registers the Qiskit translation of a logical gate class.
+
+        builder(gate, angle) returns the Qiskit operation for one gate;
+        angle(theta) maps a logical angle (float or Parameter) to a Qiskit
+        one. Operands are taken from gate.targets, in order. This is the only
+        place a new gate type needs to be declared for translation.
+        """
+        _TRANSLATORS[gate_class] = builder
+
+    @staticmethod
+    def _builder(gate_class: type) -> Callable:
+        builder = _TRANSLATORS.get(gate_class)
+        if builder is None:
+            # Subclasses of registered gates translate like their parent
+            for base in gate_class.__mro__[1:]:
+                if base in _TRANSLATORS:
+                    builder = _TRANSLATORS[gate_class] = _TRANSLATORS[base]
+                    break
+            else:
+                raise ValueError(f"No Qiskit translation registered for {gate_class.__name__}.")
+        return builder
 
     @staticmethod
     def translate(logical_circuit: LogicalCircuit) -> QiskitCircuit:
         """
         Translates a logical circuit to a Qiskit circuit.
+
+        Each gate is looked up in the dispatch table once and the resulting
+        instructions are appended in bulk, skipping QuantumCircuit's
+        per-call argument broadcasting, so the cost per gate is flat.
         """
+        if isinstance(logical_circuit, CompactCircuit):
+            return QiskitEngine._translate_compact(logical_circuit)
         num_qubits = len(logical_circuit.qubits)
         qiskit_circ = QiskitCircuit(num_qubits, len(logical_circuit.measurements))
-        
+        qubits = qiskit_circ.qubits
+        symbols = {}
+        angle = lambda theta: QiskitEngine._angle(theta, symbols)
+        builders = {}
+
+        instructions = []
         for gate in logical_circuit.gates:
-            if isinstance(gate, HadamardGate):
-                qiskit_circ.h(gate.targets[0].index)
-            elif isinstance(gate, PauliXGate):
-                qiskit_circ.x(gate.targets[0].index)
-            elif isinstance(gate, PauliYGate):
-                qiskit_circ.y(gate.targets[0].index)
-            elif isinstance(gate, PauliZGate):
-                qiskit_circ.z(gate.targets[0].index)
-            elif isinstance(gate, TGate):
-                qiskit_circ.t(gate.targets[0].index)
-            elif isinstance(gate, PhaseGate):
-                qiskit_circ.s(gate.targets[0].index)
-            elif isinstance(gate, RXGate):
-                qiskit_circ.rx(gate.theta, gate.targets[0].index)
-            elif isinstance(gate, RYGate):
-                qiskit_circ.ry(gate.theta, gate.targets[0].index)
-            elif isinstance(gate, RZGate):
-                qiskit_circ.rz(gate.theta, gate.targets[0].index)
-            elif isinstance(gate, CNOTGate):
-                qiskit_circ.cx(gate.control.index, gate.target.index)
-            elif isinstance(gate, SwapGate):
-                qiskit_circ.swap(gate.q1.index, gate.q2.index)
-        
+            gate_class = type(gate)
+            builder = builders.get(gate_class)
+            if builder is None:
+                builder = builders[gate_class] = QiskitEngine._builder(gate_class)
+            operands = tuple(qubits[q.index] for q in gate.targets)
+            instructions.append(CircuitInstruction(builder(gate, angle), operands))
+
+        measure = Measure()
+        clbits = qiskit_circ.clbits
         for i, qubit_index in enumerate(logical_circuit.measurements):
-            qiskit_circ.measure(qubit_index, i)
-            
+            instructions.append(CircuitInstruction(measure, (qubits[qubit_index],), (clbits[i],)))
+
+        for instruction in instructions:
+            qiskit_circ._append(instruction)
         return qiskit_circ
+
+    @staticmethod
+    def _translate_compact(circuit: CompactCircuit) -> QiskitCircuit:
+        """
+        Translates a CompactCircuit column-wise, without a Gate object per
+        gate. Builders run once per opcode, and for rotations once per
+        distinct angle or parameter; np.unique maps every gate to its
+        operation and operand tuple, so only the final append loop is per gate.
+        """
+        num_qubits = len(circuit.qubits)
+        qiskit_circ = QiskitCircuit(num_qubits, len(circuit.measurements))
+        qubits = qiskit_circ.qubits
+        symbols = {}
+        angle = lambda theta: QiskitEngine._angle(theta, symbols)
+        opcodes, first, second = circuit.opcodes, circuit.first_qubits, circuit.second_qubits
+        angles, parameter_ids = circuit.angles, circuit.parameter_ids
+        gates = circuit.gates
+
+        operations = np.empty(len(opcodes), dtype=object)
+        for opcode in np.unique(opcodes).tolist():
+            gate_class = GATE_CLASSES[opcode]
+            builder = QiskitEngine._builder(gate_class)
+            positions = np.flatnonzero(opcodes == opcode)
+            if not issubclass(gate_class, RotationGate):
+                operations[positions] = _object_array([builder(gates[int(positions[0])], angle)])
+                continue
+            symbolic = parameter_ids[positions] >= 0
+            for group, keys in ((positions[~symbolic], angles), (positions[symbolic], parameter_ids)):
+                if group.size:
+                    _, representatives, inverse = np.unique(keys[group], return_index=True, return_inverse=True)
+                    built = _object_array([builder(gates[int(group[i])], angle) for i in representatives.tolist()])
+                    operations[group] = built[inverse.ravel()]
+
+        # One operand tuple per distinct (first, second) pair
+        pair_keys = np.where(second < 0, first, num_qubits + first.astype(np.int64) * num_qubits + second)
+        pairs, representatives, inverse = np.unique(pair_keys, return_index=True, return_inverse=True)
+        operand_table = _object_array([
+            (qubits[a],) if b < 0 else (qubits[a], qubits[b])
+            for a, b in zip(first[representatives].tolist(), second[representatives].tolist())
+        ])
+
+        append = qiskit_circ._append
+        for operation, operands in zip(operations.tolist(), operand_table[inverse.ravel()].tolist()):
+            append(CircuitInstruction(operation, operands))
+
+        measure = Measure()
+        clbits = qiskit_circ.clbits
+        for i, qubit_index in enumerate(circuit.measurements):
+            append(CircuitInstruction(measure, (qubits[qubit_index],), (clbits[i],)))
+        return qiskit_circ
+
+    # Translation is pure, so visualization uses the same code path
+    translate_to_qiskit = translate
+
+def _object_array(items) -> np.ndarray:
+    # Filled element by element: Qiskit gates and tuples would otherwise be
+    # unpacked into array dimensions by NumPy
+    array = np.empty(len(items), dtype=object)
+    for i, item in enumerate(items):
+        array[i] = item
+    return array
+
+# Logical gate class -> builder(gate, angle) returning the Qiskit operation.
+# Fixed gates reuse one (immutable, singleton) Qiskit gate instance.
+_TRANSLATORS: Dict[type, Callable] = {}
+for _gate_class, _operation in (
+    (HadamardGate, HGate()), (PauliXGate, XGate()), (PauliYGate, YGate()), (PauliZGate, ZGate()),
+    (TGate, QiskitTGate()), (PhaseGate, SGate()), (CNOTGate, CXGate()), (SwapGate, QiskitSwapGate()),
+):
+    QiskitEngine.register(_gate_class, lambda gate, angle, op=_operation: op)
+for _gate_class, _rotation in ((RXGate, QiskitRXGate), (RYGate, QiskitRYGate), (RZGate, QiskitRZGate)):
+    QiskitEngine.register(_gate_class, lambda gate, angle, rotation=_rotation: rotation(angle(gate.theta)))
+QiskitEngine.register(UnitaryGate, lambda gate, angle: QiskitUnitaryGate(gate.matrix, check_input=False))
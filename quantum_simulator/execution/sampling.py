@@ -0,0 +1,49 @@
+import numpy as np
+from typing import Dict, List, Optional
+
+def measurement_distribution(statevector, measured_qubits: List[int]) -> np.ndarray:
+    """
+    Computes the probability of every measurement outcome of the given qubits.
+
+    Index i of the result is the outcome where classical bit c holds bit c of i,
+    classical bit c being the measurement of measured_qubits[c] (Qiskit's
+    convention). Qubits not measured are marginalized out.
+    """
+    state = np.asarray(statevector).reshape(-1)
+    num_qubits = int(state.size).bit_length() - 1
+    probabilities = (state.real ** 2 + state.imag ** 2).reshape((2,) * num_qubits)
+
+    # Qubit q lives on tensor axis num_qubits-1-q (little-endian flattening)
+    unique_qubits = list(dict.fromkeys(measured_qubits))
+    measured_axes = {num_qubits - 1 - q for q in unique_qubits}
+    unmeasured_axes = tuple(axis for axis in range(num_qubits) if axis not in measured_axes)
+    marginal = probabilities.sum(axis=unmeasured_axes) if unmeasured_axes else probabilities
+
+    # Reorder the remaining axes so the last measured bit is the most significant
+    remaining_axes = sorted(measured_axes)
+    marginal = marginal.transpose([remaining_axes.index(num_qubits - 1 - q) for q in reversed(unique_qubits)])
+    # Normalize in double precision even for single-precision states, so the
+    # probabilities pass the multinomial sampler's sum check
+    distribution = marginal.reshape(-1).astype(np.float64)
+
+    if len(unique_qubits) != len(measured_qubits):
+        # The same qubit measured into several classical bits: spread the
+        # outcome over the full classical register
+        expanded = np.zeros(2 ** len(measured_qubits))
+        position = {q: i for i, q in enumerate(unique_qubits)}
+        for outcome, probability in enumerate(distribution):
+            index = sum(((outcome >> position[q]) & 1) << c for c, q in enumerate(measured_qubits))
+            expanded[index] += probability
+        distribution = expanded
+
+    return distribution / distribution.sum()
+
+def sample_counts(distribution: np.ndarray, num_clbits: int, shots: int,
+                  seed: Optional[int] = None) -> Dict[str, int]:
+    """
+    Draws shots from an outcome distribution with one vectorized multinomial draw.
+    Returns Qiskit-style counts (bitstrings of num_clbits, most significant first).
+    """
+    rng = np.random.default_rng(seed)
+    outcomes = rng.multinomial(shots, distribution)
+    return {format(int(index), f"0{num_clbits}b"): int(outcomes[index]) for index in np.flatnonzero(outcomes)}
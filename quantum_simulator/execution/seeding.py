@@ -0,0 +1,58 @@
+import hashlib
+import threading
+from typing import Dict, List, Optional
+import numpy as np
+
+# Aer seeds experiment i of a multi-experiment job with
+# seed_simulator + i * AER_SEED_STRIDE
+AER_SEED_STRIDE = 2113
+
+def derive_seeds(seed: Optional[int], count: int) -> List[Optional[int]]:
+    """
+    Derives the seeds of count experiments run under one seed, e.g. one
+    per circuit of a batch, following Aer's multi-experiment convention:
+    experiment i gets seed + i * AER_SEED_STRIDE. A single Aer job seeded
+    with seed therefore samples circuit i exactly like a run of that circuit
+    alone with its derived seed, and the other engines reproduce it by
+    running circuit by circuit. Seeds depend only on the input seed and the
+    position, never on which worker runs what or when.
+    Returns Nones when seed is None.
+    """
+    if seed is None:
+        return [None] * count
+    return [seed + i * AER_SEED_STRIDE for i in range(count)]
+
+class SeedPolicy:
+    """
+    Hands out the seed of each run that was not given an explicit one.
+
+    With a base seed, a run receives a seed derived from the base seed, the
+    run's context (e.g. the circuit fingerprint and shot count) and how many
+    runs with that context came before it in the session. A whole session
+    therefore replays identically however its runs interleave, repeated runs
+    of one circuit still get distinct seeds, and the first run of a circuit
+    in a new session gets the seed it got before, so the result cache can
+    serve it. Without a base seed, every run is random (None). Thread-safe.
+    """
+    def __init__(self, base_seed: Optional[int] = None):
+        self.base_seed = base_seed
+        self._runs: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, seed: Optional[int] = None, *context) -> Optional[int]:
+        """
+        Returns seed if given, otherwise the policy's seed for the next run
+        with this context. Context values must have a stable repr (strings,
+        numbers, tuples of them).
+        """
+        if seed is not None or self.base_seed is None:
+            return seed
+        key = _context_key(context)
+        with self._lock:
+            run = self._runs.get(key, 0)
+            self._runs[key] = run + 1
+        return int(np.random.SeedSequence([self.base_seed, key, run]).generate_state(1)[0])
+
+def _context_key(context) -> int:
+    digest = hashlib.blake2b(repr(context).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
@@ -1,42 +1,165 @@
-from qiskit_aer import Aer
-from qiskit import transpile
-from typing import Dict
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+from .backend_registry import backend_registry
+from .transpile_cache import TranspileCache
+from .method_selector import NATIVE_GATE_SET_METHODS
+
+# Process-wide cache so every SimulatorBackend reuses earlier transpilations.
+_shared_transpile_cache = TranspileCache()
+
+# Options that also apply to the dedicated statevector simulator
+_STATEVECTOR_OPTIONS = ("max_parallel_threads", "precision")
 
 class SimulatorBackend:
     """
     Handles local simulation using Qiskit's Aer simulator.
+
+    Backends are shared process-wide through the backend registry, so creating
+    a SimulatorBackend is cheap; backend_options (e.g. max_parallel_threads,
+    precision, method) are applied once when the shared backend is built.
+
+    seed_transpiler fixes the transpiler's randomness for every circuit (it
+    is part of the transpile-cache key); per-run seeds set seed_simulator.
     """
-    def __init__(self, backend_name: str = "aer_simulator"):
-        self.backend = Aer.get_backend(backend_name)
+    def __init__(self, backend_name: str = "aer_simulator", transpile_cache: Optional[TranspileCache] = None,
+                 seed_transpiler: Optional[int] = None, **backend_options):
+        self.backend_name = backend_name
+        self.seed_transpiler = seed_transpiler
+        # Only passed when set, so unseeded backends share cache entries
+        self._transpile_options = {} if seed_transpiler is None else {"seed_transpiler": seed_transpiler}
+        self.backend_options = backend_options
+        self.backend = backend_registry.get(backend_name, **backend_options)
+        sv_options = {k: v for k, v in backend_options.items() if k in _STATEVECTOR_OPTIONS}
+        self.statevector_backend = backend_registry.get('statevector_simulator', **sv_options)
+        self.transpile_cache = transpile_cache or _shared_transpile_cache
+
+    def transpile(self, qiskit_circ, for_statevector: bool = False):
+        """
+        Returns the (cached) transpiled circuit that run() or run_statevector()
+        would execute, so callers can pay the transpile cost as a separate step.
+        """
+        if not for_statevector:
+            return self.transpile_cache.transpile(qiskit_circ, self.backend, **self._transpile_options)
+
+        # Remove measurements to get the coherent state
+        # (Statevector sim will fail or give collapsed, post-measurement state if measured)
+        # We want to see the state BEFORE measurement for education usually.
+        # So we create a copy without measurements.
+        circ_no_meas = qiskit_circ.copy()
+        circ_no_meas.remove_final_measurements()
+
+        # optimization_level=1 keeps trailing SWAPs: higher levels elide them into
+        # a final layout permutation, which would permute the returned amplitudes.
+        return self.transpile_cache.transpile(
+            circ_no_meas, self.statevector_backend, optimization_level=1, **self._transpile_options
+        )
+
+    def method_backend(self, method: Optional[str] = None, precision: Optional[str] = None):
+        """
+        Returns the shared backend configured for a specific Aer simulation
+        method (e.g. "stabilizer", "matrix_product_state", "statevector")
+        and/or precision ("double" or "single").
+        """
+        options = dict(self.backend_options)
+        if method is not None:
+            options["method"] = method
+        if precision is not None:
+            options["precision"] = precision
+        return backend_registry.get(self.backend_name, **options)
 
-    def run(self, qiskit_circ, shots: int = 1024) -> Dict[str, int]:
+    def run(self, qiskit_circ, shots: int = 1024, seed: Optional[int] = None,
+            method: Optional[str] = None, precision: Optional[str] = None) -> Dict[str, int]:
         """
         Executes the circuit on the local simulator.
-        
-        Transpilation is the process of rewriting a quantum circuit to match 
+
+        Transpilation is the process of rewriting a quantum circuit to match
         the topology and gate set of a specific quantum device.
+        Transpiled circuits are cached, so re-running a circuit skips this step.
+        method and precision override the backend's defaults for this run.
         """
-        transpiled_circuit = transpile(qiskit_circ, self.backend)
-        job = self.backend.run(transpiled_circuit, shots=shots)
+        if method is None and precision is None:
+            backend = self.backend
+        else:
+            backend = self.method_backend(method, precision)
+        if method in NATIVE_GATE_SET_METHODS:
+            transpiled_circuit = qiskit_circ
+        else:
+            transpiled_circuit = self.transpile_cache.transpile(qiskit_circ, backend, **self._transpile_options)
+        job = backend.run(transpiled_circuit, shots=shots, **self._run_options(seed))
         result = job.result()
         return result.get_counts()
 
-    def run_statevector(self, qiskit_circ):
+    def run_batch(self, qiskit_circs: List, shots: int = 1024, max_parallel_experiments: int = 0,
+                  seed: Optional[int] = None, method: Optional[str] = None,
+                  precision: Optional[str] = None) -> List[Dict[str, int]]:
+        """
+        Executes many circuits as a single multi-experiment Aer job.
+
+        All circuits are transpiled together and submitted at once, so the
+        per-job overhead is paid only once. max_parallel_experiments=0 lets
+        Aer run as many experiments in parallel as it has cores.
+        Aer seeds circuit i with the i-th of derive_seeds(seed), so its
+        counts equal run() of that circuit alone with that seed.
+        method and precision override the backend's defaults for the job.
+        Returns the counts of each circuit, in input order.
+        """
+        if not qiskit_circs:
+            return []
+        if method is None and precision is None:
+            backend = self.backend
+        else:
+            backend = self.method_backend(method, precision)
+        if method in NATIVE_GATE_SET_METHODS:
+            transpiled_circuits = list(qiskit_circs)
+        else:
+            transpiled_circuits = self.transpile_cache.transpile_many(qiskit_circs, backend, **self._transpile_options)
+        job = backend.run(transpiled_circuits, shots=shots, max_parallel_experiments=max_parallel_experiments,
+                          **self._run_options(seed))
+        result = job.result()
+        return [result.get_counts(i) for i in range(len(transpiled_circuits))]
+
+    def run_parameterized(self, qiskit_circ, parameter_binds: Dict[str, Sequence[float]],
+                          shots: int = 1024, seed: Optional[int] = None) -> List[Dict[str, int]]:
+        """
+        Executes a parameterized circuit for many parameter values in one job.
+
+        The circuit is transpiled once (with its parameters left symbolic) and
+        the value arrays are handed to Aer as parameter_binds, keyed by
+        parameter name. Returns one counts dictionary per bound value set.
+        """
+        transpiled_circuit = self.transpile_cache.transpile(qiskit_circ, self.backend, **self._transpile_options)
+        binds = {param: list(parameter_binds[param.name]) for param in transpiled_circuit.parameters}
+        num_experiments = len(next(iter(binds.values()))) if binds else 1
+
+        job = self.backend.run(transpiled_circuit, shots=shots, parameter_binds=[binds] if binds else None,
+                               **self._run_options(seed))
+        result = job.result()
+        return [result.get_counts(i) for i in range(num_experiments)]
+
+    def run_statevector(self, qiskit_circ, precision: Optional[str] = None):
         """
         Runs the circuit on a statevector simulator to get the full quantum state.
         Useful for educational visualizations (Bloch sphere).
+        Returns a flat NumPy array, complex128 at double precision and
+        complex64 at single precision (Aer hands results back as complex128),
+        like the native engine.
         """
-        # specialized backend for statevector
-        sv_backend = Aer.get_backend('statevector_simulator')
-        
-        # Remove measurements to get the coherent state
-        # (Statevector sim will fail or give collapsed, post-measurement state if measured)
-        # We want to see the state BEFORE measurement for education usually.
-        # So we create a copy without measurements.
-        circ_no_meas = qiskit_circ.copy()
-        circ_no_meas.remove_final_measurements() 
-
-        transpiled_circuit = transpile(circ_no_meas, sv_backend)
-        job = sv_backend.run(transpiled_circuit)
+        transpiled_circuit = self.transpile(qiskit_circ, for_statevector=True)
+        backend = self.statevector_backend
+        if precision is not None:
+            sv_options = {k: v for k, v in self.backend_options.items() if k in _STATEVECTOR_OPTIONS}
+            backend = backend_registry.get('statevector_simulator', **dict(sv_options, precision=precision))
+        job = backend.run(transpiled_circuit)
         result = job.result()
-        return result.get_statevector()
+        single = (precision or self.backend_options.get("precision")) == "single"
+        return np.asarray(result.get_statevector(), dtype=np.complex64 if single else np.complex128)
+
+    @staticmethod
+    def _run_options(seed: Optional[int]) -> Dict[str, int]:
+        return {} if seed is None else {"seed_simulator": seed}
+
+    def cache_stats(self) -> Dict[str, float]:
+        """
+        Returns hit/miss counters of the transpilation cache.
+        """
+        return self.transpile_cache.stats()
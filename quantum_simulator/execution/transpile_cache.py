@@ -0,0 +1,112 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+from qiskit import QuantumCircuit as QiskitCircuit, transpile
+
+def circuit_fingerprint(qiskit_circ: QiskitCircuit) -> str:
+    """
+    Computes a structural fingerprint of a Qiskit circuit.
+
+    Two circuits with the same register sizes and the same sequence of
+    instructions (name, operands, parameters) share a fingerprint, even if
+    they are distinct Python objects.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{qiskit_circ.num_qubits}:{qiskit_circ.num_clbits}:{qiskit_circ.global_phase}".encode())
+
+    for instruction in qiskit_circ.data:
+        operation = instruction.operation
+        qubits = ",".join(str(qiskit_circ.find_bit(q).index) for q in instruction.qubits)
+        clbits = ",".join(str(qiskit_circ.find_bit(c).index) for c in instruction.clbits)
+        params = ",".join(repr(float(p)) if isinstance(p, (int, float)) else str(p) for p in operation.params)
+        digest.update(f"|{operation.name}({params})[{qubits}][{clbits}]".encode())
+
+    return digest.hexdigest()
+
+class TranspileCache:
+    """
+    Bounded LRU cache of transpiled circuits.
+
+    Entries are keyed by the structural fingerprint of the input circuit,
+    the target backend name and the transpile options, so re-running the
+    same circuit skips the transpiler entirely.
+    The cache is shared between threads (e.g. the GUI worker threads).
+    """
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple, QiskitCircuit]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def transpile(self, qiskit_circ: QiskitCircuit, backend, **options) -> QiskitCircuit:
+        """
+        Returns the transpiled circuit, transpiling only on a cache miss.
+        The returned circuit is shared and must not be mutated by callers.
+        """
+        return self.transpile_many([qiskit_circ], backend, **options)[0]
+
+    def transpile_many(self, qiskit_circs: List[QiskitCircuit], backend, **options) -> List[QiskitCircuit]:
+        """
+        Transpiles a list of circuits, preserving order.
+        All cache misses are handed to the transpiler in a single call.
+        """
+        option_key = tuple(sorted(options.items()))
+        # Backends sharing a name may be configured for different methods
+        backend_key = (backend.name, getattr(backend.options, "method", None))
+        keys = [(circuit_fingerprint(c), backend_key, option_key) for c in qiskit_circs]
+        results: List[QiskitCircuit] = [None] * len(qiskit_circs)
+        pending: Dict[Tuple, List[int]] = OrderedDict()
+
+        with self._lock:
+            for i, key in enumerate(keys):
+                cached = self._entries.get(key)
+                if cached is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    results[i] = cached
+                elif key in pending:
+                    # Duplicate within the same batch: transpile once, count as a hit
+                    self.hits += 1
+                    pending[key].append(i)
+                else:
+                    self.misses += 1
+                    pending[key] = [i]
+
+        if pending:
+            misses = [qiskit_circs[indices[0]] for indices in pending.values()]
+            transpiled = transpile(misses, backend, **options)
+
+            with self._lock:
+                for (key, indices), circ in zip(pending.items(), transpiled):
+                    for i in indices:
+                        results[i] = circ
+                    self._entries[key] = circ
+                    self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return results
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Returns hit/miss counters and the current cache occupancy.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+    def clear(self):
+        """
+        Drops all cached circuits and resets the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
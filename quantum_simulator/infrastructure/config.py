@@ -9,12 +9,46 @@ class Config:
     Uses environment variables for sensitive or environment-specific data.
     """
     IBM_TOKEN: Optional[str] = os.getenv("IBM_QUANTUM_TOKEN")
+    # Any Aer backend name, or "numpy_statevector" for the native NumPy engine
     DEFAULT_BACKEND: str = os.getenv("QUANTUM_BACKEND", "aer_simulator")
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
     
     # Simulation defaults
     DEFAULT_SHOTS: int = 1024
-    MAX_QUBITS: int = 16
+    # Seed policy: with QUANTUM_SEED set, every run and transpilation is reproducible
+    SEED: Optional[int] = int(os.environ["QUANTUM_SEED"]) if os.getenv("QUANTUM_SEED") else None
+    # Admission control: a run may use this fraction of the RAM available when
+    # it starts, unless QUANTUM_MEMORY_BUDGET_MB fixes the budget (0 = auto)
+    MEMORY_FRACTION: float = 0.5
+    MEMORY_BUDGET_MB: int = int(os.getenv("QUANTUM_MEMORY_BUDGET_MB", "0"))
+    MAX_RUNTIME_SECONDS: Optional[float] = None # Predicted runtime ceiling; None = no limit
+    # "double" (complex128) or "single" (complex64: half the memory, ~7 significant digits)
+    PRECISION: str = os.getenv("QUANTUM_PRECISION", "double")
+    # Cancel/merge/fuse gates before simulating (see CircuitOptimizer)
+    OPTIMIZE_CIRCUITS: bool = os.getenv("QUANTUM_OPTIMIZE", "0") == "1"
+    # Aer worker threads per backend (0 = let Aer use all cores)
+    SIMULATOR_THREADS: int = int(os.getenv("QUANTUM_SIMULATOR_THREADS", "0"))
+
+    # "local" runs simulations in the calling thread, "process" in a worker pool
+    EXECUTION_MODE: str = os.getenv("QUANTUM_EXECUTION_MODE", "local")
+    PROCESS_WORKERS: int = int(os.getenv("QUANTUM_PROCESS_WORKERS", "0")) # 0 = one per core
+    SIMULATION_TIMEOUT: Optional[float] = None # Seconds; process mode only
+
+    # Circuits up to this size are sampled from a cached outcome distribution
+    RESAMPLE_MAX_QUBITS: int = 20
+
+    # Persistent cache of counts and statevectors (0 MB disables it)
+    RESULT_CACHE_DIR: str = os.getenv(
+        "QUANTUM_RESULT_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "quantum_simulator", "results")
+    )
+    RESULT_CACHE_MAX_MB: int = int(os.getenv("QUANTUM_RESULT_CACHE_MAX_MB", "256"))
+    # Also cache counts of unseeded runs (without QUANTUM_SEED, counts are only
+    # cached with this set); a repeated run then replays the stored sample
+    RESULT_CACHE_UNSEEDED: bool = os.getenv("QUANTUM_RESULT_CACHE_UNSEEDED", "0") == "1"
+
+    # Step debugger: statevector checkpoint spacing and cache budget
+    STEP_CHECKPOINT_INTERVAL: int = 16
+    STEP_CACHE_MAX_MB: int = 64
 
 def load_config() -> Config:
     """
@@ -0,0 +1,97 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional
+from .logger import infra_logger
+
+# Job states after which nothing changes any more
+TERMINAL_STATES = ("DONE", "ERROR", "CANCELLED")
+
+class JobStore:
+    """
+    Persists hardware job records in a local JSON file.
+
+    Each record is keyed by the runtime job ID and holds its status,
+    submission metadata and, once finished, its counts. Every change is
+    written atomically (temporary file + rename) under a lock, so a process
+    that restarts finds every job it submitted and can resume tracking it
+    instead of resubmitting. A file that cannot be read is moved aside to
+    <path>.corrupt-<timestamp> and the store starts empty; if it cannot be
+    moved either, the store refuses to open.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._records: Dict[str, Dict] = self._load()
+
+    def add(self, job_id: str, **metadata) -> Dict:
+        """
+        Records a newly submitted job.
+        """
+        now = time.time()
+        record = dict(metadata, job_id=job_id, status="QUEUED", submitted_at=now, updated_at=now,
+                      result=None, error=None)
+        with self._lock:
+            self._records[job_id] = record
+            self._save()
+        return dict(record)
+
+    def update(self, job_id: str, **fields) -> Dict:
+        """
+        Updates fields of a job record (e.g. status, result, error).
+        """
+        with self._lock:
+            if job_id not in self._records:
+                raise KeyError(f"Unknown job: {job_id}")
+            record = self._records[job_id]
+            record.update(fields, updated_at=time.time())
+            self._save()
+            return dict(record)
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        with self._lock:
+            record = self._records.get(job_id)
+            return None if record is None else dict(record)
+
+    def pending(self) -> List[Dict]:
+        """
+        Returns the records of jobs that have not reached a terminal state.
+        """
+        with self._lock:
+            return [dict(r) for r in self._records.values() if r["status"] not in TERMINAL_STATES]
+
+    def all(self) -> List[Dict]:
+        with self._lock:
+            return [dict(r) for r in self._records.values()]
+
+    # ---------- Internals ----------
+    def _load(self) -> Dict[str, Dict]:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                records = json.load(f)
+            if not isinstance(records, dict):
+                raise ValueError("expected a JSON object of job records")
+            return records
+        except (OSError, ValueError) as e:
+            # Keep the unreadable file for inspection instead of letting the
+            # next save overwrite the records it may still hold
+            aside = f"{self.path}.corrupt-{int(time.time())}"
+            infra_logger.error(f"Could not read job store {self.path}: {e}; moving it to {aside}")
+            os.replace(self.path, aside)
+            return {}
+
+    def _save(self):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".jobs-", suffix=".json")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self._records, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
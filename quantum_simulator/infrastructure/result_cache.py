@@ -0,0 +1,185 @@
+import hashlib
+import json
+import os
+import struct
+import tempfile
+import threading
+import time
+from typing import Dict
+import numpy as np
+from .logger import infra_logger
+
+_MAGIC = b"QRC1"
+_COUNTS, _STATEVECTOR = 1, 2
+_HEADER = struct.Struct("<4sBQQ")  # magic, kind, two size fields
+_DTYPE_CODES = {np.dtype(np.complex64): b"F", np.dtype(np.complex128): b"D"}
+
+def encode_counts(counts: Dict[str, int]) -> bytes:
+    """
+    Packs counts as bit-packed outcomes plus a uint64 count array.
+    """
+    num_clbits = len(next(iter(counts))) if counts else 0
+    if any(len(key) != num_clbits or key.strip("01") for key in counts):
+        raise ValueError("Only single-register bitstring counts can be encoded.")
+    outcomes = np.array([[c == "1" for c in key] for key in counts], dtype=bool).reshape(len(counts), num_clbits)
+    values = np.fromiter(counts.values(), dtype="<u8", count=len(counts))
+    return _HEADER.pack(_MAGIC, _COUNTS, num_clbits, len(counts)) + np.packbits(outcomes, axis=1).tobytes() + values.tobytes()
+
+def encode_statevector(statevector: np.ndarray) -> bytes:
+    array = np.ascontiguousarray(statevector).reshape(-1)
+    return _HEADER.pack(_MAGIC, _STATEVECTOR, array.size, 0) + _DTYPE_CODES[array.dtype] + array.tobytes()
+
+def decode(payload: bytes):
+    """
+    Decodes a payload written by encode_counts() or encode_statevector().
+    """
+    magic, kind, first, second = _HEADER.unpack_from(payload)
+    if magic != _MAGIC:
+        raise ValueError("Not a result cache entry.")
+    body = memoryview(payload)[_HEADER.size:]
+    if kind == _COUNTS:
+        num_clbits, num_outcomes = first, second
+        row_bytes = (num_clbits + 7) // 8
+        packed = np.frombuffer(body[:row_bytes * num_outcomes], dtype=np.uint8).reshape(num_outcomes, row_bytes)
+        outcomes = np.unpackbits(packed, axis=1, count=num_clbits)
+        values = np.frombuffer(body[row_bytes * num_outcomes:], dtype="<u8")
+        return {"".join("1" if bit else "0" for bit in row): int(v) for row, v in zip(outcomes, values)}
+    if kind == _STATEVECTOR:
+        dtype = np.complex64 if bytes(body[:1]) == b"F" else np.complex128
+        return np.frombuffer(body[1:], dtype=dtype, count=first).copy()
+    raise ValueError(f"Unknown result cache entry kind: {kind}")
+
+class ResultCache:
+    """
+    Persistent, content-addressed cache of simulation results.
+
+    Entries are keyed by a digest of the circuit's canonical description
+    plus every setting that affects the result (shots, seed, backend,
+    method, precision, noise). Counts and statevectors are stored in a
+    compact binary format, one file per entry. When the directory grows
+    beyond max_bytes, the least recently used entries are deleted.
+    Writes are atomic, so concurrent processes can share a directory.
+    """
+    SUFFIX = ".qrc"
+
+    def __init__(self, directory: str, max_bytes: int = 256 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._bytes_saved = 0
+        os.makedirs(directory, exist_ok=True)
+        # digest -> (size, last use); seeded from the files already on disk
+        self._index: Dict[str, list] = {}
+        for name in os.listdir(directory):
+            if name.endswith(self.SUFFIX):
+                stat = os.stat(os.path.join(directory, name))
+                self._index[name[:-len(self.SUFFIX)]] = [stat.st_size, stat.st_mtime]
+        self._bytes = sum(size for size, _ in self._index.values())
+
+    @staticmethod
+    def key(circuit_description, **settings) -> str:
+        """
+        Returns the canonical digest for a circuit description (any value
+        with a deterministic repr, e.g. a tuple of gates) and run settings.
+        """
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(repr(circuit_description).encode())
+        digest.update(json.dumps(settings, sort_keys=True, default=repr).encode())
+        return digest.hexdigest()
+
+    def get(self, key: str):
+        """
+        Returns the cached counts or statevector for key, or None.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                payload = f.read()
+            value = decode(payload)
+        except (OSError, ValueError, struct.error):
+            with self._lock:
+                self._misses += 1
+            return None
+        with self._lock:
+            self._hits += 1
+            self._bytes_saved += len(payload)
+            if key in self._index:
+                self._index[key][1] = time.time()
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def put(self, key: str, value):
+        """
+        Stores counts (a dict) or a statevector (an array) under key.
+        Values larger than the whole cache are not stored.
+        """
+        try:
+            payload = encode_counts(value) if isinstance(value, dict) else encode_statevector(np.asarray(value))
+        except (KeyError, ValueError, TypeError) as e:
+            infra_logger.debug(f"Result not cacheable: {e}")
+            return
+        if len(payload) > self.max_bytes:
+            return
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            infra_logger.warning(f"Could not write result cache entry: {e}")
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            return
+
+        with self._lock:
+            previous = self._index.get(key)
+            if previous is not None:
+                self._bytes -= previous[0]
+            self._index[key] = [len(payload), time.time()]
+            self._bytes += len(payload)
+            self._evict()
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Returns hit/miss counters, the hit rate, the result bytes served from
+        the cache instead of being recomputed, and the cache's size on disk.
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "bytes_saved": self._bytes_saved,
+                "entries": len(self._index),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def clear(self):
+        with self._lock:
+            for key in list(self._index):
+                self._remove(key)
+
+    # ---------- Internals ----------
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + self.SUFFIX)
+
+    def _evict(self):
+        while self._bytes > self.max_bytes and self._index:
+            oldest = min(self._index, key=lambda k: self._index[k][1])
+            self._remove(oldest)
+
+    def _remove(self, key: str):
+        size, _ = self._index.pop(key)
+        self._bytes -= size
+        try:
+            os.unlink(self._path(key))
+        except OSError:
+            pass
@@ -0,0 +1,44 @@
+import os
+from typing import Optional
+
+def _cgroup_memory_headroom() -> Optional[int]:
+    """
+    Returns the memory left under a cgroup v2 limit (containers), if any.
+    """
+    try:
+        with open("/sys/fs/cgroup/memory.max") as f:
+            limit = f.read().strip()
+        if limit == "max":
+            return None
+        with open("/sys/fs/cgroup/memory.current") as f:
+            current = int(f.read().strip())
+        return max(int(limit) - current, 0)
+    except (OSError, ValueError):
+        return None
+
+def _host_available_memory() -> Optional[int]:
+    try:
+        import psutil
+        return int(psutil.virtual_memory().available)
+    except ImportError:
+        pass
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+def available_memory_bytes() -> Optional[int]:
+    """
+    Returns the RAM this process can currently allocate (the smaller of the
+    host's available memory and any container limit headroom), or None if
+    it cannot be determined on this platform.
+    """
+    candidates = [m for m in (_host_available_memory(), _cgroup_memory_headroom()) if m is not None]
+    return min(candidates) if candidates else None
@@ -1,5 +1,6 @@
 import sys
 from ..application.circuit_controller import CircuitController
+from ..execution.qiskit_engine import QiskitEngine
 from .visualizer import QuantumVisualizer
 
 def main_menu():
@@ -54,7 +55,8 @@ def main_menu():
                 visualizer.print_results_table(counts)
                 visualizer.plot_results(counts)
             elif choice == "7":
-                _, q_circ = controller.run_simulation(shots=1) # Just to get the qiskit object
+                # Pure translation: no simulation run needed to draw the circuit
+                q_circ = QiskitEngine.translate_to_qiskit(controller.current_circuit)
                 visualizer.print_circuit_ascii(q_circ)
                 visualizer.show_circuit_diagram(q_circ)
             elif choice == "8":
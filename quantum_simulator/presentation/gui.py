@@ -12,6 +12,7 @@ import os
 from ..application.circuit_controller import CircuitController
 from ..application.finance_controller import FinanceController
 from ..application.challenge_manager import ChallengeManager
+from ..application.async_runner import BackgroundEventLoop
 from ..execution.qiskit_engine import QiskitEngine
 from .visualizer import QuantumVisualizer
 
@@ -40,6 +41,11 @@ class QuantumGUI(ctk.CTk):
         # State
         self.current_theme = "Dark"
         
+        # Simulations run as coroutines on a background loop; the latest
+        # request per channel ("simulation", "bloch") supersedes older ones.
+        self.sim_loop = BackgroundEventLoop()
+        self._pending_jobs = {}
+        
         self.setup_ui()
 
     def setup_ui(self):
@@ -218,16 +224,12 @@ class QuantumGUI(ctk.CTk):
 
     def start_bloch_thread(self):
         self.update_status("Calculating Statevector...", is_loading=True)
-        thread = threading.Thread(target=self.bloch_task)
-        thread.daemon = True
-        thread.start()
-
-    def bloch_task(self):
-        try:
-            sv = self.controller.get_circuit_statevector()
-            self.after(0, lambda: self.finish_bloch(sv))
-        except Exception as e:
-            self.after(0, lambda: self.update_status(f"Bloch Error: {e}"))
+        self.submit_job(
+            "bloch",
+            self.controller.get_circuit_statevector_async(progress=self.report_progress),
+            self.finish_bloch,
+            "Bloch Error"
+        )
 
     def finish_bloch(self, statevector):
         self.update_status("Statevector Calculated.")
@@ -400,20 +402,45 @@ class QuantumGUI(ctk.CTk):
     # WORKER THREADS
     # ==========================
     def start_sim_thread(self):
+        if not self.controller.current_circuit:
+            self.update_status("Sim Error: No circuit defined.")
+            return
         self.update_status("Running Simulation...", is_loading=True)
-        thread = threading.Thread(target=self.run_simulation_task)
-        thread.daemon = True
-        thread.start()
-
-    def run_simulation_task(self):
-        try:
-            self.controller.current_circuit.measure_all()
-            counts, _ = self.controller.run_simulation()
-            
-            # Post back to UI thread
-            self.after(0, lambda: self.finish_simulation(counts))
-        except Exception as e:
-            self.after(0, lambda: self.update_status(f"Sim Error: {e}"))
+        self.controller.current_circuit.measure_all()
+        self.submit_job(
+            "simulation",
+            self.controller.run_simulation_async(progress=self.report_progress),
+            lambda result: self.finish_simulation(result[0]),
+            "Sim Error"
+        )
+
+    def submit_job(self, channel, coroutine, on_success, error_prefix):
+        """
+        Schedules a simulation coroutine, cancelling the previous job on the
+        same channel if it has not finished yet.
+        """
+        previous = self._pending_jobs.get(channel)
+        if previous is not None and not previous.done():
+            previous.cancel()
+        
+        future = self.sim_loop.submit(coroutine)
+        self._pending_jobs[channel] = future
+        
+        def deliver(done):
+            # Runs on the loop thread: post back to UI thread
+            if done.cancelled():
+                return
+            error = done.exception()
+            if error is not None:
+                self.after(0, lambda: self.update_status(f"{error_prefix}: {error}"))
+            else:
+                result = done.result()
+                self.after(0, lambda: on_success(result))
+        future.add_done_callback(deliver)
+
+    def report_progress(self, stage):
+        """Progress callback for simulation coroutines (called off the UI thread)."""
+        self.after(0, lambda: self.status_label.configure(text=f"Simulation: {stage}..."))
 
     def finish_simulation(self, counts):
         self.update_status("Simulation Complete.")
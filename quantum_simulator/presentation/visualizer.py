@@ -42,6 +42,8 @@ class QuantumVisualizer:
     def plot_bloch(statevector):
         """
         Returns the Bloch sphere figure for the statevector.
+        Accepts a Statevector or a flat complex128/complex64 array
+        (single-precision runs return complex64).
         """
         logger.info("Plotting Bloch Multi-vector...")
         fig = plot_bloch_multivector(statevector)
@@ -0,0 +1,81 @@
+from dataclasses import dataclass
+from typing import List
+from .circuit_builder import QuantumCircuit
+from .gates import (
+    HadamardGate, PauliXGate, PauliYGate, PauliZGate, PhaseGate, CNOTGate, SwapGate
+)
+
+# Gates that map stabilizer states to stabilizer states
+CLIFFORD_GATES = (HadamardGate, PauliXGate, PauliYGate, PauliZGate, PhaseGate, CNOTGate, SwapGate)
+
+@dataclass(frozen=True)
+class CircuitProfile:
+    """
+    Structural summary of a logical circuit used to pick a simulation method.
+
+    category is one of:
+    - "clifford": only H/X/Y/Z/S/CX/SWAP gates (efficiently simulable with stabilizers)
+    - "low_entanglement": two-qubit gates only between neighbouring qubits and
+      few of them across any cut of the qubit line (small MPS bond dimension)
+    - "general": anything else
+    """
+    num_qubits: int
+    num_gates: int
+    depth: int
+    two_qubit_gates: int
+    is_clifford: bool
+    nearest_neighbour: bool
+    max_cut_gates: int
+    category: str
+
+class CircuitAnalyzer:
+    """
+    Analyzes the logical gate list without simulating anything.
+    """
+    CLIFFORD = "clifford"
+    LOW_ENTANGLEMENT = "low_entanglement"
+    GENERAL = "general"
+
+    @staticmethod
+    def analyze(circuit: QuantumCircuit, max_cut_gates: int = 8) -> CircuitProfile:
+        """
+        Classifies the circuit. A nearest-neighbour circuit counts as low
+        entanglement when no cut between qubits i and i+1 is crossed by more
+        than max_cut_gates two-qubit gates (bond dimension <= 2^max_cut_gates).
+        """
+        num_qubits = len(circuit.qubits)
+        is_clifford = True
+        nearest_neighbour = True
+        two_qubit_gates = 0
+        cut_gates: List[int] = [0] * max(num_qubits - 1, 0)
+
+        for gate in circuit.gates:
+            if is_clifford and not isinstance(gate, CLIFFORD_GATES):
+                is_clifford = False
+            targets = gate.targets
+            if len(targets) == 2:
+                two_qubit_gates += 1
+                low, high = sorted((targets[0].index, targets[1].index))
+                if high - low != 1:
+                    nearest_neighbour = False
+                elif nearest_neighbour:
+                    cut_gates[low] += 1
+
+        max_cut = max(cut_gates, default=0)
+        if is_clifford:
+            category = CircuitAnalyzer.CLIFFORD
+        elif nearest_neighbour and max_cut <= max_cut_gates:
+            category = CircuitAnalyzer.LOW_ENTANGLEMENT
+        else:
+            category = CircuitAnalyzer.GENERAL
+
+        return CircuitProfile(
+            num_qubits=num_qubits,
+            num_gates=len(circuit.gates),
+            depth=circuit.depth(),
+            two_qubit_gates=two_qubit_gates,
+            is_clifford=is_clifford,
+            nearest_neighbour=nearest_neighbour,
+            max_cut_gates=max_cut,
+            category=category,
+        )
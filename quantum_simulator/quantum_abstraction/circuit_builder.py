@@ -1,21 +1,75 @@
-from typing import List
+from typing import Dict, List, Union
 from .qubit import Qubit
+from .parameter import Parameter
+from .fingerprint import RollingHash, digest, gate_token
+from .moments import MomentIndex
 from .gates import (
     Gate, HadamardGate, PauliXGate, PauliYGate, PauliZGate, CNOTGate,
-    TGate, PhaseGate, RXGate, RYGate, RZGate, SwapGate
+    TGate, PhaseGate, RotationGate, RXGate, RYGate, RZGate, SwapGate
 )
 
+Angle = Union[float, Parameter, str]
+
+class _TrackedList(list):
+    """
+    List that counts every edit other than growth at the end (append,
+    extend, +=), so indexes built over a prefix can tell when to start over.
+    """
+    __slots__ = ("edits",)
+
+    def __init__(self, items=()):
+        super().__init__(items)
+        self.edits = 0
+
+def _counting_edits(name: str):
+    method = getattr(list, name)
+
+    def edit(self, *args):
+        self.edits += 1
+        return method(self, *args)
+    edit.__name__ = name
+    return edit
+
+for _name in ("__setitem__", "__delitem__", "__imul__", "insert", "pop", "remove", "clear", "sort", "reverse"):
+    setattr(_TrackedList, _name, _counting_edits(_name))
+
 class QuantumCircuit:
     """
     Logical representation of a Quantum Circuit.
     Holds a collection of qubits and a sequence of gates applied to them.
     This class is backend-agnostic.
+
+    The circuit keeps rolling structural hashes (see fingerprint()) and a
+    moment index (see moment_index). Each appended gate or measurement is
+    indexed once, the first time a fingerprint or the moment index is
+    requested after it was added. Any other edit of the lists (item
+    assignment, pop, insert, ...) or assigning new lists makes the next
+    query rebuild the indexes from scratch.
     """
     def __init__(self, num_qubits: int):
         self.qubits = [Qubit(i) for i in range(num_qubits)]
         self.gates: List[Gate] = []
         self.measurements: List[int] = [] # List of qubit indices to measure
 
+    @property
+    def gates(self) -> List[Gate]:
+        return self._gates
+
+    @gates.setter
+    def gates(self, gates: List[Gate]):
+        self._gates = gates if isinstance(gates, _TrackedList) else _TrackedList(gates)
+        self._reset_gate_indexes()
+
+    @property
+    def measurements(self) -> List[int]:
+        return self._measurements
+
+    @measurements.setter
+    def measurements(self, measurements: List[int]):
+        self._measurements = measurements if isinstance(measurements, _TrackedList) else _TrackedList(measurements)
+        self._measurement_edits = self._measurements.edits
+        self._measurement_hash = RollingHash()
+
     def h(self, qubit_index: int):
         self.gates.append(HadamardGate(self.qubits[qubit_index]))
         return self
@@ -40,15 +94,15 @@ class QuantumCircuit:
         self.gates.append(PhaseGate(self.qubits[qubit_index]))
         return self
 
-    def rx(self, qubit_index: int, theta: float):
+    def rx(self, qubit_index: int, theta: Angle):
         self.gates.append(RXGate(self.qubits[qubit_index], theta))
         return self
 
-    def ry(self, qubit_index: int, theta: float):
+    def ry(self, qubit_index: int, theta: Angle):
         self.gates.append(RYGate(self.qubits[qubit_index], theta))
         return self
 
-    def rz(self, qubit_index: int, theta: float):
+    def rz(self, qubit_index: int, theta: Angle):
         self.gates.append(RZGate(self.qubits[qubit_index], theta))
         return self
 
@@ -68,5 +122,120 @@ class QuantumCircuit:
         self.measurements.extend(qubit_indices)
         return self
 
+    @property
+    def parameters(self) -> List[Parameter]:
+        """
+        Unbound parameters of the circuit, in order of first use.
+        """
+        seen = {}
+        for gate in self.gates:
+            if isinstance(gate, RotationGate) and gate.is_parameterized:
+                seen.setdefault(gate.theta, None)
+        return list(seen)
+
+    def bind_parameters(self, values: Dict[str, float]) -> "QuantumCircuit":
+        """
+        Returns a new circuit with the given parameters replaced by concrete angles.
+        Parameters missing from values stay symbolic.
+        """
+        bound = QuantumCircuit(len(self.qubits))
+        for gate in self.gates:
+            if isinstance(gate, RotationGate) and gate.is_parameterized and gate.theta.name in values:
+                gate = type(gate)(bound.qubits[gate.targets[0].index], float(values[gate.theta.name]))
+            bound.gates.append(gate)
+        bound.measurements = list(self.measurements)
+        return bound
+
+    def save(self, path: str):
+        """
+        Saves the circuit as OpenQASM 3 (.qasm/.qasm3) or in the compact
+        binary format (see serialization.save_circuit).
+        """
+        # Imported lazily: serialization builds on this module
+        from .serialization import save_circuit
+        save_circuit(self, path)
+
+    @classmethod
+    def load(cls, path: str) -> "QuantumCircuit":
+        """
+        Loads a circuit written by save() (see serialization.load_circuit).
+        """
+        from .serialization import load_circuit
+        return load_circuit(path, cls)
+
+    def fingerprint(self, parameter_agnostic: bool = False) -> str:
+        """
+        Structural fingerprint: equal for circuits with the same qubit count,
+        gates (name, targets, angle) and measurements, across processes.
+        With parameter_agnostic, angles are ignored, so circuits that differ
+        only in their rotation angles (one template) share a fingerprint.
+        """
+        return self.range_fingerprint(0, len(self._gates), parameter_agnostic, measurements=True)
+
+    def prefix_fingerprint(self, num_gates: int, parameter_agnostic: bool = False) -> str:
+        """
+        Fingerprint of the circuit made of the first num_gates gates
+        (without measurements), e.g. a step of the step debugger.
+        """
+        return self.range_fingerprint(0, num_gates, parameter_agnostic)
+
+    def range_fingerprint(self, start: int, stop: int, parameter_agnostic: bool = False,
+                          measurements: bool = False) -> str:
+        """
+        Fingerprint of the circuit made of gates[start:stop] (plus this
+        circuit's measurements if measurements is True), in O(log(stop - start)).
+        Equal to the fingerprint of that circuit built explicitly.
+        """
+        if not 0 <= start <= stop <= len(self._gates):
+            raise ValueError(f"Gate range [{start}, {stop}) is outside the circuit's {len(self._gates)} gates.")
+        gates_hash = self._gates_hash(parameter_agnostic).range(start, stop)
+        return digest(len(self.qubits), stop - start, gates_hash, self._measurements_hash() if measurements else 0)
+
+    @property
+    def moment_index(self) -> MomentIndex:
+        """
+        ASAP layering of the gates: moment of each gate, depth, per-qubit
+        last moment and gate count. Measurements are not included.
+        """
+        self._check_gate_edits()
+        for gate in self._gates[len(self._moments):]:
+            self._moments.append([q.index for q in gate.targets])
+        return self._moments
+
+    def depth(self) -> int:
+        return self.moment_index.depth
+
+    def layers(self) -> List[List[Gate]]:
+        """
+        Gates grouped by moment; the gates of a moment act on disjoint qubits.
+        """
+        return [[self._gates[i] for i in layer] for layer in self.moment_index.layers()]
+
+    def _measurements_hash(self) -> int:
+        if self._measurements.edits != self._measurement_edits:
+            self._measurement_edits = self._measurements.edits
+            self._measurement_hash = RollingHash()
+        rolling = self._measurement_hash
+        for qubit_index in self._measurements[len(rolling):]:
+            rolling.append(qubit_index + 1)
+        return rolling.prefix(len(rolling))
+
+    def _gates_hash(self, parameter_agnostic: bool) -> RollingHash:
+        self._check_gate_edits()
+        rolling = self._gate_hashes[parameter_agnostic]
+        for gate in self._gates[len(rolling):]:
+            rolling.append(gate_token(gate, parameter_agnostic))
+        return rolling
+
+    def _check_gate_edits(self):
+        # Gates were edited in place: nothing indexed so far can be trusted
+        if self._gates.edits != self._gate_edits:
+            self._reset_gate_indexes()
+
+    def _reset_gate_indexes(self):
+        self._gate_edits = self._gates.edits
+        self._gate_hashes = {False: RollingHash(), True: RollingHash()}
+        self._moments = MomentIndex(len(self.qubits))
+
     def __repr__(self) -> str:
         return f"QuantumCircuit(qubits={len(self.qubits)}, gates={len(self.gates)})"
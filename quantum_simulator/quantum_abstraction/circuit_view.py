@@ -0,0 +1,126 @@
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Sequence
+from .circuit_builder import QuantumCircuit
+from .gates import Gate, RotationGate
+from .moments import MomentIndex
+from .parameter import Parameter
+
+class GateRange(Sequence):
+    """
+    Read-only window gates[start:stop] over another gate sequence.
+    """
+    def __init__(self, gates: Sequence[Gate], start: int, stop: int):
+        self._gates = gates
+        self._start = start
+        self._stop = stop
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._gates[self._start + i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("gate index out of range")
+        return self._gates[self._start + index]
+
+    def __iter__(self) -> Iterator[Gate]:
+        return islice(self._gates, self._start, self._stop)
+
+class CircuitView:
+    """
+    Zero-copy, read-only view of the gates [start, stop) of a circuit.
+
+    A view shares the qubits and gates of its circuit and can be passed
+    wherever a circuit is read (translation, analysis, simulation, caches).
+    Its fingerprint equals that of the equivalent circuit built explicitly,
+    so cached results are shared with it. Measurements are only included
+    with measure=True. The range is fixed when the view is created, and the
+    viewed gates must not be edited in place while the view is in use.
+    """
+    def __init__(self, circuit, start: int = 0, stop: Optional[int] = None, measure: bool = False):
+        if isinstance(circuit, CircuitView):
+            # A view of a view is a view of the underlying circuit
+            start, stop = circuit._start + start, circuit._start + (len(circuit.gates) if stop is None else stop)
+            circuit = circuit._circuit
+        stop = len(circuit.gates) if stop is None else stop
+        if not 0 <= start <= stop <= len(circuit.gates):
+            raise ValueError(f"Gate range [{start}, {stop}) is outside the circuit's {len(circuit.gates)} gates.")
+        self._circuit = circuit
+        self._start = start
+        self._stop = stop
+        self._measure = measure
+        self._moments: Optional[MomentIndex] = None
+
+    @property
+    def qubits(self):
+        return self._circuit.qubits
+
+    @property
+    def gates(self) -> GateRange:
+        return GateRange(self._circuit.gates, self._start, self._stop)
+
+    @property
+    def measurements(self) -> List[int]:
+        return self._circuit.measurements if self._measure else []
+
+    @property
+    def parameters(self) -> List[Parameter]:
+        """
+        Unbound parameters of the viewed gates, in order of first use.
+        """
+        seen = {}
+        for gate in self.gates:
+            if isinstance(gate, RotationGate) and gate.is_parameterized:
+                seen.setdefault(gate.theta, None)
+        return list(seen)
+
+    def bind_parameters(self, values: Dict[str, float]) -> QuantumCircuit:
+        """
+        Returns a new circuit with the viewed gates and the given parameters bound.
+        """
+        return self.to_circuit().bind_parameters(values)
+
+    def to_circuit(self) -> QuantumCircuit:
+        """
+        Materializes the view as an independent QuantumCircuit.
+        """
+        circuit = QuantumCircuit(len(self.qubits))
+        circuit.gates = list(self.gates)
+        circuit.measurements = list(self.measurements)
+        return circuit
+
+    # ---------- Structure (delegated to the underlying circuit) ----------
+    def fingerprint(self, parameter_agnostic: bool = False) -> str:
+        return self._circuit.range_fingerprint(self._start, self._stop, parameter_agnostic, measurements=self._measure)
+
+    def prefix_fingerprint(self, num_gates: int, parameter_agnostic: bool = False) -> str:
+        if not 0 <= num_gates <= len(self.gates):
+            raise ValueError(f"Prefix length must be between 0 and {len(self.gates)}.")
+        return self._circuit.range_fingerprint(self._start, self._start + num_gates, parameter_agnostic)
+
+    def range_fingerprint(self, start: int, stop: int, parameter_agnostic: bool = False,
+                          measurements: bool = False) -> str:
+        if not 0 <= start <= stop <= len(self.gates):
+            raise ValueError(f"Gate range [{start}, {stop}) is outside the view's {len(self.gates)} gates.")
+        return self._circuit.range_fingerprint(self._start + start, self._start + stop, parameter_agnostic,
+                                               measurements=measurements and self._measure)
+
+    @property
+    def moment_index(self) -> MomentIndex:
+        """
+        ASAP layering of the viewed gates, built on first use.
+        """
+        if self._moments is None:
+            self._moments = MomentIndex(len(self.qubits))
+            for gate in self.gates:
+                self._moments.append([q.index for q in gate.targets])
+        return self._moments
+
+    def depth(self) -> int:
+        return self.moment_index.depth
+
+    def __repr__(self) -> str:
+        return f"CircuitView(qubits={len(self.qubits)}, gates={self._start}:{self._stop})"
@@ -0,0 +1,390 @@
+import hashlib
+from typing import Dict, Iterator, List, Sequence, Union
+import numpy as np
+from .qubit import Qubit
+from .parameter import Parameter
+from .circuit_builder import Angle, QuantumCircuit
+from .moments import MomentIndex
+from .gates import (
+    Gate, HadamardGate, PauliXGate, PauliYGate, PauliZGate, CNOTGate,
+    TGate, PhaseGate, RotationGate, RXGate, RYGate, RZGate, SwapGate
+)
+
+# Opcode i encodes GATE_CLASSES[i]; append only, stored circuits depend on it
+GATE_CLASSES = (
+    HadamardGate, PauliXGate, PauliYGate, PauliZGate, TGate, PhaseGate,
+    RXGate, RYGate, RZGate, CNOTGate, SwapGate,
+)
+OPCODES: Dict[type, int] = {gate_class: opcode for opcode, gate_class in enumerate(GATE_CLASSES)}
+TWO_QUBIT_OPCODES = (OPCODES[CNOTGate], OPCODES[SwapGate])
+ROTATION_OPCODES = (OPCODES[RXGate], OPCODES[RYGate], OPCODES[RZGate])
+
+class GateSequence(Sequence):
+    """
+    Read-only sequence of gate views over a CompactCircuit.
+
+    Each access builds a regular Gate object from the arrays, so every
+    consumer of QuantumCircuit.gates works unchanged; changing a view does
+    not change the circuit.
+    """
+    def __init__(self, circuit: "CompactCircuit"):
+        self._circuit = circuit
+
+    def __len__(self) -> int:
+        return self._circuit._size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._circuit._view(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("gate index out of range")
+        return self._circuit._view(index)
+
+    def __iter__(self) -> Iterator[Gate]:
+        view = self._circuit._view
+        for i in range(len(self)):
+            yield view(i)
+
+class CompactCircuit:
+    """
+    Array-backed logical circuit with the same fluent API as QuantumCircuit.
+
+    Gates live in contiguous NumPy columns instead of one Python object per
+    gate: opcode (uint8), first and second qubit (int32, -1 when unused),
+    angle (float64, NaN when unused) and symbolic parameter id (int32, -1
+    when the angle is concrete). That is 21 bytes per gate, and hashing,
+    binding and translation run as passes over the arrays. circuit.gates
+    exposes read-only Gate views for code written against QuantumCircuit.
+    """
+    def __init__(self, num_qubits: int, capacity: int = 64):
+        self.qubits = [Qubit(i) for i in range(num_qubits)]
+        self.measurements: List[int] = []
+        self._size = 0
+        self._symbols: List[Parameter] = []
+        self._symbol_ids: Dict[Parameter, int] = {}
+        self._moments = MomentIndex(num_qubits)
+        self._allocate(max(capacity, 1))
+
+    # ---------- Fluent API (mirrors QuantumCircuit) ----------
+    def h(self, qubit_index: int):
+        return self._append(OPCODES[HadamardGate], qubit_index)
+
+    def x(self, qubit_index: int):
+        return self._append(OPCODES[PauliXGate], qubit_index)
+
+    def y(self, qubit_index: int):
+        return self._append(OPCODES[PauliYGate], qubit_index)
+
+    def z(self, qubit_index: int):
+        return self._append(OPCODES[PauliZGate], qubit_index)
+
+    def t(self, qubit_index: int):
+        return self._append(OPCODES[TGate], qubit_index)
+
+    def s(self, qubit_index: int):
+        return self._append(OPCODES[PhaseGate], qubit_index)
+
+    def rx(self, qubit_index: int, theta: Angle):
+        return self._append(OPCODES[RXGate], qubit_index, theta=theta)
+
+    def ry(self, qubit_index: int, theta: Angle):
+        return self._append(OPCODES[RYGate], qubit_index, theta=theta)
+
+    def rz(self, qubit_index: int, theta: Angle):
+        return self._append(OPCODES[RZGate], qubit_index, theta=theta)
+
+    def cx(self, control_index: int, target_index: int):
+        return self._append(OPCODES[CNOTGate], control_index, target_index)
+
+    def swap(self, idx1: int, idx2: int):
+        return self._append(OPCODES[SwapGate], idx1, idx2)
+
+    def measure_all(self):
+        self.measurements = [q.index for q in self.qubits]
+        return self
+
+    def measure(self, qubit_indices: List[int]):
+        self.measurements.extend(qubit_indices)
+        return self
+
+    def append_gate(self, gate: Gate):
+        """
+        Appends a regular Gate object (one of GATE_CLASSES).
+        """
+        opcode = OPCODES.get(type(gate))
+        if opcode is None:
+            raise ValueError(f"{type(gate).__name__} has no compact encoding.")
+        targets = gate.targets
+        second = targets[1].index if len(targets) > 1 else None
+        return self._append(opcode, targets[0].index, second, getattr(gate, "theta", None))
+
+    def append_columns(self, opcodes, first_qubits, second_qubits=None, angles=None,
+                       parameter_ids=None, parameters: Sequence[Parameter] = ()):
+        """
+        Appends many gates at once from column arrays (same encoding as the
+        circuit's own columns). parameter_ids index into parameters and mark
+        symbolic angles. Every column is validated before anything is added.
+        """
+        opcodes = np.asarray(opcodes, dtype=np.int64)
+        count = len(opcodes)
+        first = np.asarray(first_qubits, dtype=np.int64)
+        second = np.full(count, -1, dtype=np.int64) if second_qubits is None else np.asarray(second_qubits, dtype=np.int64)
+        theta = np.full(count, np.nan) if angles is None else np.asarray(angles, dtype=np.float64)
+        symbol = np.full(count, -1, dtype=np.int64) if parameter_ids is None else np.asarray(parameter_ids, dtype=np.int64)
+        if not all(len(column) == count for column in (first, second, theta, symbol)):
+            raise ValueError("All gate columns must have the same length.")
+
+        num_qubits = len(self.qubits)
+        two_qubit = np.isin(opcodes, TWO_QUBIT_OPCODES)
+        rotation = np.isin(opcodes, ROTATION_OPCODES)
+        symbolic = symbol >= 0
+        if np.any((opcodes < 0) | (opcodes >= len(GATE_CLASSES))):
+            raise ValueError("Unknown gate opcode.")
+        if np.any((first < 0) | (first >= num_qubits)) or np.any(two_qubit & ((second < 0) | (second >= num_qubits))):
+            raise IndexError(f"Qubit index out of range for circuit size {num_qubits}.")
+        if np.any(~two_qubit & (second != -1)) or np.any(two_qubit & (first == second)):
+            raise ValueError("Second qubit operands must match the gate arity.")
+        if np.any(symbol >= len(parameters)) or np.any(symbolic & ~rotation):
+            raise ValueError("Parameter ids must index parameters and belong to rotations.")
+        if np.any(rotation & ~symbolic & ~np.isfinite(theta)):
+            raise ValueError("Rotations need a finite angle or a parameter.")
+
+        ids = np.array([self._parameter_id(p) for p in parameters] + [-1], dtype=np.int32)
+        self._reserve(self._size + count)
+        end = self._size + count
+        self._opcodes[self._size:end] = opcodes
+        self._q0[self._size:end] = first
+        self._q1[self._size:end] = second
+        self._theta[self._size:end] = np.where(rotation & ~symbolic, theta, np.nan)
+        self._symbol[self._size:end] = ids[symbol]  # -1 selects the trailing -1
+        self._size = end
+        return self
+
+    # ---------- Conversion ----------
+    @classmethod
+    def from_circuit(cls, circuit: QuantumCircuit) -> "CompactCircuit":
+        compact = cls(len(circuit.qubits), capacity=len(circuit.gates))
+        for gate in circuit.gates:
+            compact.append_gate(gate)
+        compact.measurements = list(circuit.measurements)
+        return compact
+
+    def to_circuit(self) -> QuantumCircuit:
+        circuit = QuantumCircuit(len(self.qubits))
+        circuit.gates.extend(self.gates)
+        circuit.measurements = list(self.measurements)
+        return circuit
+
+    def save(self, path: str):
+        """
+        Saves the circuit as OpenQASM 3 (.qasm/.qasm3) or in the compact
+        binary format, written straight from the columns.
+        """
+        # Imported lazily: serialization builds on this module
+        from .serialization import save_circuit
+        save_circuit(self, path)
+
+    @classmethod
+    def load(cls, path: str) -> "CompactCircuit":
+        from .serialization import load_circuit
+        return load_circuit(path, cls)
+
+    # ---------- Read access ----------
+    @property
+    def gates(self) -> GateSequence:
+        return GateSequence(self)
+
+    @property
+    def opcodes(self) -> np.ndarray:
+        return self._readonly(self._opcodes)
+
+    @property
+    def first_qubits(self) -> np.ndarray:
+        return self._readonly(self._q0)
+
+    @property
+    def second_qubits(self) -> np.ndarray:
+        return self._readonly(self._q1)
+
+    @property
+    def angles(self) -> np.ndarray:
+        return self._readonly(self._theta)
+
+    @property
+    def parameter_ids(self) -> np.ndarray:
+        """
+        Parameter id of each gate (-1 for concrete angles); see parameter_table.
+        """
+        return self._readonly(self._symbol)
+
+    @property
+    def parameter_table(self) -> List[Parameter]:
+        """
+        Parameters indexed by id (ids are assigned on first use).
+        """
+        return list(self._symbols)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Bytes used by the gate arrays (including spare capacity).
+        """
+        return self._opcodes.nbytes + self._q0.nbytes + self._q1.nbytes + self._theta.nbytes + self._symbol.nbytes
+
+    @property
+    def parameters(self) -> List[Parameter]:
+        """
+        Unbound parameters of the circuit, in order of first use.
+        """
+        ids = self._symbol[:self._size]
+        ids = ids[ids >= 0]
+        if ids.size == 0:
+            return []
+        _, first_use = np.unique(ids, return_index=True)
+        return [self._symbols[i] for i in ids[np.sort(first_use)]]
+
+    @property
+    def moment_index(self) -> MomentIndex:
+        """
+        ASAP layering of the gates, as QuantumCircuit.moment_index; extended
+        from the operand arrays for gates appended since the last query.
+        """
+        start = len(self._moments)
+        for first, second in zip(self._q0[start:self._size].tolist(), self._q1[start:self._size].tolist()):
+            self._moments.append((first,) if second < 0 else (first, second))
+        return self._moments
+
+    def depth(self) -> int:
+        return self.moment_index.depth
+
+    def bind_parameters(self, values: Dict[str, float]) -> "CompactCircuit":
+        """
+        Returns a new circuit with the given parameters replaced by concrete
+        angles (one masked assignment per parameter).
+        """
+        bound = self._copy()
+        for symbol_id, symbol in enumerate(self._symbols):
+            if symbol.name in values:
+                mask = bound._symbol[:bound._size] == symbol_id
+                bound._theta[:bound._size][mask] = float(values[symbol.name])
+                bound._symbol[:bound._size][mask] = -1
+        return bound
+
+    def fingerprint(self, parameter_agnostic: bool = False) -> str:
+        """
+        Structural digest computed over the raw arrays in one pass.
+        parameter_agnostic ignores angles, as in QuantumCircuit.fingerprint().
+        (The two representations use different digests.)
+        """
+        return self.range_fingerprint(0, self._size, parameter_agnostic, measurements=True)
+
+    def prefix_fingerprint(self, num_gates: int, parameter_agnostic: bool = False) -> str:
+        """
+        Digest of the first num_gates gates (without measurements).
+        """
+        return self.range_fingerprint(0, num_gates, parameter_agnostic)
+
+    def range_fingerprint(self, start: int, stop: int, parameter_agnostic: bool = False,
+                          measurements: bool = False) -> str:
+        """
+        Digest of gates[start:stop] (plus the measurements if requested),
+        equal to the digest of that CompactCircuit built explicitly.
+        """
+        if not 0 <= start <= stop <= self._size:
+            raise ValueError(f"Gate range [{start}, {stop}) is outside the circuit's {self._size} gates.")
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(np.array([len(self.qubits), stop - start], dtype=np.int64).tobytes())
+        columns = (self._opcodes, self._q0, self._q1) if parameter_agnostic else \
+            (self._opcodes, self._q0, self._q1, self._theta)
+        for column in columns:
+            digest.update(column[start:stop].tobytes())
+        if not parameter_agnostic:
+            # Symbolic angles (NaN in the angle column) by name, in order:
+            # ids depend on where the range starts
+            ids = self._symbol[start:stop]
+            digest.update(repr([self._symbols[i].name for i in ids[ids >= 0].tolist()]).encode())
+        if measurements:
+            digest.update(np.asarray(self.measurements, dtype=np.int64).tobytes())
+        return digest.hexdigest()
+
+    def __repr__(self) -> str:
+        return f"CompactCircuit(qubits={len(self.qubits)}, gates={self._size})"
+
+    # ---------- Internals ----------
+    def _allocate(self, capacity: int):
+        self._opcodes = np.zeros(capacity, dtype=np.uint8)
+        self._q0 = np.full(capacity, -1, dtype=np.int32)
+        self._q1 = np.full(capacity, -1, dtype=np.int32)
+        self._theta = np.full(capacity, np.nan, dtype=np.float64)
+        self._symbol = np.full(capacity, -1, dtype=np.int32)
+
+    def _reserve(self, capacity: int):
+        if capacity <= len(self._opcodes):
+            return
+        old = (self._opcodes, self._q0, self._q1, self._theta, self._symbol)
+        self._allocate(max(capacity, 2 * len(self._opcodes)))
+        for new, previous in zip((self._opcodes, self._q0, self._q1, self._theta, self._symbol), old):
+            new[:self._size] = previous[:self._size]
+
+    def _append(self, opcode: int, first: int, second: int = None, theta: Union[float, Parameter, str] = None):
+        # Same checks as append_columns, all before anything is written.
+        # Index through the qubit list: same bounds behaviour as QuantumCircuit
+        q0 = self.qubits[first].index
+        q1 = None if second is None else self.qubits[second].index
+        if (opcode in TWO_QUBIT_OPCODES) != (q1 is not None) or q0 == q1:
+            raise ValueError("Second qubit operands must match the gate arity.")
+        if isinstance(theta, str):
+            theta = Parameter(theta)
+        if opcode in ROTATION_OPCODES:
+            if not isinstance(theta, Parameter) and (theta is None or not np.isfinite(theta)):
+                raise ValueError("Rotations need a finite angle or a parameter.")
+        elif theta is not None:
+            raise ValueError("Only rotations take an angle.")
+
+        if self._size == len(self._opcodes):
+            self._reserve(self._size + 1)
+        i = self._size
+        self._opcodes[i] = opcode
+        self._q0[i] = q0
+        if q1 is not None:
+            self._q1[i] = q1
+        if isinstance(theta, Parameter):
+            self._symbol[i] = self._parameter_id(theta)
+        elif theta is not None:
+            self._theta[i] = theta
+        self._size += 1
+        return self
+
+    def _parameter_id(self, parameter: Parameter) -> int:
+        if parameter not in self._symbol_ids:
+            self._symbol_ids[parameter] = len(self._symbols)
+            self._symbols.append(parameter)
+        return self._symbol_ids[parameter]
+
+    def _view(self, i: int) -> Gate:
+        gate_class = GATE_CLASSES[self._opcodes[i]]
+        first = self.qubits[self._q0[i]]
+        if self._q1[i] >= 0:
+            return gate_class(first, self.qubits[self._q1[i]])
+        if issubclass(gate_class, RotationGate):
+            symbol = self._symbol[i]
+            return gate_class(first, self._symbols[symbol] if symbol >= 0 else float(self._theta[i]))
+        return gate_class(first)
+
+    def _copy(self) -> "CompactCircuit":
+        copy = CompactCircuit(len(self.qubits), capacity=max(self._size, 1))
+        for new, column in zip((copy._opcodes, copy._q0, copy._q1, copy._theta, copy._symbol),
+                               (self._opcodes, self._q0, self._q1, self._theta, self._symbol)):
+            new[:self._size] = column[:self._size]
+        copy._size = self._size
+        copy._symbols = list(self._symbols)
+        copy._symbol_ids = dict(self._symbol_ids)
+        copy.measurements = list(self.measurements)
+        return copy
+
+    def _readonly(self, column: np.ndarray) -> np.ndarray:
+        view = column[:self._size]
+        view.flags.writeable = False
+        return view
@@ -0,0 +1,86 @@
+import functools
+import hashlib
+import struct
+from array import array
+from .parameter import Parameter
+from .gates import UnitaryGate
+
+# Polynomial hashing modulo the Mersenne prime 2^61 - 1
+MODULUS = (1 << 61) - 1
+_BASE = 0x0DD6F1C7A5B3E291
+_MIX = 0x0174E1C2F5A3B6D9
+
+# Tokens of angle-free gates; those are flyweights, so this stays small
+_FIXED_TOKENS = {}
+
+def _stable_bytes_int(data: bytes) -> int:
+    # hash() changes between processes; fingerprints must not
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little") % MODULUS
+
+@functools.lru_cache(maxsize=4096)
+def _stable_int(text: str) -> int:
+    # Gate and parameter names: a small, recurring vocabulary
+    return _stable_bytes_int(text.encode())
+
+def gate_token(gate, parameter_agnostic: bool = False) -> int:
+    """
+    Encodes one gate (name, target indices, angle) as an integer that is
+    stable across processes. With parameter_agnostic, every angle (value or
+    Parameter) encodes the same, so circuits differing only in angles match.
+    """
+    token = _FIXED_TOKENS.get(gate)
+    if token is not None:
+        return token
+    token = _stable_int(gate.name)
+    for qubit in gate.targets:
+        token = (token * _MIX + qubit.index + 1) % MODULUS
+    if isinstance(gate, UnitaryGate):
+        # Matrices are (almost) never repeated, so they bypass the name cache
+        return (token * _MIX + _stable_bytes_int(gate.matrix.tobytes())) % MODULUS
+    theta = getattr(gate, "theta", None)
+    if theta is None:
+        _FIXED_TOKENS[gate] = token
+    else:
+        if parameter_agnostic:
+            value = _stable_int("<angle>")
+        elif isinstance(theta, Parameter):
+            value = _stable_int("parameter:" + theta.name)
+        else:
+            value = struct.unpack("<Q", struct.pack("<d", float(theta)))[0] % MODULUS
+        token = (token * _MIX + value) % MODULUS
+    return token
+
+def digest(num_qubits: int, length: int, gates_hash: int, measurements_hash: int = 0) -> str:
+    """
+    Formats the rolling hashes of a circuit as a fixed-size hex fingerprint.
+    """
+    packed = struct.pack("<QQQQ", num_qubits, length, gates_hash, measurements_hash)
+    return hashlib.blake2b(packed, digest_size=16).hexdigest()
+
+class RollingHash:
+    """
+    Polynomial hash of a growing token sequence that keeps every prefix.
+
+    append() is O(1) and prefix(k) returns the hash of the first k tokens,
+    so every prefix of a circuit is addressable without rehashing it.
+    range(i, j) derives the hash of tokens[i:j] from two prefixes; it
+    equals the hash of those tokens appended to an empty RollingHash.
+    """
+    def __init__(self):
+        self._prefixes = array("Q", [0])
+
+    def __len__(self) -> int:
+        return len(self._prefixes) - 1
+
+    def append(self, token: int):
+        self._prefixes.append((self._prefixes[-1] * _BASE + token) % MODULUS)
+
+    def prefix(self, length: int) -> int:
+        return self._prefixes[length]
+
+    def range(self, start: int, stop: int) -> int:
+        shift = pow(_BASE, stop - start, MODULUS)
+        return (self._prefixes[stop] - self._prefixes[start] * shift) % MODULUS
+
+    def clear(self):
+        del self._prefixes[1:]
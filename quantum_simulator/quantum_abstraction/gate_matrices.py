@@ -0,0 +1,56 @@
+import functools
+import numpy as np
+
+# Gate unitaries (same conventions as Qiskit). Every array handed out is
+# read-only, so the constants and cached rotations can be shared freely.
+# Two-qubit matrices use the basis |a b⟩ with the gate's first target as
+# the most significant bit, i.e. the textbook [[1,0,0,0],...] layout.
+
+def _constant(rows) -> np.ndarray:
+    matrix = np.array(rows, dtype=complex)
+    matrix.flags.writeable = False
+    return matrix
+
+_SQRT1_2 = 1 / np.sqrt(2)
+H = _constant([[_SQRT1_2, _SQRT1_2], [_SQRT1_2, -_SQRT1_2]])
+X = _constant([[0, 1], [1, 0]])
+Y = _constant([[0, -1j], [1j, 0]])
+Z = _constant([[1, 0], [0, -1]])
+S = _constant([[1, 0], [0, 1j]])
+T = _constant([[1, 0], [0, np.exp(1j * np.pi / 4)]])
+CNOT = _constant([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]])
+SWAP = _constant([[1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0], [0, 0, 0, 1]])
+
+ROTATION_AXES = ("RX", "RY", "RZ")
+
+@functools.lru_cache(maxsize=4096)
+def rotation_matrix(axis: str, theta: float) -> np.ndarray:
+    """
+    Returns the (cached, read-only) 2x2 unitary of RX/RY/RZ(theta).
+    """
+    matrix = rotation_matrices(axis, np.array([theta]))[0]
+    matrix.flags.writeable = False
+    return matrix
+
+def rotation_matrices(axis: str, thetas) -> np.ndarray:
+    """
+    Builds the unitaries of RX/RY/RZ for an array of angles at once,
+    as a (len(thetas), 2, 2) array.
+    """
+    if axis not in ROTATION_AXES:
+        raise ValueError(f"Unknown rotation axis: {axis}")
+    half = np.asarray(thetas, dtype=np.float64) / 2
+    matrices = np.zeros(half.shape + (2, 2), dtype=complex)
+    if axis == "RZ":
+        matrices[..., 0, 0] = np.exp(-1j * half)
+        matrices[..., 1, 1] = np.exp(1j * half)
+        return matrices
+    c, s = np.cos(half), np.sin(half)
+    matrices[..., 0, 0] = c
+    matrices[..., 1, 1] = c
+    if axis == "RX":
+        matrices[..., 0, 1] = matrices[..., 1, 0] = -1j * s
+    else:
+        matrices[..., 0, 1] = -s
+        matrices[..., 1, 0] = s
+    return matrices
@@ -1,12 +1,33 @@
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple, Union
+import numpy as np
 from .qubit import Qubit
+from .parameter import Parameter
+from . import gate_matrices
+
+# (gate class, targets) -> the single shared instance of a fixed gate
+_FLYWEIGHTS: Dict[Tuple, "Gate"] = {}
+
+def _shared_instance(cls, targets: Tuple[Qubit, ...]) -> "Gate":
+    gate = _FLYWEIGHTS.get((cls, targets))
+    if gate is None:
+        gate = _FLYWEIGHTS.setdefault((cls, targets), object.__new__(cls))
+    return gate
 
 class Gate(ABC):
     """
     Base abstraction for a Quantum Gate.
     A gate is a unitary operation applied to one or more qubits.
+
+    Gates are slotted and their targets are an immutable tuple built once.
+    Gates without parameters are flyweights: constructing the same gate on
+    the same qubits returns one shared instance, in any circuit.
+    matrix is the gate's unitary as a shared read-only array (see
+    gate_matrices for the conventions), or None for custom gates that
+    only define a translation.
     """
+    __slots__ = ()
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -14,9 +35,13 @@ class Gate(ABC):
 
     @property
     @abstractmethod
-    def targets(self) -> List[Qubit]:
+    def targets(self) -> Tuple[Qubit, ...]:
         pass
 
+    @property
+    def matrix(self) -> Optional[np.ndarray]:
+        return None
+
     def __repr__(self) -> str:
         targets_str = ", ".join([str(q.index) for q in self.targets])
         return f"{self.name}({targets_str})"
@@ -25,12 +50,20 @@ class SingleQubitGate(Gate, ABC):
     """
     Abstract class for gates that act on a single qubit.
     """
+    __slots__ = ("_targets",)
+
+    def __new__(cls, target: Qubit, *args):
+        return _shared_instance(cls, (target,))
+
     def __init__(self, target: Qubit):
-        self._target = target
+        self._targets = (target,)
 
     @property
-    def targets(self) -> List[Qubit]:
-        return [self._target]
+    def targets(self) -> Tuple[Qubit, ...]:
+        return self._targets
+
+    def __reduce__(self):
+        return type(self), self._targets
 
 class HadamardGate(SingleQubitGate):
     """
@@ -38,128 +71,271 @@ class HadamardGate(SingleQubitGate):
     Matrix: 1/√2 * [[1, 1], [1, -1]]
     Effect: Map |0⟩ to (|0⟩ + |1⟩)/√2 and |1⟩ to (|0⟩ - |1⟩)/√2.
     """
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         return "H"
 
+    @property
+    def matrix(self) -> np.ndarray:
+        return gate_matrices.H
+
 class PauliXGate(SingleQubitGate):
     """
     Pauli-X Gate: Quantum NOT gate.
     Matrix: [[0, 1], [1, 0]]
     Effect: Bit flip. Map |0⟩ to |1⟩ and |1⟩ to |0⟩.
     """
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         return "X"
 
+    @property
+    def matrix(self) -> np.ndarray:
+        return gate_matrices.X
+
 class PauliYGate(SingleQubitGate):
     """
     Pauli-Y Gate: Complex rotation.
     Matrix: [[0, -i], [i, 0]]
     Effect: Bit and phase flip.
     """
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         return "Y"
 
+    @property
+    def matrix(self) -> np.ndarray:
+        return gate_matrices.Y
+
 class PauliZGate(SingleQubitGate):
     """
     Pauli-Z Gate: Phase flip.
     Matrix: [[1, 0], [0, -1]]
     Effect: Maps |1⟩ to -|1⟩, leaves |0⟩ unchanged.
     """
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         return "Z"
 
+    @property
+    def matrix(self) -> np.ndarray:
+        return gate_matrices.Z
+
 class MultiQubitGate(Gate, ABC):
     """
     Abstract class for gates that act on multiple qubits.
+    Subclasses take their qubits as positional arguments, which must be
+    distinct.
     """
+    __slots__ = ("_targets",)
+
+    def __new__(cls, *targets: Qubit):
+        # Checked before the flyweight is cached, so no invalid gate is ever shared
+        if len(set(targets)) != len(targets):
+            raise ValueError(f"{cls.__name__} needs distinct qubits, got {[q.index for q in targets]}.")
+        return _shared_instance(cls, targets)
+
     def __init__(self, targets: List[Qubit]):
-        self._targets = targets
+        self._targets = tuple(targets)
 
     @property
-    def targets(self) -> List[Qubit]:
+    def targets(self) -> Tuple[Qubit, ...]:
         return self._targets
 
+    def __reduce__(self):
+        return type(self), self._targets
+
 class CNOTGate(MultiQubitGate):
     """
     Controlled-NOT Gate (CX): Creates entanglement.
     Targets: [Control Qubit, Target Qubit]
+    Matrix: [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]] (control first)
     Effect: Flips the target qubit if the control qubit is |1⟩.
     """
+    __slots__ = ()
+
     def __init__(self, control: Qubit, target: Qubit):
-        super().__init__([control, target])
-        self.control = control
-        self.target = target
+        super().__init__((control, target))
+
+    @property
+    def control(self) -> Qubit:
+        return self._targets[0]
+
+    @property
+    def target(self) -> Qubit:
+        return self._targets[1]
 
     @property
     def name(self) -> str:
         return "CNOT"
 
+    @property
+    def matrix(self) -> np.ndarray:
+        return gate_matrices.CNOT
+
 class PhaseGate(SingleQubitGate):
     """
     S Gate (Phase Gate): Rotation by PI/2 around Z-axis.
     Matrix: [[1, 0], [0, i]]
     """
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         return "S"
 
+    @property
+    def matrix(self) -> np.ndarray:
+        return gate_matrices.S
+
 class TGate(SingleQubitGate):
     """
     T Gate: Rotation by PI/4 around Z-axis.
     Matrix: [[1, 0], [0, e^(i*pi/4)]]
     """
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         return "T"
 
+    @property
+    def matrix(self) -> np.ndarray:
+        return gate_matrices.T
+
 class RotationGate(SingleQubitGate):
     """
     Abstract class for parameterized rotation gates.
+    Theta is either a concrete angle or a named Parameter bound later.
+    Rotations carry their own angle, so they are not shared; the angle is
+    read-only (circuit fingerprints hash it once). Subclasses set AXIS, the
+    gate_matrices rotation axis, which is also the gate's name.
     """
-    def __init__(self, target: Qubit, theta: float):
+    __slots__ = ("_theta",)
+    AXIS: str
+
+    def __new__(cls, target: Qubit, theta: Union[float, Parameter, str]):
+        return object.__new__(cls)
+
+    def __init__(self, target: Qubit, theta: Union[float, Parameter, str]):
         super().__init__(target)
-        self.theta = theta
-    
+        self._theta = Parameter(theta) if isinstance(theta, str) else theta
+
+    def __reduce__(self):
+        return type(self), (self._targets[0], self._theta)
+
+    @property
+    def theta(self) -> Union[float, Parameter]:
+        return self._theta
+
+    @property
+    def name(self) -> str:
+        return self.AXIS
+
+    @property
+    def is_parameterized(self) -> bool:
+        return isinstance(self.theta, Parameter)
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """
+        Unitary for the bound angle, shared through an LRU cache keyed on theta.
+        """
+        if self.is_parameterized:
+            raise ValueError(f"Parameter '{self.theta.name}' must be bound before building the matrix.")
+        return gate_matrices.rotation_matrix(self.AXIS, float(self.theta))
+
+    @classmethod
+    def matrices(cls, thetas) -> np.ndarray:
+        """
+        Unitaries of this rotation for an array of angles, shape (len(thetas), 2, 2).
+        """
+        return gate_matrices.rotation_matrices(cls.AXIS, thetas)
+
     def __repr__(self) -> str:
+         if self.is_parameterized:
+             return f"{self.name}({self.targets[0].index}, theta={self.theta.name})"
          return f"{self.name}({self.targets[0].index}, theta={self.theta:.2f})"
 
 class RXGate(RotationGate):
     """
     RX Gate: Rotation around X-axis by theta.
+    Matrix: [[cos(θ/2), -i*sin(θ/2)], [-i*sin(θ/2), cos(θ/2)]]
     """
-    @property
-    def name(self) -> str:
-        return "RX"
+    __slots__ = ()
+    AXIS = "RX"
 
 class RYGate(RotationGate):
     """
     RY Gate: Rotation around Y-axis by theta.
+    Matrix: [[cos(θ/2), -sin(θ/2)], [sin(θ/2), cos(θ/2)]]
     """
-    @property
-    def name(self) -> str:
-        return "RY"
+    __slots__ = ()
+    AXIS = "RY"
 
 class RZGate(RotationGate):
     """
     RZ Gate: Rotation around Z-axis by theta.
+    Matrix: [[e^(-iθ/2), 0], [0, e^(iθ/2)]]
     """
-    @property
-    def name(self) -> str:
-        return "RZ"
+    __slots__ = ()
+    AXIS = "RZ"
 
 class SwapGate(MultiQubitGate):
     """
     SWAP Gate: Swaps states of two qubits.
+    Matrix: [[1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0], [0, 0, 0, 1]]
     """
+    __slots__ = ()
+
     def __init__(self, qubit1: Qubit, qubit2: Qubit):
-        super().__init__([qubit1, qubit2])
-        self.q1 = qubit1
-        self.q2 = qubit2
+        super().__init__((qubit1, qubit2))
+
+    @property
+    def q1(self) -> Qubit:
+        return self._targets[0]
+
+    @property
+    def q2(self) -> Qubit:
+        return self._targets[1]
 
     @property
     def name(self) -> str:
         return "SWAP"
+
+    @property
+    def matrix(self) -> np.ndarray:
+        return gate_matrices.SWAP
+
+class UnitaryGate(SingleQubitGate):
+    """
+    Arbitrary single-qubit unitary given by its 2x2 matrix,
+    e.g. a run of single-qubit gates fused by the optimizer.
+    """
+    __slots__ = ("matrix",)
+
+    def __new__(cls, target: Qubit, matrix: np.ndarray):
+        return object.__new__(cls)
+
+    def __init__(self, target: Qubit, matrix: np.ndarray):
+        super().__init__(target)
+        matrix = np.array(matrix, dtype=complex)
+        if matrix.shape != (2, 2):
+            raise ValueError(f"A single-qubit unitary must be 2x2, got shape {matrix.shape}.")
+        matrix.flags.writeable = False
+        self.matrix = matrix
+
+    @property
+    def name(self) -> str:
+        return "U"
+
+    def __reduce__(self):
+        return type(self), (self._targets[0], self.matrix)
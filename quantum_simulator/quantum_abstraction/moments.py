@@ -0,0 +1,64 @@
+from array import array
+from typing import List, Sequence
+
+class MomentIndex:
+    """
+    As-soon-as-possible layering of a gate sequence, maintained incrementally.
+
+    Each appended gate goes into the first moment after the last moment used
+    by any of its qubits, so gates in the same moment act on disjoint qubits
+    and can be applied together. append() is O(number of targets): it only
+    reads and bumps the per-qubit next-free-moment pointers.
+    """
+    def __init__(self, num_qubits: int):
+        self._next_free = [0] * num_qubits
+        self._counts = [0] * num_qubits
+        self._moments = array("l")
+        self._moment_sizes: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self._moments)
+
+    def append(self, qubit_indices: Sequence[int]):
+        """
+        Places the next gate, given the indices of the qubits it acts on.
+        """
+        moment = max(self._next_free[i] for i in qubit_indices)
+        for i in qubit_indices:
+            self._next_free[i] = moment + 1
+            self._counts[i] += 1
+        self._moments.append(moment)
+        if moment == len(self._moment_sizes):
+            self._moment_sizes.append(0)
+        self._moment_sizes[moment] += 1
+
+    @property
+    def depth(self) -> int:
+        return len(self._moment_sizes)
+
+    def moment_of(self, gate_index: int) -> int:
+        return self._moments[gate_index]
+
+    def last_moment(self, qubit_index: int) -> int:
+        """
+        Moment of the last gate on a qubit (-1 if the qubit is idle).
+        """
+        return self._next_free[qubit_index] - 1
+
+    def qubit_depths(self) -> List[int]:
+        return list(self._next_free)
+
+    def qubit_gate_counts(self) -> List[int]:
+        return list(self._counts)
+
+    def moment_sizes(self) -> List[int]:
+        return list(self._moment_sizes)
+
+    def layers(self) -> List[List[int]]:
+        """
+        Gate indices grouped by moment, in program order within a moment.
+        """
+        layers: List[List[int]] = [[] for _ in self._moment_sizes]
+        for gate_index, moment in enumerate(self._moments):
+            layers[moment].append(gate_index)
+        return layers
@@ -0,0 +1,164 @@
+import math
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from .circuit_builder import QuantumCircuit
+from .circuit_analysis import CLIFFORD_GATES
+from .gates import (
+    Gate, HadamardGate, PauliXGate, PauliYGate, PauliZGate, CNOTGate, SwapGate,
+    RotationGate, UnitaryGate
+)
+
+# Gates that are their own inverse: two in a row on the same qubits are the identity
+SELF_INVERSE_GATES = (HadamardGate, PauliXGate, PauliYGate, PauliZGate, CNOTGate, SwapGate)
+
+@dataclass(frozen=True)
+class OptimizationReport:
+    """
+    Gate counts (by gate name) before and after optimization, and what
+    each rewrite removed.
+    """
+    gate_counts_before: Dict[str, int]
+    gate_counts_after: Dict[str, int]
+    cancelled_pairs: int
+    merged_rotations: int
+    fused_runs: int
+
+    @property
+    def gates_before(self) -> int:
+        return sum(self.gate_counts_before.values())
+
+    @property
+    def gates_after(self) -> int:
+        return sum(self.gate_counts_after.values())
+
+    def __str__(self) -> str:
+        return (f"{self.gates_before} -> {self.gates_after} gates ({self.cancelled_pairs} pairs cancelled, "
+                f"{self.merged_rotations} rotations merged, {self.fused_runs} runs fused)")
+
+class CircuitOptimizer:
+    """
+    Rewrites the logical gate list before translation.
+
+    1. Cancellation: adjacent identical self-inverse gates on the same qubits
+       (H·H, X·X, Y·Y, Z·Z, CX·CX, SWAP·SWAP) are removed. Removing a pair can
+       make the gates around it adjacent, so H·X·X·H disappears entirely.
+    2. Rotation merging: adjacent rotations about the same axis on the same
+       qubit become one rotation by the summed angle (dropped if it is a
+       multiple of 4π). Symbolic angles are left alone.
+    3. Fusion: every remaining run of two or more single-qubit gates on a
+       qubit becomes one UnitaryGate. Skipped for all-Clifford circuits so
+       they stay eligible for the stabilizer method.
+
+    Gates are adjacent when no other gate touches their qubits in between.
+    Each pass is a single sweep over the gates.
+    """
+    @staticmethod
+    def optimize(circuit: QuantumCircuit, fuse: bool = True) -> Tuple[QuantumCircuit, OptimizationReport]:
+        """
+        Returns the optimized circuit (the input is not modified) and a report.
+        """
+        gates, cancelled, merged = CircuitOptimizer._cancel_and_merge(circuit)
+        fused = 0
+        if fuse and not all(isinstance(gate, CLIFFORD_GATES) for gate in gates):
+            gates, fused = CircuitOptimizer._fuse(gates, len(circuit.qubits))
+
+        optimized = QuantumCircuit(len(circuit.qubits))
+        optimized.gates = gates
+        optimized.measurements = list(circuit.measurements)
+        report = OptimizationReport(
+            gate_counts_before=dict(Counter(gate.name for gate in circuit.gates)),
+            gate_counts_after=dict(Counter(gate.name for gate in gates)),
+            cancelled_pairs=cancelled,
+            merged_rotations=merged,
+            fused_runs=fused,
+        )
+        return optimized, report
+
+    # ---------- Passes ----------
+    @staticmethod
+    def _cancel_and_merge(circuit: QuantumCircuit) -> Tuple[List[Gate], int, int]:
+        kept: List[Optional[Gate]] = []
+        # Per qubit: positions in kept of the gates on that wire, in order
+        wires: List[List[int]] = [[] for _ in circuit.qubits]
+        cancelled = merged = 0
+
+        for gate in circuit.gates:
+            indices = [q.index for q in gate.targets]
+            last = wires[indices[0]][-1] if wires[indices[0]] else None
+            if last is not None and all(wires[i] and wires[i][-1] == last for i in indices):
+                previous = kept[last]
+                if CircuitOptimizer._cancels(previous, gate):
+                    kept[last] = None
+                    for i in indices:
+                        wires[i].pop()
+                    cancelled += 1
+                    continue
+                if CircuitOptimizer._mergeable(previous, gate):
+                    merged += 1
+                    theta = previous.theta + gate.theta
+                    if math.isclose(math.remainder(theta, 4 * math.pi), 0.0, abs_tol=1e-12):
+                        kept[last] = None
+                        wires[indices[0]].pop()
+                    else:
+                        kept[last] = type(gate)(gate.targets[0], theta)
+                    continue
+
+            kept.append(gate)
+            for i in indices:
+                wires[i].append(len(kept) - 1)
+
+        return [gate for gate in kept if gate is not None], cancelled, merged
+
+    @staticmethod
+    def _fuse(gates: List[Gate], num_qubits: int) -> Tuple[List[Optional[Gate]], int]:
+        fused: List[Optional[Gate]] = list(gates)
+        runs: List[List[int]] = [[] for _ in range(num_qubits)]
+        count = 0
+
+        def flush(qubit_index: int):
+            nonlocal count
+            run = runs[qubit_index]
+            if len(run) >= 2:
+                matrix = np.eye(2, dtype=complex)
+                for position in run:
+                    matrix = fused[position].matrix @ matrix
+                    fused[position] = None
+                # The fused gate takes the place of the run's last gate
+                fused[run[-1]] = UnitaryGate(gates[run[-1]].targets[0], matrix)
+                count += 1
+            runs[qubit_index] = []
+
+        for position, gate in enumerate(gates):
+            targets = gate.targets
+            if len(targets) == 1 and CircuitOptimizer._fusible(gate):
+                runs[targets[0].index].append(position)
+            else:
+                for qubit in targets:
+                    flush(qubit.index)
+        for qubit_index in range(num_qubits):
+            flush(qubit_index)
+
+        return [gate for gate in fused if gate is not None], count
+
+    # ---------- Rules ----------
+    @staticmethod
+    def _cancels(previous: Gate, gate: Gate) -> bool:
+        if type(previous) is not type(gate) or not isinstance(gate, SELF_INVERSE_GATES):
+            return False
+        if isinstance(gate, SwapGate):
+            return set(previous.targets) == set(gate.targets)
+        return previous.targets == gate.targets
+
+    @staticmethod
+    def _mergeable(previous: Gate, gate: Gate) -> bool:
+        return (type(previous) is type(gate) and isinstance(gate, RotationGate)
+                and not previous.is_parameterized and not gate.is_parameterized)
+
+    @staticmethod
+    def _fusible(gate: Gate) -> bool:
+        if isinstance(gate, RotationGate):
+            return not gate.is_parameterized
+        # Custom gates registered for translation may have no matrix
+        return gate.matrix is not None
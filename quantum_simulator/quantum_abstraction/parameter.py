@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class Parameter:
+    """
+    Named symbolic angle for parameterized rotation gates.
+
+    A circuit using parameters is translated and transpiled once; concrete
+    values are bound afterwards (e.g. many angles in a single sweep job).
+    Two parameters with the same name are the same parameter.
+    """
+    name: str
+
+    def __repr__(self) -> str:
+        return f"Parameter({self.name})"
@@ -1,16 +1,42 @@
-from dataclasses import dataclass
+from typing import Dict
 
-@dataclass(frozen=True)
 class Qubit:
     """
     Logical representation of a Qubit in the domain model.
     A qubit is identified by its index in a quantum register.
-    
+
     In quantum mechanics, a qubit is a two-state quantum-mechanical system.
     Mathematically, it is represented as a unit vector in a 2D complex Hilbert space.
     |ψ⟩ = α|0⟩ + β|1⟩ where |α|² + |β|² = 1.
+
+    Qubits are immutable and interned: Qubit(i) always returns the same
+    instance, shared by every circuit (also after unpickling).
     """
-    index: int
+    __slots__ = ("index",)
+    _interned: Dict[int, "Qubit"] = {}
+
+    def __new__(cls, index: int):
+        qubit = cls._interned.get(index)
+        if qubit is None:
+            qubit = object.__new__(cls)
+            object.__setattr__(qubit, "index", int(index))
+            qubit = cls._interned.setdefault(qubit.index, qubit)
+        return qubit
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Qubit is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Qubit is immutable")
+
+    def __reduce__(self):
+        return Qubit, (self.index,)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Qubit) and other.index == self.index
+
+    def __hash__(self) -> int:
+        return hash(self.index)
 
     def __repr__(self) -> str:
         return f"Qubit({self.index})"
@@ -0,0 +1,340 @@
+import ast
+import math
+import operator
+import re
+import struct
+from typing import BinaryIO, Dict, Iterator, List, TextIO, Union
+import numpy as np
+from .circuit_builder import QuantumCircuit
+from .compact_circuit import CompactCircuit
+from .gates import Gate, RotationGate
+from .parameter import Parameter
+
+# ---------- OpenQASM 3 ----------
+
+# Logical gate name -> OpenQASM 3 (stdgates.inc) name; the fluent
+# circuit methods carry the same names, so the reader calls them directly
+QASM_NAMES: Dict[str, str] = {
+    "H": "h", "X": "x", "Y": "y", "Z": "z", "T": "t", "S": "s",
+    "RX": "rx", "RY": "ry", "RZ": "rz", "CNOT": "cx", "SWAP": "swap",
+}
+_QASM_GATES = {qasm: name for name, qasm in QASM_NAMES.items()}
+# OpenQASM gate name -> (qubit operands, angle arguments)
+_QASM_ARITY = {name: (1, 0) for name in ("h", "x", "y", "z", "t", "s")}
+_QASM_ARITY.update({"rx": (1, 1), "ry": (1, 1), "rz": (1, 1), "cx": (2, 0), "swap": (2, 0)})
+_QUBIT_DECLARATION = re.compile(r"^qubit\s*\[\s*(\d+)\s*\]\s*(\w+)$")
+_BIT_DECLARATION = re.compile(r"^bit\s*\[\s*(\d+)\s*\]\s*(\w+)$")
+_INPUT_DECLARATION = re.compile(r"^input\s+(?:float\s*\[\s*\d+\s*\]|float|angle(?:\s*\[\s*\d+\s*\])?)\s+(\w+)$")
+_GATE = re.compile(r"^(\w+)\s*(?:\((.*)\))?\s+(.+)$")
+_OPERAND = re.compile(r"^(\w+)\s*\[\s*(\d+)\s*\]$")
+_MEASURE = re.compile(r"^(\w+)\s*\[\s*(\d+)\s*\]\s*=\s*measure\s+(\w+)\s*\[\s*(\d+)\s*\]$")
+_MEASURE_ARROW = re.compile(r"^measure\s+(\w+)\s*\[\s*(\d+)\s*\]\s*->\s*(\w+)\s*\[\s*(\d+)\s*\]$")
+_VERSION = re.compile(r"^OPENQASM\s+(\S+)$")
+# Names a parameter cannot take: the registers write_qasm3 declares, the
+# constants angle expressions use and the keywords the reader matches
+_RESERVED_NAMES = frozenset({"q", "c", "pi", "π", "tau", "τ", "input", "float", "angle", "qubit", "bit",
+                             "measure", "include", "OPENQASM"} | set(_QASM_ARITY))
+
+_BATCH = 4096
+
+# Largest qubit count the readers accept: a declared size is checked before
+# any qubit is allocated, so a forged file cannot request billions of them
+MAX_QUBITS = 4096
+
+def write_qasm3(circuit, stream: TextIO):
+    """
+    Writes a circuit (any circuit type, or a CircuitView) as OpenQASM 3.
+    Lines are produced and written in batches; no full text is built.
+    Raises ValueError if a parameter name is not a valid, unreserved
+    OpenQASM identifier.
+    """
+    parameters = circuit.parameters
+    for parameter in parameters:
+        if not parameter.name.isidentifier() or parameter.name in _RESERVED_NAMES:
+            raise ValueError(f"Parameter name {parameter.name!r} is not a usable OpenQASM identifier.")
+    stream.write('OPENQASM 3.0;\ninclude "stdgates.inc";\n')
+    for parameter in parameters:
+        stream.write(f"input float[64] {parameter.name};\n")
+    stream.write(f"qubit[{len(circuit.qubits)}] q;\n")
+    if circuit.measurements:
+        stream.write(f"bit[{len(circuit.measurements)}] c;\n")
+
+    lines: List[str] = []
+    for gate in circuit.gates:
+        lines.append(_qasm_statement(gate))
+        if len(lines) == _BATCH:
+            stream.writelines(lines)
+            lines.clear()
+    stream.writelines(lines)
+    stream.writelines(f"c[{i}] = measure q[{qubit_index}];\n" for i, qubit_index in enumerate(circuit.measurements))
+
+def read_qasm3(stream: Union[TextIO, str], circuit_class=QuantumCircuit, max_qubits: int = MAX_QUBITS):
+    """
+    Reads OpenQASM 3 (the subset write_qasm3 produces: one qubit register,
+    one bit register, stdgates h/x/y/z/t/s/rx/ry/rz/cx/swap, measurements
+    and float inputs as parameters) statement by statement, appending each
+    gate to a circuit_class (QuantumCircuit or CompactCircuit) as it is read.
+    Malformed input, including a register of more than max_qubits qubits or
+    a bit measured twice, raises ValueError.
+    """
+    if isinstance(stream, str):
+        stream = iter(stream.splitlines(keepends=True))
+    circuit = None
+    qubit_register = bit_register = None
+    num_qubits = num_bits = 0
+    parameters: Dict[str, Parameter] = {}
+    measured: Dict[int, int] = {}
+
+    for statement in _statements(stream):
+        if statement.startswith("OPENQASM"):
+            match = _VERSION.match(statement)
+            if not match or not match.group(1).startswith("3"):
+                raise ValueError(f"Unsupported OpenQASM version: {statement}")
+            continue
+        if statement.startswith("include"):
+            continue
+        match = _INPUT_DECLARATION.match(statement)
+        if match:
+            parameters[match.group(1)] = Parameter(match.group(1))
+            continue
+        match = _QUBIT_DECLARATION.match(statement)
+        if match:
+            if circuit is not None:
+                raise ValueError("Only one qubit register is supported.")
+            num_qubits = int(match.group(1))
+            if num_qubits > max_qubits:
+                raise ValueError(f"{num_qubits} qubits exceed the limit of {max_qubits}.")
+            circuit = circuit_class(num_qubits)
+            qubit_register = match.group(2)
+            continue
+        match = _BIT_DECLARATION.match(statement)
+        if match:
+            num_bits = int(match.group(1))
+            bit_register = match.group(2)
+            continue
+        if circuit is None:
+            raise ValueError(f"Statement before the qubit declaration: {statement}")
+
+        match = _MEASURE.match(statement) or _MEASURE_ARROW.match(statement)
+        if match:
+            if statement.startswith("measure"):
+                qreg, qubit_index, creg, bit_index = match.groups()
+            else:
+                creg, bit_index, qreg, qubit_index = match.groups()
+            if qreg != qubit_register or creg != bit_register:
+                raise ValueError(f"Unknown register in: {statement}")
+            if int(qubit_index) >= num_qubits or int(bit_index) >= num_bits:
+                raise ValueError(f"Index out of range in: {statement}")
+            if int(bit_index) in measured:
+                raise ValueError(f"Bit measured twice in: {statement}")
+            measured[int(bit_index)] = int(qubit_index)
+            continue
+
+        match = _GATE.match(statement)
+        if not match or match.group(1) not in _QASM_GATES:
+            raise ValueError(f"Unsupported statement: {statement}")
+        name, arguments, operands = match.groups()
+        num_operands, num_angles = _QASM_ARITY[name]
+        angles = [] if arguments is None else arguments.split(",")
+        if len(angles) != num_angles:
+            raise ValueError(f"{name} takes {num_angles} angle argument(s): {statement}")
+        operands = operands.split(",")
+        if len(operands) != num_operands:
+            raise ValueError(f"{name} takes {num_operands} qubit operand(s): {statement}")
+        qubit_indices = []
+        for operand in operands:
+            operand_match = _OPERAND.match(operand.strip())
+            if not operand_match or operand_match.group(1) != qubit_register:
+                raise ValueError(f"Bad operand in: {statement}")
+            qubit_indices.append(int(operand_match.group(2)))
+        if any(index >= num_qubits for index in qubit_indices) or len(set(qubit_indices)) != len(qubit_indices):
+            raise ValueError(f"Qubit operands out of range or repeated in: {statement}")
+        args = [_angle(angle.strip(), parameters) for angle in angles]
+        getattr(circuit, name)(*qubit_indices, *args)
+
+    if circuit is None:
+        raise ValueError("No qubit register declared.")
+    if sorted(measured) != list(range(len(measured))):
+        raise ValueError("Measurements must fill the bit register from index 0.")
+    circuit.measurements = [measured[i] for i in range(len(measured))]
+    return circuit
+
+def _qasm_statement(gate: Gate) -> str:
+    name = QASM_NAMES.get(gate.name)
+    if name is None:
+        raise ValueError(f"{type(gate).__name__} has no OpenQASM 3 encoding.")
+    operands = ", ".join(f"q[{q.index}]" for q in gate.targets)
+    if isinstance(gate, RotationGate):
+        theta = gate.theta.name if gate.is_parameterized else repr(float(gate.theta))
+        return f"{name}({theta}) {operands};\n"
+    return f"{name} {operands};\n"
+
+def _statements(lines: Iterator[str]) -> Iterator[str]:
+    """
+    Yields ;-terminated statements from a stream of lines, without comments.
+    """
+    pending = ""
+    in_block_comment = False
+    for line in lines:
+        if in_block_comment or "/*" in line:
+            line, in_block_comment = _strip_block_comments(line, in_block_comment)
+        line = line.split("//", 1)[0]
+        if ";" not in line:
+            pending += line
+            continue
+        *complete, rest = (pending + line).split(";")
+        for statement in complete:
+            statement = " ".join(statement.split())
+            if statement:
+                yield statement
+        pending = rest
+    if pending.strip():
+        raise ValueError(f"Unterminated statement: {pending.strip()}")
+
+def _strip_block_comments(line: str, in_comment: bool):
+    kept = []
+    while line:
+        if in_comment:
+            end = line.find("*/")
+            if end < 0:
+                return "".join(kept), True
+            line, in_comment = line[end + 2:], False
+        else:
+            start = line.find("/*")
+            if start < 0:
+                kept.append(line)
+                break
+            kept.append(line[:start])
+            line, in_comment = line[start + 2:], True
+    return "".join(kept), in_comment
+
+_OPERATORS = {ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul, ast.Div: operator.truediv,
+              ast.Pow: operator.pow, ast.USub: operator.neg, ast.UAdd: operator.pos}
+
+def _angle(text: str, parameters: Dict[str, Parameter]):
+    """
+    Parses an angle: a declared input parameter, or an arithmetic
+    expression of numbers and pi/π/tau.
+    """
+    if text in parameters:
+        return parameters[text]
+
+    def evaluate(node):
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+            return float(node.value)
+        if isinstance(node, ast.Name) and node.id in ("pi", "π", "tau", "τ"):
+            return math.pi if node.id in ("pi", "π") else math.tau
+        if isinstance(node, ast.BinOp) and type(node.op) in _OPERATORS:
+            return _OPERATORS[type(node.op)](evaluate(node.left), evaluate(node.right))
+        if isinstance(node, ast.UnaryOp) and type(node.op) in _OPERATORS:
+            return _OPERATORS[type(node.op)](evaluate(node.operand))
+        raise ValueError(f"Unsupported angle expression: {text}")
+
+    try:
+        value = evaluate(ast.parse(text, mode="eval").body)
+    except (SyntaxError, OverflowError, ZeroDivisionError):
+        raise ValueError(f"Unsupported angle expression: {text}") from None
+    if not math.isfinite(value):
+        raise ValueError(f"Angle is not finite: {text}")
+    return value
+
+# ---------- Compact binary format ----------
+
+_BINARY_MAGIC = b"QCB1"
+# magic, qubits, gates, measurements, parameters
+_BINARY_HEADER = struct.Struct("<4sIQII")
+# One record per gate, the same columns as CompactCircuit (21 bytes)
+GATE_RECORD = np.dtype([("opcode", "u1"), ("q0", "<i4"), ("q1", "<i4"), ("theta", "<f8"), ("parameter", "<i4")])
+_CHUNK_GATES = 1 << 16
+
+def write_binary(circuit, stream: BinaryIO):
+    """
+    Writes a circuit as a header, a parameter name table, fixed-size gate
+    records and the measured qubits. CompactCircuit columns are written in
+    chunks straight from its arrays; other circuits are encoded first.
+    """
+    compact = circuit if isinstance(circuit, CompactCircuit) else CompactCircuit.from_circuit(circuit)
+    names = [parameter.name.encode() for parameter in compact.parameter_table]
+    num_gates = len(compact.opcodes)
+    stream.write(_BINARY_HEADER.pack(_BINARY_MAGIC, len(compact.qubits), num_gates,
+                                     len(compact.measurements), len(names)))
+    for name in names:
+        stream.write(struct.pack("<H", len(name)) + name)
+
+    columns = (compact.opcodes, compact.first_qubits, compact.second_qubits, compact.angles, compact.parameter_ids)
+    for start in range(0, num_gates, _CHUNK_GATES):
+        stop = min(start + _CHUNK_GATES, num_gates)
+        records = np.empty(stop - start, dtype=GATE_RECORD)
+        for field, column in zip(GATE_RECORD.names, columns):
+            records[field] = column[start:stop]
+        stream.write(records.tobytes())
+    stream.write(np.asarray(compact.measurements, dtype="<i4").tobytes())
+
+def read_binary(stream: BinaryIO, max_qubits: int = MAX_QUBITS) -> CompactCircuit:
+    """
+    Reads a circuit written by write_binary() into a CompactCircuit, one
+    chunk of gate records (validated by append_columns) or measurements at
+    a time. Malformed input, including a header declaring more than
+    max_qubits qubits, raises ValueError.
+    """
+    magic, num_qubits, num_gates, num_measurements, num_parameters = _BINARY_HEADER.unpack(
+        _read_exactly(stream, _BINARY_HEADER.size))
+    if magic != _BINARY_MAGIC:
+        raise ValueError("Not a binary circuit file.")
+    if num_qubits > max_qubits:
+        raise ValueError(f"{num_qubits} qubits exceed the limit of {max_qubits}.")
+    parameters = []
+    for _ in range(num_parameters):
+        (length,) = struct.unpack("<H", _read_exactly(stream, 2))
+        parameters.append(Parameter(_read_exactly(stream, length).decode()))
+
+    # The header is not trusted for allocation: the columns grow per chunk read
+    circuit = CompactCircuit(num_qubits)
+    remaining = num_gates
+    while remaining:
+        count = min(remaining, _CHUNK_GATES)
+        records = np.frombuffer(_read_exactly(stream, count * GATE_RECORD.itemsize), dtype=GATE_RECORD)
+        circuit.append_columns(records["opcode"], records["q0"], records["q1"], records["theta"],
+                               records["parameter"], parameters)
+        remaining -= count
+    measurements: List[int] = []
+    for start in range(0, num_measurements, _CHUNK_GATES):
+        count = min(num_measurements - start, _CHUNK_GATES)
+        chunk = np.frombuffer(_read_exactly(stream, 4 * count), dtype="<i4")
+        if np.any((chunk < 0) | (chunk >= num_qubits)):
+            raise ValueError("Measured qubit index out of range.")
+        measurements.extend(chunk.tolist())
+    circuit.measurements = measurements
+    return circuit
+
+def _read_exactly(stream: BinaryIO, size: int) -> bytes:
+    data = stream.read(size)
+    if len(data) != size:
+        raise ValueError("Truncated binary circuit file.")
+    return data
+
+# ---------- Files ----------
+
+QASM_SUFFIXES = (".qasm", ".qasm3")
+
+def save_circuit(circuit, path: str):
+    """
+    Saves a circuit as OpenQASM 3 (.qasm/.qasm3) or in the binary format.
+    """
+    if path.endswith(QASM_SUFFIXES):
+        with open(path, "w", encoding="utf-8") as f:
+            write_qasm3(circuit, f)
+    else:
+        with open(path, "wb") as f:
+            write_binary(circuit, f)
+
+def load_circuit(path: str, circuit_class=QuantumCircuit, max_qubits: int = MAX_QUBITS):
+    """
+    Loads a circuit saved by save_circuit(), streaming from the file.
+    """
+    if path.endswith(QASM_SUFFIXES):
+        with open(path, "r", encoding="utf-8") as f:
+            return read_qasm3(f, circuit_class, max_qubits)
+    with open(path, "rb") as f:
+        compact = read_binary(f, max_qubits)
+    return compact if circuit_class is CompactCircuit else compact.to_circuit()
@@ -0,0 +1,108 @@
+import itertools
+import threading
+import time
+from typing import Dict, List, Optional
+from qiskit_aer import AerSimulator
+from qiskit_aer.primitives import SamplerV2 as AerSampler
+
+class FakeRuntimeJob:
+    """
+    Stand-in for a runtime job: "QUEUED" until its queue delay has passed,
+    then executed locally on Aer the first time its result is needed.
+    """
+    def __init__(self, job_id: str, pubs: List, shots: int, queue_delay: float, seed: Optional[int] = None):
+        self._job_id = job_id
+        self._pubs = pubs
+        self._shots = shots
+        self._seed = seed
+        self._ready_at = time.monotonic() + queue_delay
+        self._result = None
+        self._cancelled = False
+        self._lock = threading.Lock()
+
+    def job_id(self) -> str:
+        return self._job_id
+
+    def status(self) -> str:
+        if self._cancelled:
+            return "CANCELLED"
+        return "DONE" if time.monotonic() >= self._ready_at else "QUEUED"
+
+    def done(self) -> bool:
+        return self.status() in ("DONE", "CANCELLED")
+
+    def cancel(self):
+        self._cancelled = True
+
+    def result(self):
+        if self._cancelled:
+            raise RuntimeError(f"Job {self._job_id} was cancelled.")
+        time.sleep(max(0.0, self._ready_at - time.monotonic()))
+        with self._lock:
+            if self._result is None:
+                sampler = AerSampler(seed=self._seed)
+                self._result = sampler.run(self._pubs, shots=self._shots).result()
+            return self._result
+
+class FakeRuntimeService:
+    """
+    Offline stand-in for QiskitRuntimeService.
+
+    Backends are local Aer simulators, every submitted job waits
+    queue_delay seconds in a simulated queue, and session opening takes
+    session_delay seconds. Jobs stay retrievable by ID through job(), like
+    on the real service. Use session_factory/sampler_factory to plug it
+    into HardwareBackend.
+    """
+    def __init__(self, queue_delay: float = 0.0, session_delay: float = 0.0, seed: Optional[int] = None):
+        self.queue_delay = queue_delay
+        self.session_delay = session_delay
+        self.seed = seed
+        self._jobs: Dict[str, FakeRuntimeJob] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self.jobs_submitted = 0
+
+    def backend(self, name: str = "fake_backend"):
+        return AerSimulator()
+
+    def job(self, job_id: str) -> FakeRuntimeJob:
+        with self._lock:
+            if job_id not in self._jobs:
+                raise ValueError(f"Unknown job: {job_id}")
+            return self._jobs[job_id]
+
+    def session_factory(self, backend) -> "FakeSession":
+        return FakeSession(self, backend)
+
+    def sampler_factory(self, session: "FakeSession") -> "FakeSampler":
+        return FakeSampler(session)
+
+    def _submit(self, pubs: List, shots: int) -> FakeRuntimeJob:
+        with self._lock:
+            job = FakeRuntimeJob(f"fake-job-{next(self._ids)}", list(pubs), shots, self.queue_delay, self.seed)
+            self._jobs[job.job_id()] = job
+            self.jobs_submitted += 1
+            return job
+
+class FakeSession:
+    def __init__(self, service: FakeRuntimeService, backend):
+        time.sleep(service.session_delay)
+        self.service = service
+        self.backend = backend
+        self.closed = False
+
+    def status(self) -> str:
+        return "Closed" if self.closed else "In progress, accepting new jobs"
+
+    def close(self):
+        self.closed = True
+
+class FakeSampler:
+    def __init__(self, session: FakeSession):
+        self.session = session
+
+    def run(self, pubs: List, shots: int = 1024) -> FakeRuntimeJob:
+        if self.session.closed:
+            raise RuntimeError("Session is closed.")
+        return self.session.service._submit(pubs, shots)
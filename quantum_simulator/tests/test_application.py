@@ -0,0 +1,499 @@
+import pytest
+import sys
+import os
+import math
+import asyncio
+import random
+import threading
+import time
+import numpy as np
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from quantum_simulator.quantum_abstraction.circuit_builder import QuantumCircuit
+from quantum_simulator.quantum_abstraction.parameter import Parameter
+from quantum_simulator.quantum_abstraction.gates import PauliZGate
+from quantum_simulator.application.simulation_manager import SimulationManager
+from quantum_simulator.application.circuit_controller import CircuitController
+from quantum_simulator.quantum_abstraction.circuit_view import CircuitView
+from quantum_simulator.application.prefix_state_cache import PrefixStateCache
+from quantum_simulator.application.admission_control import AdmissionController
+from quantum_simulator.application.hardware_job_manager import HardwareJobManager
+from quantum_simulator.execution.hardware_backend import HardwareBackend
+from quantum_simulator.tests.fake_runtime import FakeRuntimeService
+from quantum_simulator.execution.qiskit_engine import QiskitEngine
+from quantum_simulator.execution.seeding import SeedPolicy, derive_seeds
+from quantum_simulator.infrastructure.job_store import JobStore
+from quantum_simulator.infrastructure.result_cache import ResultCache
+from quantum_simulator.quantum_abstraction.circuit_analysis import CircuitAnalyzer
+from quantum_simulator.execution.numpy_engine import NumpyStatevectorBackend
+
+def ghz(num_qubits: int) -> QuantumCircuit:
+    circ = QuantumCircuit(num_qubits).h(0)
+    for i in range(num_qubits - 1):
+        circ.cx(i, i + 1)
+    return circ.measure_all()
+
+def test_large_clifford_circuit_uses_stabilizer():
+    manager = SimulationManager(method_qubit_limits={"statevector": 16, "stabilizer": 1000})
+    circ = ghz(200)
+    assert manager.select_method(circ) == "stabilizer"
+
+    counts, _ = manager.run_simulation(circ, shots=64, seed=3)
+    assert set(counts) <= {"0" * 200, "1" * 200}
+    assert sum(counts.values()) == 64
+
+def test_method_limits_are_enforced():
+    manager = SimulationManager(method_qubit_limits={"statevector": 4, "matrix_product_state": 8})
+    assert manager.select_method(QuantumCircuit(6).t(0).cx(0, 1).measure_all()) == "matrix_product_state"
+    with pytest.raises(ValueError, match="statevector limit"):
+        manager.run_simulation(QuantumCircuit(6).t(0).cx(0, 5).measure_all())
+    with pytest.raises(ValueError, match="limit"):
+        manager.get_statevector(QuantumCircuit(6).h(0))
+
+def test_admission_downgrades_then_rejects():
+    # 20-qubit statevector: 32 MiB in double precision, 16 MiB in single
+    general = CircuitAnalyzer.analyze(QuantumCircuit(20).t(0).cx(0, 19))
+    chain = CircuitAnalyzer.analyze(QuantumCircuit(20).t(0).cx(0, 1))
+    roomy = AdmissionController(memory_budget_bytes=64 * 2**20)
+    tight = AdmissionController(memory_budget_bytes=20 * 2**20)
+    tiny = AdmissionController(memory_budget_bytes=2**20)
+
+    assert roomy.decide(general, "statevector").action == AdmissionController.ADMIT
+    decision = tight.decide(general, "statevector")
+    assert (decision.action, decision.precision) == (AdmissionController.DOWNGRADE, "single")
+    decision = tiny.decide(chain, "statevector")
+    assert (decision.action, decision.method) == (AdmissionController.DOWNGRADE, "matrix_product_state")
+    assert tiny.decide(chain, "statevector", allow_method_change=False).action == AdmissionController.REJECT
+    assert AdmissionController(memory_probe=lambda: None).decide(general, "statevector").action == AdmissionController.ADMIT
+
+def test_manager_applies_admission_control():
+    manager = SimulationManager(admission=AdmissionController(memory_budget_bytes=2**20))
+    circ = QuantumCircuit(18).h(0).t(0).cx(0, 1).measure_all()
+    # Too big as a statevector, fine as a matrix product state
+    assert manager.plan_run(circ) == ("matrix_product_state", None)
+    counts, _ = manager.run_simulation(circ, shots=32)
+    assert sum(counts.values()) == 32
+    with pytest.raises(ValueError, match="Cannot simulate 18 qubits"):
+        manager.get_statevector(circ)
+
+def test_run_batch_preserves_order():
+    manager = SimulationManager()
+    circuits = [
+        QuantumCircuit(2).measure_all(),          # always |00>
+        QuantumCircuit(2).x(0).measure_all(),     # always |01>
+        QuantumCircuit(2).x(1).measure_all(),     # always |10>
+        QuantumCircuit(2).x(0).measure_all(),     # duplicate structure
+    ]
+    results = manager.run_batch(circuits, shots=32)
+    assert results == [{"00": 32}, {"01": 32}, {"10": 32}, {"01": 32}]
+
+def test_in_place_edits_do_not_serve_stale_results():
+    manager = SimulationManager()
+    circ = QuantumCircuit(1).x(0).measure_all()
+    assert manager.run_simulation(circ, shots=100)[0] == {"1": 100}
+    circ.gates[0] = PauliZGate(circ.qubits[0])
+    assert manager.run_simulation(circ, shots=100)[0] == {"0": 100}
+
+def test_run_batch_empty():
+    assert SimulationManager().run_batch([]) == []
+
+def test_seeded_batches_match_single_runs_on_every_path():
+    # Mixed methods (statevector and stabilizer), so Aer runs them circuit by circuit
+    circuits = [QuantumCircuit(3).ry(0, 1.1).ry(1, 0.7).cx(1, 2).t(2).measure_all(), ghz(3)]
+    seeds = derive_seeds(7, len(circuits))
+    for backend_type in ("aer_simulator", "numpy_statevector"):
+        single = SimulationManager(backend_type, resample_max_qubits=0)
+        expected = [single.run_simulation(circ, shots=256, seed=s)[0] for circ, s in zip(circuits, seeds)]
+        for resample_max_qubits in (0, 20):
+            manager = SimulationManager(backend_type, resample_max_qubits=resample_max_qubits)
+            assert manager.run_batch(circuits, shots=256, seed=7) == expected
+
+def test_seeded_batches_match_in_process_mode():
+    circuits = [QuantumCircuit(3).ry(0, 1.1).ry(1, 0.7).cx(1, 2).t(2).measure_all(), ghz(3)]
+    expected = SimulationManager().run_batch(circuits, shots=256, seed=7)
+    manager = SimulationManager(execution_mode="process", workers=2, timeout=60)
+    try:
+        assert manager.run_batch(circuits, shots=256, seed=7) == expected
+    finally:
+        manager.shutdown()
+
+def test_seeded_batch_runs_as_one_aer_job():
+    circuits = [QuantumCircuit(2).ry(0, 0.3 * k).cx(0, 1).t(1).h(1).measure_all() for k in range(1, 4)]
+    single = SimulationManager(resample_max_qubits=0)
+    expected = [single.run_simulation(circ, shots=128, seed=s)[0] for circ, s in zip(circuits, derive_seeds(5, 3))]
+
+    manager = SimulationManager()
+    def no_single_runs(*args, **kwargs):
+        raise AssertionError("batch fell back to per-circuit runs")
+    manager.simulator.run = no_single_runs
+    assert manager.run_batch(circuits, shots=128, seed=5) == expected
+
+def test_parameter_sweep_binds_in_one_job():
+    circ = QuantumCircuit(2)
+    circ.rx(0, "a").rx(1, "b").measure_all()
+    assert [p.name for p in circ.parameters] == ["a", "b"]
+
+    results = SimulationManager().run_parameter_sweep(
+        circ, {"a": [0.0, math.pi, 0.0], "b": [0.0, 0.0, math.pi]}, shots=16
+    )
+    assert results == [{"00": 16}, {"01": 16}, {"10": 16}]
+
+def test_unbound_parameters_are_rejected():
+    circ = QuantumCircuit(1).ry(0, Parameter("theta")).measure_all()
+    with pytest.raises(ValueError):
+        SimulationManager().run_simulation(circ)
+    with pytest.raises(ValueError):
+        SimulationManager().run_parameter_sweep(circ, {})
+
+    counts, _ = SimulationManager().run_simulation(circ.bind_parameters({"theta": math.pi}), shots=8)
+    assert counts == {"1": 8}
+
+def _random_circuit(num_qubits, num_gates):
+    rng = random.Random(7)
+    circ = QuantumCircuit(num_qubits)
+    for _ in range(num_gates):
+        kind = rng.choice(["h", "t", "rx", "cx"])
+        if kind == "cx":
+            a, b = rng.sample(range(num_qubits), 2)
+            circ.cx(a, b)
+        elif kind == "rx":
+            circ.rx(rng.randrange(num_qubits), rng.uniform(0, math.pi))
+        else:
+            getattr(circ, kind)(rng.randrange(num_qubits))
+    return circ
+
+def test_prefix_cache_steps_in_linear_time():
+    circ = _random_circuit(4, 200)
+    cache = PrefixStateCache(checkpoint_interval=8)
+    for step in range(201):
+        cache.get_state(circ, step)
+    for step in range(200, -1, -1):
+        cache.get_state(circ, step)
+    assert cache.gates_applied == 200
+
+    prefix = QuantumCircuit(4)
+    prefix.gates = circ.gates[:123]
+    expected = NumpyStatevectorBackend().statevector(prefix)
+    assert np.allclose(cache.get_state(circ, 123), expected)
+
+def test_prefix_cache_keeps_states_of_unchanged_prefix():
+    circ = _random_circuit(4, 40)
+    cache = PrefixStateCache(checkpoint_interval=8)
+    cache.get_state(circ, 40)
+
+    # An equal copy and an edited tail reuse the cached prefix states
+    edited = QuantumCircuit(4)
+    edited.gates = circ.gates[:30]
+    edited.x(0)
+    before = cache.gates_applied
+    cache.get_state(edited, 31)
+    assert cache.gates_applied - before <= 8
+    assert np.allclose(cache.get_state(edited, 31), NumpyStatevectorBackend().statevector(edited))
+    assert cache.get_state(circ, 32) is not None and cache.gates_applied - before <= 16
+
+def test_prefix_cache_respects_memory_budget():
+    circ = _random_circuit(6, 100)
+    state_bytes = (2 ** 6) * 16
+    cache = PrefixStateCache(checkpoint_interval=10, max_bytes=12 * state_bytes)
+    for step in range(101):
+        cache.get_state(circ, step)
+    assert cache.nbytes <= 12 * state_bytes
+
+    # Stepping backward replays at most one checkpoint interval
+    before = cache.gates_applied
+    cache.get_state(circ, 55)
+    assert cache.gates_applied - before <= 10
+
+def test_rerun_samples_from_cached_distribution():
+    manager = SimulationManager()
+    circ = QuantumCircuit(2).h(0).cx(0, 1).measure_all()
+    first, _ = manager.run_simulation(circ, shots=100, seed=11)
+    again, _ = manager.run_simulation(circ, shots=100, seed=11)
+    many, _ = manager.run_simulation(QuantumCircuit(2).h(0).cx(0, 1).measure_all(), shots=100000)
+    assert first == again
+    assert set(many) == {"00", "11"}
+    assert sum(many.values()) == 100000
+    assert manager.distribution_cache_info()["size"] == 1
+
+def test_process_pool_timeout_terminates_stuck_workers():
+    from quantum_simulator.application.process_executor import ProcessPoolRunner
+    runner = ProcessPoolRunner("numpy_statevector", workers=1, timeout=60)
+    try:
+        pid = runner.result(runner.submit(os.getpid))
+        with pytest.raises(TimeoutError):
+            runner.result(runner.submit(time.sleep, 30), timeout=0.5)
+        deadline = time.monotonic() + 10
+        while _process_running(pid) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert not _process_running(pid)
+        assert runner.result(runner.submit(os.getpid)) != pid
+    finally:
+        runner.shutdown()
+
+def _process_running(pid: int) -> bool:
+    import psutil
+    try:
+        return psutil.Process(pid).status() != psutil.STATUS_ZOMBIE
+    except psutil.NoSuchProcess:
+        return False
+
+def test_distribution_cache_is_bounded_by_bytes():
+    # A 2-qubit distribution holds four float64 probabilities
+    manager = SimulationManager(distribution_cache_bytes=2 * 4 * 8)
+    for target in range(3):
+        manager.run_simulation(QuantumCircuit(2).h(target % 2).x(1).rx(0, 0.1 * target).measure_all(), shots=10)
+    info = manager.distribution_cache_info()
+    assert info["size"] == 2
+    assert info["nbytes"] <= info["max_bytes"]
+
+def test_noisy_backend_is_not_resampled():
+    from qiskit_aer.noise import NoiseModel, ReadoutError
+    noise = NoiseModel()
+    noise.add_all_qubit_readout_error(ReadoutError([[0, 1], [1, 0]]))
+    manager = SimulationManager(noise_model=noise)
+    circ = QuantumCircuit(1).h(0).h(0).x(0).measure_all()
+    assert not manager._can_resample(circ)
+    counts, _ = manager.run_simulation(circ, shots=50, seed=3)
+    assert counts == {"0": 50}
+    assert manager.distribution_cache_info()["size"] == 0
+    assert not SimulationManager(basis_gates=["cx", "u"])._can_resample(circ)
+
+def test_process_mode_runs_in_workers_and_recovers():
+    manager = SimulationManager(execution_mode="process", workers=2, timeout=60)
+    try:
+        circuits = [QuantumCircuit(2).x(i % 2).measure_all() for i in range(4)]
+        assert manager.run_batch(circuits, shots=8) == [{"01": 8}, {"10": 8}, {"01": 8}, {"10": 8}]
+        assert np.allclose(manager.get_statevector(QuantumCircuit(1).x(0)), [0, 1])
+
+        pool = manager.process_pool
+        with pytest.raises(TimeoutError):
+            pool.result(pool.submit(time.sleep, 30), timeout=0.5)
+        with pytest.raises(RuntimeError):
+            pool.result(pool.submit(os._exit, 1))
+
+        counts, qiskit_circ = manager.run_simulation(QuantumCircuit(1).x(0).measure_all(), shots=8)
+        assert counts == {"1": 8}
+        assert qiskit_circ is None
+    finally:
+        manager.shutdown()
+
+def test_async_simulation_reports_progress():
+    manager = SimulationManager()
+    stages = []
+    counts, _ = asyncio.run(
+        manager.run_simulation_async(QuantumCircuit(1).x(0).measure_all(), shots=16, progress=stages.append)
+    )
+    assert counts == {"1": 16}
+    assert stages == ["translate", "transpile", "execute", "postprocess"]
+
+def test_sync_and_async_paths_agree():
+    circ = QuantumCircuit(3).h(0).rx(1, 0.4).cx(0, 2).measure_all()
+    for backend_type, resample_max_qubits in (("aer_simulator", 20), ("aer_simulator", 0), ("numpy_statevector", 20)):
+        manager = SimulationManager(backend_type, resample_max_qubits=resample_max_qubits)
+        counts, _ = manager.run_simulation(circ, shots=64, seed=9)
+        async_counts, _ = asyncio.run(manager.run_simulation_async(circ, shots=64, seed=9))
+        assert async_counts == counts
+        assert np.allclose(asyncio.run(manager.get_statevector_async(circ)), manager.get_statevector(circ))
+
+def test_async_requests_supersede_each_other():
+    manager = SimulationManager("numpy_statevector")
+
+    async def scenario():
+        first = asyncio.ensure_future(manager.get_statevector_async(QuantumCircuit(1), supersede="sv"))
+        await asyncio.sleep(0)  # let the first request start
+        second = asyncio.ensure_future(manager.get_statevector_async(QuantumCircuit(1).x(0), supersede="sv"))
+        result = await second
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return result
+
+    assert np.allclose(asyncio.run(scenario()), [0, 1])
+
+def _job_manager(service, store, **polling):
+    backend = HardwareBackend(service=service, session_factory=service.session_factory,
+                              sampler_factory=service.sampler_factory)
+    return HardwareJobManager(backend, store, **polling)
+
+def test_hardware_submit_returns_before_the_job_finishes(tmp_path):
+    service = FakeRuntimeService(queue_delay=1.0, seed=5)
+    manager = _job_manager(service, JobStore(str(tmp_path / "jobs.json")), poll_interval=0.02)
+    start = time.perf_counter()
+    handle = manager.submit([QiskitEngine.translate(QuantumCircuit(2).x(0).measure_all())], shots=16)
+    assert time.perf_counter() - start < 1.0
+    assert handle.status() == "QUEUED"
+    manager.stop()
+
+def test_hardware_jobs_resume_after_restart(tmp_path):
+    service = FakeRuntimeService(queue_delay=0.5, seed=5)
+    store_path = str(tmp_path / "jobs.json")
+    manager = _job_manager(service, JobStore(store_path), poll_interval=0.02, max_poll_interval=0.1)
+    handle = manager.submit([QiskitEngine.translate(QuantumCircuit(2).x(0).measure_all())], shots=16)
+
+    # The process "restarts" while the job is still queued
+    manager.stop()
+    resumed = _job_manager(service, JobStore(store_path), poll_interval=0.02, max_poll_interval=0.1)
+    assert resumed.handle(handle.job_id).result(timeout=5) == [{"01": 16}]
+    assert service.jobs_submitted == 1
+    assert JobStore(store_path).get(handle.job_id)["status"] == "DONE"
+    resumed.stop()
+
+def test_hardware_fetch_after_stop_asks_the_service(tmp_path):
+    service = FakeRuntimeService(queue_delay=0.2, seed=5)
+    manager = _job_manager(service, JobStore(str(tmp_path / "jobs.json")), poll_interval=5.0)
+    handle = manager.submit([QiskitEngine.translate(QuantumCircuit(1).x(0).measure_all())], shots=8)
+    manager.stop()
+    time.sleep(0.3)
+    results = []
+    fetcher = threading.Thread(target=lambda: results.append(handle.result()), daemon=True)
+    fetcher.start()
+    fetcher.join(5)
+    assert results == [[{"1": 8}]]
+
+def test_hardware_resume_retries_failed_lookups(tmp_path):
+    service = FakeRuntimeService(queue_delay=0.2, seed=5)
+    store = JobStore(str(tmp_path / "jobs.json"))
+    manager = _job_manager(service, store, poll_interval=5.0)
+    pending = manager.submit([QiskitEngine.translate(QuantumCircuit(1).x(0).measure_all())], shots=8).job_id
+    manager.stop()
+
+    def unavailable(job_id):
+        raise ConnectionError("service unavailable")
+
+    lookup, service.job = service.job, unavailable
+    resumed = _job_manager(service, store, poll_interval=0.02, max_poll_interval=0.05)
+    assert store.get(pending)["status"] == "QUEUED"
+    service.job = lookup
+    assert resumed.handle(pending).result(timeout=5) == [{"1": 8}]
+    resumed.stop()
+
+def test_job_store_moves_corrupt_file_aside(tmp_path):
+    path = tmp_path / "jobs.json"
+    path.write_text('{"job-1": {"status": "QUE')
+    store = JobStore(str(path))
+    assert store.all() == []
+    aside = list(tmp_path.glob("jobs.json.corrupt-*"))
+    assert len(aside) == 1 and aside[0].read_text() == '{"job-1": {"status": "QUE'
+
+    store.add("job-2", shots=8)
+    assert [record["job_id"] for record in JobStore(str(path)).all()] == ["job-2"]
+    assert aside[0].exists()
+
+def test_result_cache_serves_seeded_runs_across_sessions(tmp_path):
+    circ = ghz(3)
+    first = SimulationManager(result_cache=ResultCache(str(tmp_path)))
+    counts, _ = first.run_simulation(circ, shots=100, seed=11)
+    statevector = first.get_statevector(circ)
+
+    second = SimulationManager(result_cache=ResultCache(str(tmp_path)))
+    assert second.run_simulation(circ, shots=100, seed=11)[0] == counts
+    cached_statevector = second.get_statevector(circ)
+    assert type(cached_statevector) is type(statevector) is np.ndarray
+    assert np.allclose(cached_statevector, statevector)
+    stats = second.result_cache_stats()
+    assert (stats["hits"], stats["misses"]) == (2, 0) and stats["bytes_saved"] > 0
+
+def test_result_cache_misses_on_different_settings(tmp_path):
+    circ = ghz(3)
+    manager = SimulationManager(result_cache=ResultCache(str(tmp_path)))
+    counts, _ = manager.run_simulation(circ, shots=100, seed=11)
+    assert manager.run_simulation(circ, shots=50, seed=11)[0] != counts
+    assert manager.result_cache_stats()["hits"] == 0
+
+def test_result_cache_round_trips_large_keys_within_its_bound(tmp_path):
+    cache = ResultCache(str(tmp_path), max_bytes=120)
+    cache.put("wide", {"1" * 200: 3, "0" * 200: 5})
+    assert cache.get("wide") == {"1" * 200: 3, "0" * 200: 5}
+    cache.put("other", {"0" * 200: 1})
+    assert cache.get("wide") is None and cache.stats()["bytes"] <= 120
+
+def test_result_cache_skips_unseeded_runs_unless_opted_in(tmp_path):
+    circ = ghz(3)
+    manager = SimulationManager(result_cache=ResultCache(str(tmp_path / "default")))
+    manager.run_simulation(circ, shots=100)
+    manager.run_simulation(circ, shots=100)
+    assert manager.result_cache_stats()["hits"] == 0
+
+    # Opted-in unseeded runs replay the first sample
+    opted_in = SimulationManager(result_cache=ResultCache(str(tmp_path / "unseeded")), cache_unseeded=True)
+    sample, _ = opted_in.run_simulation(circ, shots=100)
+    assert opted_in.run_simulation(circ, shots=100)[0] == sample
+    assert opted_in.result_cache_stats()["hits"] == 1
+
+def test_seed_policy_replays_sessions():
+    circ = QuantumCircuit(3).ry(0, 1.1).ry(1, 0.7).cx(1, 2).t(2).measure_all()
+
+    def session(backend_type):
+        manager = SimulationManager(backend_type, resample_max_qubits=0, seed=42)
+        runs = [manager.run_simulation(circ, shots=256)[0] for _ in range(2)]
+        return runs + manager.run_batch([circ, circ], shots=256)
+
+    for backend_type in ("aer_simulator", "numpy_statevector"):
+        first = session(backend_type)
+        assert session(backend_type) == first
+        # Successive runs and batch members still get distinct seeds
+        assert first[0] != first[1] and first[2] != first[3]
+
+def test_seed_policy_is_independent_of_run_interleaving():
+    first = SeedPolicy(5)
+    seeds = [first.resolve(None, "a", 10), first.resolve(None, "b", 10), first.resolve(None, "a", 10)]
+    second = SeedPolicy(5)
+    b = second.resolve(None, "b", 10)
+    assert [second.resolve(None, "a", 10), b, second.resolve(None, "a", 10)] == seeds
+    assert len(set(seeds)) == 3
+    assert first.resolve(3, "a", 10) == 3 and SeedPolicy().resolve(None, "a", 10) is None
+
+def test_implicit_seeds_hit_the_result_cache_in_a_new_session(tmp_path):
+    circ = QuantumCircuit(2).h(0).ry(1, 0.4).measure_all()
+    first = SimulationManager(seed=42, result_cache=ResultCache(str(tmp_path)))
+    runs = [first.run_simulation(circ, shots=100)[0] for _ in range(2)]
+
+    second = SimulationManager(seed=42, result_cache=ResultCache(str(tmp_path)))
+    assert [second.run_simulation(circ, shots=100)[0] for _ in range(2)] == runs
+    assert second.result_cache_stats()["hits"] == 2
+
+def test_manager_optimizes_before_execution():
+    circ = QuantumCircuit(2).h(0).h(0).rx(1, 0.2).rx(1, 0.3).t(1).cx(0, 1)
+    expected = NumpyStatevectorBackend().statevector(circ)
+    for backend in ("numpy_statevector", "aer_simulator"):
+        manager = SimulationManager(backend, optimize=True)
+        assert np.allclose(manager.get_statevector(circ), expected)
+        assert (manager.last_optimization.gates_before, manager.last_optimization.gates_after) == (6, 2)
+
+def _stepped_view(steps=3):
+    controller = CircuitController()
+    circ = controller.create_ghz_state(4)
+    circ.ry(0, 0.3).measure_all()
+    controller.toggle_step_mode(True)
+    for _ in range(steps):
+        controller.step_forward()
+    return circ, controller.get_active_circuit()
+
+def _prefix_copy(circ, steps=3):
+    copy = QuantumCircuit(len(circ.qubits))
+    copy.gates = circ.gates[:steps]
+    return copy
+
+def test_step_views_share_gates_without_copying():
+    circ, view = _stepped_view()
+    assert isinstance(view, CircuitView) and len(view.gates) == 3 and view.measurements == []
+    assert view.gates[0] is circ.gates[0] and list(CircuitView(view, 1).gates) == circ.gates[1:3]
+
+def test_step_views_fingerprint_like_copies():
+    circ, view = _stepped_view()
+    assert view.fingerprint() == _prefix_copy(circ).fingerprint()
+    assert CircuitView(circ, 2, 5).fingerprint() == CircuitView(circ, 2, 5).to_circuit().fingerprint()
+    assert CircuitView(circ, measure=True).fingerprint() == circ.fingerprint()
+
+def test_step_views_translate_and_analyze_like_copies():
+    circ, view = _stepped_view()
+    copy = _prefix_copy(circ)
+    assert QiskitEngine.translate(view) == QiskitEngine.translate(copy)
+    assert CircuitAnalyzer.analyze(view).depth == copy.depth() == 3
+
+def test_step_views_simulate_like_copies():
+    circ, view = _stepped_view()
+    expected = NumpyStatevectorBackend().statevector(_prefix_copy(circ))
+    for backend in ("numpy_statevector", "aer_simulator"):
+        assert np.allclose(SimulationManager(backend).get_statevector(view), expected)
@@ -1,4 +1,7 @@
 import pytest
+import io
+import pickle
+import numpy as np
 import sys
 import os
 
@@ -6,7 +9,13 @@ import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from quantum_simulator.quantum_abstraction.circuit_builder import QuantumCircuit
-from quantum_simulator.quantum_abstraction.gates import HadamardGate, PauliXGate
+from quantum_simulator.quantum_abstraction.gates import HadamardGate, PauliXGate, CNOTGate, RYGate, RZGate, SwapGate, TGate
+from quantum_simulator.quantum_abstraction.qubit import Qubit
+from quantum_simulator.quantum_abstraction.circuit_analysis import CircuitAnalyzer
+from quantum_simulator.quantum_abstraction.compact_circuit import OPCODES, CompactCircuit
+from quantum_simulator.quantum_abstraction.optimizer import CircuitOptimizer
+from quantum_simulator.quantum_abstraction.serialization import read_binary, read_qasm3, write_binary, write_qasm3
+from quantum_simulator.execution.numpy_engine import NumpyStatevectorBackend
 from quantum_simulator.execution.qiskit_engine import QiskitEngine
 
 def test_circuit_initialization():
@@ -45,3 +54,317 @@ def test_bell_state_logic():
     assert circ.gates[1].name == "CNOT"
     assert circ.gates[1].control.index == 0
     assert circ.gates[1].target.index == 1
+
+def test_circuit_analysis_categories():
+    clifford = QuantumCircuit(3).h(0).cx(0, 1).cx(1, 2)
+    chain = QuantumCircuit(4).ry(0, 0.3).cx(0, 1).t(1).cx(1, 2).cx(2, 3)
+    long_range = QuantumCircuit(4).t(0).cx(0, 3)
+
+    assert CircuitAnalyzer.analyze(clifford).category == CircuitAnalyzer.CLIFFORD
+    profile = CircuitAnalyzer.analyze(chain)
+    assert profile.category == CircuitAnalyzer.LOW_ENTANGLEMENT
+    assert (profile.two_qubit_gates, profile.max_cut_gates) == (3, 1)
+    assert CircuitAnalyzer.analyze(long_range).category == CircuitAnalyzer.GENERAL
+    assert CircuitAnalyzer.analyze(chain, max_cut_gates=0).category == CircuitAnalyzer.GENERAL
+
+def _build_mixed(circ):
+    for i in range(200):
+        circ.h(i % 5).ry(i % 5, 0.01 * i).cx(i % 5, (i + 1) % 5).rz(2, "theta")
+    return circ.measure_all()
+
+def test_compact_circuit_matches_object_circuit():
+    regular, compact = _build_mixed(QuantumCircuit(5)), _build_mixed(CompactCircuit(5))
+    assert len(compact.gates) == len(regular.gates) == 800
+    assert [(g.name, [q.index for q in g.targets], getattr(g, "theta", None)) for g in compact.gates] == \
+           [(g.name, [q.index for q in g.targets], getattr(g, "theta", None)) for g in regular.gates]
+    assert [p.name for p in compact.parameters] == ["theta"]
+    assert [p.name for p in QiskitEngine.translate(compact).parameters] == ["theta"]
+    assert CompactCircuit.from_circuit(regular).fingerprint() == compact.fingerprint()
+
+def test_compact_circuit_binds_parameters_into_a_copy():
+    regular, compact = _build_mixed(QuantumCircuit(5)), _build_mixed(CompactCircuit(5))
+    bound = compact.bind_parameters({"theta": 0.5})
+    assert bound.parameters == [] and compact.parameters
+    assert QiskitEngine.translate(bound) == QiskitEngine.translate(regular.bind_parameters({"theta": 0.5}))
+    assert bound.fingerprint() != compact.fingerprint()
+
+def test_compact_circuit_views_are_read_only_and_small():
+    compact = _build_mixed(CompactCircuit(5))
+    with pytest.raises(AttributeError):
+        compact.gates.append(HadamardGate(compact.qubits[0]))
+    with pytest.raises(ValueError):
+        compact.opcodes[0] = 1
+    # The arrays are ~21 bytes per gate
+    assert compact.nbytes <= 1024 * 21
+
+def test_compact_circuit_rejects_invalid_operands():
+    compact = CompactCircuit(2).h(0)
+    for append in (lambda: compact.cx(1, 1), lambda: compact.swap(0, 0),
+                   lambda: compact.rx(0, float("nan")), lambda: compact.append_gate(RYGate(Qubit(0), None))):
+        with pytest.raises(ValueError):
+            append()
+    with pytest.raises(IndexError):
+        compact.cx(0, 2)
+    with pytest.raises(ValueError, match="arity"):
+        compact.append_columns([OPCODES[HadamardGate], OPCODES[CNOTGate]], [0, 1], [-1, 1])
+    assert len(compact.gates) == 1
+
+def test_fixed_gates_and_qubits_are_flyweights():
+    first, second = QuantumCircuit(3).h(0).cx(0, 2).ry(1, 0.5), QuantumCircuit(3).h(0).cx(0, 2).ry(1, 0.5)
+    assert first.qubits[1] is second.qubits[1] is Qubit(1)
+    assert first.gates[0] is second.gates[0] is HadamardGate(Qubit(0))
+    assert first.gates[1] is CNOTGate(Qubit(0), Qubit(2))
+    assert first.gates[2] is not second.gates[2]  # rotations carry their own angle
+    assert first.gates[1].targets is first.gates[1].targets == (Qubit(0), Qubit(2))
+    assert (first.gates[1].control.index, first.gates[1].target.index) == (0, 2)
+
+def test_gates_and_qubits_are_slotted_and_immutable():
+    circ = QuantumCircuit(3).h(0).cx(0, 2).ry(1, 0.5)
+    for obj in (Qubit(0), *circ.gates):
+        assert not hasattr(obj, "__dict__")
+    with pytest.raises(AttributeError):
+        Qubit(0).index = 1
+    with pytest.raises(AttributeError):
+        circ.gates[2].theta = 0.3
+
+def test_flyweights_survive_pickling():
+    circ = QuantumCircuit(3).h(0).cx(0, 2).ry(1, 0.5)
+    restored = pickle.loads(pickle.dumps(circ))
+    assert restored.qubits[0] is Qubit(0) and restored.gates[0] is circ.gates[0]
+    assert isinstance(restored.gates[2], RYGate) and restored.gates[2].theta == 0.5
+
+def _fingerprinted(theta):
+    return QuantumCircuit(3).h(0).cx(0, 1).ry(2, theta).measure_all()
+
+def test_fingerprints_are_structural():
+    assert _fingerprinted(0.3).fingerprint() == _fingerprinted(0.3).fingerprint()
+    assert _fingerprinted(0.3).fingerprint() != _fingerprinted(0.4).fingerprint()
+    assert _fingerprinted(0.3).fingerprint(parameter_agnostic=True) == \
+           _fingerprinted("theta").fingerprint(parameter_agnostic=True)
+    assert _fingerprinted(0.3).prefix_fingerprint(2) == _fingerprinted(0.4).prefix_fingerprint(2)
+    assert _fingerprinted(0.3).prefix_fingerprint(3) != _fingerprinted(0.4).prefix_fingerprint(3)
+
+def test_fingerprints_follow_appends_and_pops():
+    circ = _fingerprinted(0.3)
+    before = circ.fingerprint()
+    circ.gates.append(HadamardGate(circ.qubits[1]))
+    assert circ.fingerprint() != before and circ.prefix_fingerprint(3) == _fingerprinted(0.3).prefix_fingerprint(3)
+    circ.gates.pop()
+    assert circ.fingerprint() == before
+    circ.gates.pop()
+    circ.gates.append(RYGate(circ.qubits[2], 0.4))
+    assert circ.fingerprint() == _fingerprinted(0.4).fingerprint()
+
+def test_same_length_edits_in_place_rebuild_the_indexes():
+    circ = _fingerprinted(0.3)
+    before, gates, depth = circ.fingerprint(), circ.gates, circ.depth()
+    gates[2] = PauliXGate(circ.qubits[0])
+    assert circ.fingerprint() != before and circ.depth() == depth + 1
+    gates[2] = RYGate(circ.qubits[2], 0.3)
+    assert circ.fingerprint() == before and circ.depth() == depth
+
+def test_measurement_edits_change_the_fingerprint():
+    circ = _fingerprinted(0.3)
+    before = circ.fingerprint()
+    circ.measurements[1] = 2
+    assert circ.fingerprint() != before
+    circ.measurements = [0]
+    assert circ.fingerprint() != before
+
+def test_compact_circuits_share_the_fingerprint_scheme():
+    compact = CompactCircuit(3).h(0).cx(0, 1).ry(2, 0.3)
+    assert compact.prefix_fingerprint(2) == CompactCircuit(3).h(0).cx(0, 1).rz(1, "a").prefix_fingerprint(2)
+    assert compact.fingerprint(True) == CompactCircuit(3).h(0).cx(0, 1).ry(2, "b").fingerprint(True)
+
+def _optimizable():
+    circ = QuantumCircuit(3).h(0).x(1).x(1).h(0).cx(0, 1).cx(0, 1).swap(1, 2).swap(2, 1)
+    return circ.rz(2, 0.25).rz(2, 0.5).ry(0, 0.3).t(0).h(0).cx(0, 2).rx(1, "theta").rx(1, 0.1).measure_all()
+
+def test_optimizer_cancels_merges_and_fuses():
+    circ = _optimizable()
+    optimized, report = CircuitOptimizer.optimize(circ)
+    assert report.cancelled_pairs == 4 and report.merged_rotations == 1 and report.fused_runs == 1
+    assert (report.gates_before, report.gates_after) == (len(circ.gates), len(optimized.gates)) == (16, 5)
+    assert [g.name for g in optimized.gates] == ["RZ", "U", "CNOT", "RX", "RX"]
+    assert optimized.gates[0].theta == 0.75 and optimized.measurements == circ.measurements
+
+def test_optimizer_keeps_parameters_symbolic():
+    circ = _optimizable()
+    optimized, _ = CircuitOptimizer.optimize(circ)
+    engine = NumpyStatevectorBackend()
+    bound = {"theta": 0.7}
+    assert np.allclose(engine.statevector(optimized.bind_parameters(bound)), engine.statevector(circ.bind_parameters(bound)))
+
+def test_optimizer_never_fuses_clifford_circuits():
+    clifford, report = CircuitOptimizer.optimize(QuantumCircuit(1).h(0).s(0).x(0))
+    assert report.fused_runs == 0 and len(clifford.gates) == 3
+
+def test_optimizer_preserves_random_circuits():
+    rng = np.random.default_rng(21)
+    engine = NumpyStatevectorBackend()
+    fixed = ("h", "x", "y", "z", "s", "t")
+    for _ in range(60):
+        num_qubits = int(rng.integers(1, 5))
+        circ = QuantumCircuit(num_qubits)
+        for _ in range(int(rng.integers(1, 40))):
+            kind = rng.choice(fixed + ("rx", "ry", "rz", "cx", "swap", "repeat"))
+            if kind == "repeat" and circ.gates:
+                circ.gates.append(circ.gates[-1])  # invites cancellations and merges
+            elif kind in ("cx", "swap") and num_qubits > 1:
+                a, b = rng.choice(num_qubits, 2, replace=False)
+                getattr(circ, kind)(int(a), int(b))
+            elif kind in ("rx", "ry", "rz"):
+                getattr(circ, kind)(int(rng.integers(num_qubits)), float(rng.uniform(-np.pi, np.pi)))
+            elif kind in fixed:
+                getattr(circ, kind)(int(rng.integers(num_qubits)))
+        optimized, _ = CircuitOptimizer.optimize(circ)
+        fidelity = abs(np.vdot(engine.statevector(optimized), engine.statevector(circ))) ** 2
+        assert fidelity == pytest.approx(1.0, abs=1e-9), [g.name for g in circ.gates]
+
+def _layered():
+    return QuantumCircuit(4).h(0).h(1).cx(0, 1).x(3).cx(1, 2).t(0)
+
+def test_moment_index_tracks_layers_and_depth():
+    circ = _layered()
+    index = circ.moment_index
+    assert circ.depth() == 3 and CircuitAnalyzer.analyze(circ).depth == 3
+    assert [index.moment_of(i) for i in range(6)] == [0, 0, 1, 0, 2, 2]
+    assert [[g.name for g in layer] for layer in circ.layers()] == [["H", "H", "X"], ["CNOT"], ["CNOT", "T"]]
+    assert index.qubit_gate_counts() == [3, 3, 1, 1]
+    assert [index.last_moment(q) for q in range(4)] == [2, 2, 2, 0]
+
+def test_moment_index_extends_on_append_and_rebuilds_on_replace():
+    circ = _layered()
+    index = circ.moment_index
+    circ.swap(2, 3)
+    assert circ.depth() == 4 and circ.moment_index is index
+    circ.gates = circ.gates[:2]
+    assert circ.depth() == 1
+
+def test_compact_circuits_have_moment_indexes():
+    compact = CompactCircuit(4).h(0).h(1).cx(0, 1).x(3).cx(1, 2).t(0)
+    assert compact.depth() == 3 and compact.moment_index.moment_sizes() == [3, 1, 2]
+
+def _serializable():
+    circ = QuantumCircuit(3)
+    for i in range(50):
+        circ.h(i % 3).rx(i % 3, 0.1 * i).cx(i % 3, (i + 1) % 3).rz(1, "theta").swap(0, 2)
+    return circ.measure([2, 0])
+
+def _binary(circ) -> bytes:
+    data = io.BytesIO()
+    write_binary(circ, data)
+    return data.getvalue()
+
+def _forge_header(data: bytes, num_qubits: int = None, num_gates: int = None) -> bytes:
+    header = bytearray(data[:24])
+    if num_qubits is not None:
+        header[4:8] = num_qubits.to_bytes(4, "little")
+    if num_gates is not None:
+        header[8:16] = num_gates.to_bytes(8, "little")
+    return bytes(header) + data[24:]
+
+def test_qasm3_roundtrip():
+    circ = _serializable()
+    text = io.StringIO()
+    write_qasm3(circ, text)
+    assert text.getvalue().startswith("OPENQASM 3.0;")
+    text.seek(0)
+    assert read_qasm3(text).fingerprint() == circ.fingerprint()
+
+def test_binary_roundtrip():
+    circ = _serializable()
+    data = _binary(circ)
+    assert len(data) < 21 * len(circ.gates) + 64
+    compact = read_binary(io.BytesIO(data))
+    assert [p.name for p in compact.parameters] == ["theta"]
+    assert compact.to_circuit().fingerprint() == circ.fingerprint()
+
+def test_circuits_save_and_load_through_their_methods(tmp_path):
+    circ = _serializable()
+    for name in ("circuit.qasm", "circuit.qcb"):
+        path = str(tmp_path / name)
+        circ.save(path)
+        assert QuantumCircuit.load(path).fingerprint() == circ.fingerprint()
+        compact = CompactCircuit.load(path)
+        assert isinstance(compact, CompactCircuit)
+        assert compact.fingerprint() == CompactCircuit.from_circuit(circ).fingerprint()
+
+def test_qasm3_reader_accepts_hand_written_programs():
+    # Comments, split statements, pi expressions, arrow measurement
+    parsed = read_qasm3("""OPENQASM 3.0; include "stdgates.inc";
+        qubit[2] q; bit[1] c; /* a Bell pair */
+        h q[0]; cx q[0],
+           q[1];  // entangle
+        rz(-pi/2) q[1];
+        measure q[1] -> c[0];""", circuit_class=CompactCircuit)
+    assert [g.name for g in parsed.gates] == ["H", "CNOT", "RZ"] and parsed.measurements == [1]
+    assert parsed.gates[2].theta == pytest.approx(-np.pi / 2)
+
+@pytest.mark.parametrize("body", [
+    "u3(0, 0, 0) q[0];", "cx q[0];", "rx q[0];", "h(0.1) q[0];", "h q[5];", "rz(2**99999) q[0];",
+    "rz(1/0) q[0];", "swap q[1], q[1];", "c[3] = measure q[0];", "c[0] = measure q[0]; c[0] = measure q[1];",
+])
+def test_qasm3_reader_rejects_malformed_statements(body):
+    with pytest.raises(ValueError):
+        read_qasm3("OPENQASM 3.0; qubit[2] q; bit[1] c; " + body)
+
+@pytest.mark.parametrize("program", ["OPENQASM; qubit[1] q;", "OPENQASM 2.0; qubit[1] q;", "qubit[4000000000] q;"])
+def test_qasm3_reader_rejects_bad_headers(program):
+    with pytest.raises(ValueError):
+        read_qasm3(program)
+
+def test_qasm3_writer_rejects_unusable_parameter_names():
+    for name in ("2theta", "a b", "q", "pi", "theta;"):
+        with pytest.raises(ValueError, match="identifier"):
+            write_qasm3(QuantumCircuit(1).rx(0, name), io.StringIO())
+
+def test_binary_reader_rejects_forged_headers():
+    data = _binary(_serializable())
+    # Neither count is trusted for allocation
+    with pytest.raises(ValueError, match="exceed"):
+        read_binary(io.BytesIO(_forge_header(data, num_qubits=0xFFFFFFFF)))
+    with pytest.raises(ValueError, match="Truncated"):
+        read_binary(io.BytesIO(_forge_header(data, num_gates=1 << 40)))
+
+def test_gate_matrices_match_qiskit():
+    from qiskit.quantum_info import Operator
+    from qiskit.circuit.library import CXGate, RYGate as QiskitRYGate, SwapGate as QiskitSwapGate, TGate as QiskitTGate
+
+    q0, q1 = Qubit(0), Qubit(1)
+    assert np.allclose(TGate(q0).matrix, Operator(QiskitTGate()).data)
+    assert np.allclose(RYGate(q0, 0.7).matrix, Operator(QiskitRYGate(0.7)).data)
+    # Two-qubit matrices put the first target first (Qiskit's Operator is little-endian)
+    assert np.allclose(CNOTGate(q0, q1).matrix, Operator(CXGate()).reverse_qargs().data)
+    assert np.allclose(SwapGate(q0, q1).matrix, Operator(QiskitSwapGate()).data)
+
+def test_gate_matrices_are_shared_and_read_only():
+    q0, q1 = Qubit(0), Qubit(1)
+    assert HadamardGate(q0).matrix is HadamardGate(q1).matrix
+    assert RZGate(q0, 0.3).matrix is RZGate(q1, 0.3).matrix
+    with pytest.raises(ValueError):
+        PauliXGate(q0).matrix[0, 0] = 1
+    with pytest.raises(ValueError):
+        RZGate(q0, "theta").matrix
+
+def test_rotation_matrices_are_batched_by_axis():
+    thetas = np.linspace(0, np.pi, 5)
+    batch = RYGate.matrices(thetas)
+    assert batch.shape == (5, 2, 2)
+    assert all(np.allclose(batch[i], RYGate(Qubit(0), theta).matrix) for i, theta in enumerate(thetas))
+    assert RZGate.AXIS == RZGate(Qubit(0), 0.1).name == "RZ"
+
+def test_custom_gates_without_a_matrix_are_left_alone():
+    from quantum_simulator.quantum_abstraction.gates import SingleQubitGate
+
+    class SqrtXGate(SingleQubitGate):
+        name = "SX"
+
+    circ = QuantumCircuit(1).t(0).h(0)
+    circ.gates.append(SqrtXGate(Qubit(0)))
+    circ.h(0).t(0)
+    assert circ.gates[2].matrix is None
+    optimized, _ = CircuitOptimizer.optimize(circ)
+    assert [g.name for g in optimized.gates] == ["U", "SX", "U"]
+    with pytest.raises(ValueError, match="no matrix"):
+        NumpyStatevectorBackend().statevector(circ)
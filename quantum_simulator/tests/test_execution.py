@@ -0,0 +1,263 @@
+import pytest
+import sys
+import os
+import threading
+import subprocess
+import numpy as np
+from qiskit.quantum_info import Statevector
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from quantum_simulator.quantum_abstraction.circuit_builder import QuantumCircuit
+from quantum_simulator.execution.qiskit_engine import QiskitEngine
+from quantum_simulator.execution.simulator_backend import SimulatorBackend
+from quantum_simulator.execution.backend_registry import BackendRegistry
+from quantum_simulator.execution.numpy_engine import NumpyStatevectorBackend
+from quantum_simulator.execution.sampling import measurement_distribution, sample_counts
+from quantum_simulator.execution.transpile_cache import TranspileCache, circuit_fingerprint
+from quantum_simulator.execution.hardware_backend import HardwareBackend
+from quantum_simulator.tests.fake_runtime import FakeRuntimeService, FakeSampler
+
+def _bell(measure=True):
+    circ = QuantumCircuit(2)
+    circ.h(0)
+    circ.cx(0, 1)
+    if measure:
+        circ.measure_all()
+    return circ
+
+def test_fingerprint_is_structural():
+    a = QiskitEngine.translate(_bell())
+    b = QiskitEngine.translate(_bell())
+    c = QiskitEngine.translate(QuantumCircuit(2).h(1).cx(1, 0).measure_all())
+    assert a is not b
+    assert circuit_fingerprint(a) == circuit_fingerprint(b)
+    assert circuit_fingerprint(a) != circuit_fingerprint(c)
+
+def test_transpile_cache_hits_on_rerun():
+    backend = SimulatorBackend(transpile_cache=TranspileCache(maxsize=4))
+    counts = backend.run(QiskitEngine.translate(_bell()), shots=64)
+    backend.run(QiskitEngine.translate(_bell()), shots=64)
+    stats = backend.cache_stats()
+    assert sum(counts.values()) == 64
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
+
+def test_transpile_cache_is_bounded():
+    cache = TranspileCache(maxsize=2)
+    backend = SimulatorBackend(transpile_cache=cache)
+    for theta in (0.1, 0.2, 0.3):
+        cache.transpile(QiskitEngine.translate(QuantumCircuit(1).rx(0, theta)), backend.backend)
+    assert cache.stats()["size"] == 2
+    assert cache.stats()["misses"] == 3
+
+def test_backend_registry_shares_instances():
+    registry = BackendRegistry()
+    a = registry.get("aer_simulator", max_parallel_threads=1)
+    b = registry.get("aer_simulator", max_parallel_threads=1)
+    c = registry.get("aer_simulator")
+    assert a is b
+    assert a is not c
+    assert a.options.max_parallel_threads == 1
+
+def _readout_noise(p0given1: float):
+    from qiskit_aer.noise import NoiseModel, ReadoutError
+    noise = NoiseModel()
+    noise.add_all_qubit_readout_error(ReadoutError([[1, 0], [p0given1, 1 - p0given1]]))
+    return noise
+
+def test_backend_registry_keys_unhashable_options_by_content():
+    registry = BackendRegistry()
+    assert registry.get("aer_simulator", noise_model=_readout_noise(0.1)) is \
+           registry.get("aer_simulator", noise_model=_readout_noise(0.1))
+    assert registry.get("aer_simulator", noise_model=_readout_noise(0.2)) is not \
+           registry.get("aer_simulator", noise_model=_readout_noise(0.1))
+    assert registry.get("aer_simulator", basis_gates=["cx", "u"]) is registry.get("aer_simulator", basis_gates=["cx", "u"])
+
+def test_simulator_backends_share_registry_backends():
+    first = SimulatorBackend()
+    second = SimulatorBackend()
+    assert first.backend is second.backend
+    assert first.statevector_backend is second.statevector_backend
+
+def test_backend_registry_is_thread_safe():
+    registry = BackendRegistry()
+    seen = []
+    threads = [threading.Thread(target=lambda: seen.append(registry.get("statevector_simulator"))) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(registry) == 1
+    assert all(backend is seen[0] for backend in seen)
+
+def _all_gates_circuit():
+    circ = QuantumCircuit(3)
+    circ.h(0).x(1).y(2).z(0).s(1).t(2)
+    circ.rx(0, 0.3).ry(1, 1.1).rz(2, -0.7)
+    circ.cx(0, 2).swap(1, 2).cx(2, 1)
+    return circ
+
+def test_numpy_engine_matches_qiskit_statevector():
+    circ = _all_gates_circuit()
+    expected = Statevector.from_instruction(QiskitEngine.translate(circ)).data
+    actual = NumpyStatevectorBackend().run_statevector(circ)
+    assert np.allclose(actual, expected)
+
+def test_numpy_engine_counts_use_qiskit_bit_order():
+    circ = QuantumCircuit(3).x(0).measure_all()
+    assert NumpyStatevectorBackend().run(circ, shots=10) == {"001": 10}
+
+    partial = QuantumCircuit(3).x(2).measure([2, 0])
+    assert NumpyStatevectorBackend().run(partial, shots=10) == {"01": 10}
+
+    # Gates on a single-qubit state must update it in place too
+    assert NumpyStatevectorBackend().run(QuantumCircuit(1).x(0).measure_all(), shots=10) == {"1": 10}
+
+def test_native_backend_runs_without_qiskit():
+    script = (
+        "import sys\n"
+        "from quantum_simulator.application.simulation_manager import SimulationManager\n"
+        "from quantum_simulator.quantum_abstraction.circuit_builder import QuantumCircuit\n"
+        "counts, _ = SimulationManager('numpy_statevector').run_simulation(QuantumCircuit(2).h(0).cx(0, 1).measure_all(), 100)\n"
+        "assert set(counts) <= {'00', '11'}\n"
+        "assert 'qiskit' not in sys.modules\n"
+    )
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+    result = subprocess.run([sys.executable, "-c", script], cwd=root, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+def test_measurement_distribution_marginalizes_in_qiskit_order():
+    # |q2 q1 q0> = |1 0 1> with certainty, measure q2 into clbit 0 and q1 into clbit 1
+    state = NumpyStatevectorBackend().statevector(QuantumCircuit(3).x(0).x(2))
+    distribution = measurement_distribution(state, [2, 1])
+    assert np.allclose(distribution, [0, 1, 0, 0])
+    assert sample_counts(distribution, 2, 50, seed=1) == {"01": 50}
+
+def test_aer_statevector_keeps_trailing_swap():
+    circ = QuantumCircuit(2).x(0).swap(0, 1)
+    statevector = SimulatorBackend().run_statevector(QiskitEngine.translate(circ))
+    assert type(statevector) is np.ndarray and statevector.dtype == np.complex128
+    assert np.allclose(statevector, [0, 0, 1, 0])
+
+def test_single_precision_statevectors():
+    circ = _all_gates_circuit()
+    expected = Statevector.from_instruction(QiskitEngine.translate(circ)).data
+
+    native = NumpyStatevectorBackend(precision="single").run_statevector(circ)
+    assert native.dtype == np.complex64
+    assert np.allclose(native, expected, atol=1e-6)
+
+    aer = SimulatorBackend().run_statevector(QiskitEngine.translate(circ), precision="single")
+    assert aer.dtype == np.complex64
+    assert np.allclose(aer, expected, atol=1e-6)
+
+    counts = NumpyStatevectorBackend(precision="single").run(circ.measure_all(), shots=100, seed=1)
+    assert sum(counts.values()) == 100
+
+def _hardware(service, sampler_factory=None):
+    return HardwareBackend(service=service, session_factory=service.session_factory,
+                           sampler_factory=sampler_factory or service.sampler_factory)
+
+def test_hardware_backend_reuses_session_for_multi_pub_jobs():
+    service = FakeRuntimeService(queue_delay=0.05, session_delay=0.05, seed=7)
+    hardware = _hardware(service)
+    circuits = [QiskitEngine.translate(_bell()), QiskitEngine.translate(QuantumCircuit(2).x(1).measure_all())]
+
+    bell_counts, x_counts = hardware.run_batch(circuits, shots=64)
+    assert set(bell_counts) <= {"00", "11"} and sum(bell_counts.values()) == 64
+    assert x_counts == {"10": 64}
+    assert hardware.run(circuits[1], shots=8) == {"10": 8}
+    assert (service.jobs_submitted, hardware.sessions.sessions_opened) == (2, 1)
+
+def test_hardware_backend_replaces_expired_session():
+    service = FakeRuntimeService(seed=7)
+    hardware = _hardware(service)
+    circuit = QiskitEngine.translate(QuantumCircuit(2).x(1).measure_all())
+    assert hardware.run(circuit, shots=8) == {"10": 8}
+
+    hardware.sessions.sampler().session.close()
+    assert hardware.run(circuit, shots=8) == {"10": 8}
+    assert hardware.sessions.sessions_opened == 2
+
+def _flaky_sampler(expire: bool):
+    failures = []
+
+    class FlakySampler(FakeSampler):
+        def run(self, pubs, shots=1024):
+            if not failures:
+                failures.append(1)
+                if expire:
+                    self.session.close()  # rejected by an expired session
+                else:
+                    super().run(pubs, shots)  # reached the server, response lost
+                raise ConnectionError("submission failed")
+            return super().run(pubs, shots)
+
+    return FlakySampler
+
+def test_hardware_backend_resubmits_after_session_expiry():
+    service = FakeRuntimeService(seed=7)
+    hardware = _hardware(service, _flaky_sampler(expire=True))
+    assert hardware.run(QiskitEngine.translate(QuantumCircuit(1).x(0).measure_all()), shots=8) == {"1": 8}
+    assert hardware.sessions.sessions_opened == 2
+    assert service.jobs_submitted == 1
+
+def test_hardware_backend_does_not_resubmit_to_live_session():
+    service = FakeRuntimeService(seed=7)
+    hardware = _hardware(service, _flaky_sampler(expire=False))
+    with pytest.raises(ConnectionError):
+        hardware.run(QiskitEngine.translate(QuantumCircuit(1).x(0).measure_all()), shots=8)
+    # The lost submission reached the server once and was not repeated
+    assert service.jobs_submitted == 1
+
+@pytest.fixture
+def isolated_translators(monkeypatch):
+    # register() and the subclass fallback write to the module-level table
+    from quantum_simulator.execution import qiskit_engine
+    monkeypatch.setattr(qiskit_engine, "_TRANSLATORS", dict(qiskit_engine._TRANSLATORS))
+
+def _sqrt_x_gate_class():
+    from quantum_simulator.quantum_abstraction.gates import SingleQubitGate
+
+    class SqrtXGate(SingleQubitGate):
+        name = "SX"
+
+    return SqrtXGate
+
+def test_translator_rejects_unregistered_gates(isolated_translators):
+    from quantum_simulator.quantum_abstraction.qubit import Qubit
+    circ = QuantumCircuit(1)
+    circ.gates.append(_sqrt_x_gate_class()(Qubit(0)))
+    with pytest.raises(ValueError, match="SqrtXGate"):
+        QiskitEngine.translate(circ)
+
+def test_translator_uses_registered_gates(isolated_translators):
+    from qiskit.circuit.library import SXGate
+    from quantum_simulator.quantum_abstraction.qubit import Qubit
+    sqrt_x = _sqrt_x_gate_class()
+    QiskitEngine.register(sqrt_x, lambda gate, angle: SXGate())
+    circ = QuantumCircuit(2)
+    circ.gates.append(sqrt_x(Qubit(1)))
+    translated = QiskitEngine.translate(circ.measure_all())
+    assert [inst.operation.name for inst in translated.data] == ["sx", "measure", "measure"]
+    assert QiskitEngine.translate_to_qiskit(circ) == translated
+
+def test_translator_falls_back_to_the_base_class(isolated_translators):
+    from quantum_simulator.quantum_abstraction.gates import PauliXGate
+    from quantum_simulator.quantum_abstraction.qubit import Qubit
+
+    class LoudXGate(PauliXGate):
+        pass
+
+    circ = QuantumCircuit(1)
+    circ.gates.append(LoudXGate(Qubit(0)))
+    assert [inst.operation.name for inst in QiskitEngine.translate(circ).data] == ["x"]
+
+def test_repeated_operands_are_rejected_before_translation():
+    from quantum_simulator.quantum_abstraction import gates
+    for build in (lambda: QuantumCircuit(2).cx(0, 0), lambda: QuantumCircuit(2).swap(1, 1)):
+        with pytest.raises(ValueError, match="distinct qubits"):
+            build()
+    assert not any(len(set(key[1])) != len(key[1]) for key in gates._FLYWEIGHTS)